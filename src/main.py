@@ -1,89 +1,112 @@
-'''
-# System --> Windows & Python3.10.0
-# File ----> main.py
-# Author --> Illusionna
-# Create --> 2024/11/29 00:37:59
-'''
-# -*- Encoding: UTF-8 -*-
-
-
-import os
-import uvicorn
-from fastapi import FastAPI, Request
-from utils.tools.read import read_json
-from utils.tools.log_colour import create_logging
-from utils.tools.inherit import Function, Help, Docs, Power, Recall, Start, Stop
-
-from utils.functions.default.echo import Echo
-from utils.functions.default.device import System
-from utils.functions.default.privilege import Privilege
-from utils.functions.default.information import Info
-from utils.functions.default.like import SendLike
-from utils.functions.custom.stochastic.stochastic import GenerateFloatNumber, Sample
-from utils.functions.custom.recreation.avatar import Chop, 丢, 爬, 咬, 弹, 逃, 打, 吸, 踢, 推, 贴, 吞, 踩, 猫, 慕, 喊, 吃, 找
-from utils.functions.custom.gpt import GPT
-
-
-f = Function()
-app = FastAPI()
-log = create_logging(log_path=os.path.join('cache', '日志.log'))
-service = read_json(os.path.join('configs', 'init.json'))
-# -------------------------------------------------------------------------------------
-f.add(Help); f.add(Docs); f.add(Power); f.add(Recall); f.add(Start); f.add(Stop)
-# -------------------------------------------------------------------------------------
-f.add(Echo)
-f.add(System)
-f.add(Privilege)
-f.add(Info)
-f.add(SendLike)
-f.add(Sample)
-f.add(Chop)
-f.add(丢)
-f.add(爬)
-f.add(咬)
-f.add(弹)
-f.add(逃)
-f.add(打)
-f.add(吸)
-f.add(踢)
-f.add(推)
-f.add(贴)
-f.add(吞)
-f.add(踩)
-f.add(猫)
-f.add(慕)
-f.add(喊)
-f.add(吃)
-f.add(找)
-f.add(GPT)
-f.add(GenerateFloatNumber)
-
-
-@app.post('/')
-async def Main(request: Request) -> str:
-    params = {
-        'data': await request.json(),
-        'config': {
-            'log': log,
-            'socket': service['http_service_listening_socke']
-        },
-        'functions': {
-            'invoke': f.invoke,
-            'permission': f.permission,
-            'description': f.description
-        }
-    }
-    f.load(params)
-    f.execute()
-    return 'OK'
-
-
-
-if __name__ == '__main__':
-    print('\n从 QQ 艾特你的机器人开启之旅！\n')
-    uvicorn.run(
-        app = f"{os.path.basename(__file__).split('.')[0]}:app",
-        host = service['http_app_host'],
-        port = service['http_app_port'],
-        reload = False
+'''
+# System --> Windows & Python3.10.0
+# File ----> main.py
+# Author --> Illusionna
+# Create --> 2024/11/29 00:37:59
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import asyncio
+import threading
+import uvicorn
+from fastapi import FastAPI, Request
+from utils.tools.read import read_json
+from utils.tools.log_colour import create_logging
+from utils.tools.executor import Executor
+from utils.tools.limit import Limiter
+from utils.tools.cache import cache_manager
+from utils.tools.state import shared_state
+from utils.tools.codec import Prefilter, loads
+from utils.tools.send import Reply
+from utils.tools.inherit import Function, Help, Docs, Power, Recall, Start, Stop, Reload
+from utils.tools.plugin import Registry
+
+
+f = Function()
+app = FastAPI()
+service = read_json(os.path.join('configs', 'init.json'))
+log = create_logging(
+    log_path = os.path.join('cache', '日志.log'),
+    max_bytes = int(service.get('log_max_mb', 10) * (1 << 20)),
+    backups = service.get('log_backups', 3)
+)
+executor = Executor(lanes=service.get('lanes'))
+limiter = Limiter(
+    user = service.get('rate_limit', {}).get('user'),
+    group = service.get('rate_limit', {}).get('group'),
+    sweep = service.get('rate_limit', {}).get('sweep', 60)
+)
+prefilter = Prefilter(service['bot_qq_account_uid'])
+# -------------------------------------------------------------------------------------
+f.add(Help); f.add(Docs); f.add(Power); f.add(Recall); f.add(Start); f.add(Stop); f.add(Reload)
+# -------------------------------------------------------------------------------------
+# 插件只读取清单，功能模块第一次调用时才导入。
+plugins = Registry(f, os.path.join('utils', 'functions'))
+plugins.discover()
+
+
+@app.post('/')
+async def Main(request: Request) -> dict | str:
+    body = await request.body()
+    # 不是在调用机器人的事件，无需解码直接应答。
+    if not prefilter.accept(body):
+        return 'OK'
+    params = {
+        'data': loads(body),
+        'config': {
+            'log': log,
+            'socket': service['http_service_listening_socke']
+        },
+        'functions': {
+            **f.functions(),
+            'plugins': plugins
+        }
+    }
+    # 具体功能交给执行器在后台运行，第一条消息在限时内产生则随上报应答直接回复。
+    with Reply(params['data']) as reply:
+        future = f.execute(f.load(params), executor, limiter)
+    if future is not None:
+        task = asyncio.wrap_future(future)
+        task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        # 注意 asyncio.wait 超时不会取消任务。
+        await asyncio.wait([task], timeout=service.get('quick_reply_timeout', 1.0))
+    text = reply.close()
+    return reply.operation(text) if text else 'OK'
+
+
+@app.on_event('startup')
+def Startup() -> None:
+    cache_manager().start(log)
+    # 预先导入常用的功能，不阻塞启动。
+    warmup = service.get('plugin_warmup', [])
+    if warmup:
+        threading.Thread(target=plugins.warm, args=(warmup,), name='iQQbot-warmup', daemon=True).start()
+    # 监视插件源码，改动后不重启地重新加载。
+    if service.get('plugin_watch', 0) > 0:
+        plugins.watch(service['plugin_watch'], log)
+
+
+@app.on_event('shutdown')
+def Shutdown() -> None:
+    cache_manager().stop()
+    plugins.stop()
+    executor.shutdown()
+    shared_state().close()
+
+
+
+if __name__ == '__main__':
+    print('\n从 QQ 艾特你的机器人开启之旅！\n')
+    # 多个工作进程各有一份启停状态和特权，须使用共享状态；限流、缓存、渲染服务仍按进程各自独立。
+    workers = service.get('http_app_workers', 1)
+    if (workers > 1) and (service.get('shared_state', {}).get('backend', 'memory') == 'memory'):
+        print('\033[31m[x] 多个工作进程须在 init.json 中设置 "shared_state": {"backend": "sqlite"}, 否则 /stop、/power 只在一个进程中生效\033[0m')
+    uvicorn.run(
+        app = f"{os.path.basename(__file__).split('.')[0]}:app",
+        host = service['http_app_host'],
+        port = service['http_app_port'],
+        workers = workers,
+        reload = False
     )
\ No newline at end of file
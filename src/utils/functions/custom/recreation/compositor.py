@@ -0,0 +1,240 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> compositor.py
+# Author --> Illusionna
+# Create --> 2024/12/19 20:41:37
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import math
+import threading
+from PIL import Image
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ArrayCompositor:
+    """普通类：基于 NumPy 的帧计划合成器，与 `"Plan.compose()"` 输出相同的帧。
+
+    .. Contents::
+        - 每个帧计划的模板帧只解码一次，叠成一个 `uint8` 数组 `(帧数, 高, 宽, 通道)` 缓存起来；底色与模板预先合成好，每次只重新合成头像所在的区域。
+        - 头像的旋转预先计算为最近邻采样网格（与 Pillow 的 `rotate()` 取样方式相同），缩放仍由 Pillow 完成，每种变换每次绘制只计算一次。
+        - 位置相同的头像一次混合进所有帧，混合的舍入方式与 Pillow 的 `paste()` 相同，结果逐像素一致。
+        - 没有安装 NumPy、随机取模板的帧计划，`"ArrayCompositor.supports()"` 返回假；模板大小或模式不一致时 `"ArrayCompositor.compose()"` 自动退回 Pillow。
+
+    .. Usage::
+    >>> compositor = ArrayCompositor()
+    >>> if compositor.supports(plan):
+            frames = compositor.compose(plan, avatar, templates)
+    """
+
+    def __init__(self) -> None:
+        """构造函数：创建合成器。"""
+        # id(帧计划) -> (帧计划, 底图, 盖在头像上的模板, 模板的透明通道, 预先合成的结果)
+        self.__stacks: dict = dict()
+        # (大小, 角度, 扩展) -> 采样网格
+        self.__grids: dict = dict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        """静态函数：是否安装了 NumPy。
+
+        Returns:
+            bool: 安装了则返回真。
+        """
+        return numpy is not None
+
+    def supports(self, plan: 'Plan') -> bool:
+        """公有成员函数：判断帧计划能否使用数组合成。
+
+        Args:
+            plan (Plan): 帧计划。
+
+        Returns:
+            bool: 能则返回真。
+        """
+        return (numpy is not None) and (not plan.random) and plan.ready
+
+    def compose(self, plan: 'Plan', avatar: Image.Image, templates: 'TemplateCache') -> list:
+        """公有成员函数：按帧计划合成各帧。
+
+        Args:
+            plan (Plan): 帧计划。
+            avatar (Image.Image): 已经按 `"Plan.size"` 缩放（及裁剪）的 RGBA 头像。
+            templates (TemplateCache): 模板帧缓存，只在第一次合成时读取。
+
+        Returns:
+            list: 返回帧列表。
+        """
+        base, front, mask, composed = self.__stack(plan, templates)
+        if base is None:
+            return plan.compose(avatar, templates)
+        stack = base.copy()
+        channels = stack.shape[3]
+        height, width = stack.shape[1:3]
+
+        sources = [numpy.asarray(avatar if size is None else avatar.resize(size)) for size, _, _ in plan.transforms]
+        pieces = [ArrayCompositor.__sample(source, self.__grid(source.shape[1::-1], angle, expand)) for source, (_, angle, expand) in zip(sources, plan.transforms)]
+
+        # 同一槽位、同一变换、同一位置的头像一次混合进所有帧；按槽位的顺序混合，同一帧内先贴的先混合。
+        groups: dict = dict()
+        for index, placements in enumerate(plan.frames):
+            for slot, (transform, position) in enumerate(placements):
+                groups.setdefault((slot, transform, position), list()).append(index)
+        dirty = list()
+        for (_, transform, (left, top)), frames in sorted(groups.items(), key=lambda item: item[0][0]):
+            piece = pieces[transform]
+            h, w = piece.shape[:2]
+            x0, y0 = max(left, 0), max(top, 0)
+            x1, y1 = min(left + w, width), min(top + h, height)
+            if (x0 >= x1) or (y0 >= y1):
+                continue
+            piece = piece[y0 - top:y1 - top, x0 - left:x1 - left]
+            region = stack[frames, y0:y1, x0:x1]
+            stack[frames, y0:y1, x0:x1] = ArrayCompositor.__blend(region, piece[..., :channels], piece[..., 3:4])
+            dirty.append((frames, slice(y0, y1), slice(x0, x1)))
+
+        # 模板盖在头像上时，头像以外的区域直接使用预先合成好的结果。
+        if front is not None:
+            result = composed.copy()
+            for frames, rows, columns in dirty:
+                result[frames, rows, columns] = ArrayCompositor.__blend(stack[frames, rows, columns], front[frames, rows, columns], mask[frames, rows, columns])
+            stack = result
+        mode = 'RGBA' if channels == 4 else 'RGB'
+        return [Image.fromarray(frame, mode) for frame in stack]
+
+    def clear(self) -> None:
+        """公有成员函数：清空缓存的模板数组。"""
+        with self.__lock:
+            self.__stacks.clear()
+
+    def __stack(self, plan: 'Plan', templates: 'TemplateCache') -> tuple:
+        """私有成员函数：取出（第一次时生成）帧计划的模板数组。
+
+        Args:
+            plan (Plan): 帧计划。
+            templates (TemplateCache): 模板帧缓存。
+
+        Returns:
+            tuple: 返回 `(底图, 盖在头像上的模板, 模板的透明通道, 底图与模板预先合成的结果)`，模板大小不一致时底图为空。
+        """
+        entry = self.__stacks.get(id(plan))
+        if (entry is not None) and (entry[0] is plan):
+            return entry[1:]
+        images = [templates.get(path, plan.resize) for path in plan.templates]
+        base = front = mask = composed = None
+        # 模板的大小或者模式不一致时（RGB 帧没有透明通道可混合），退回 Pillow。
+        if (len({image.size for image in images}) != 1) or (len({image.mode for image in images}) != 1):
+            pass
+        elif plan.background is None:
+            base = numpy.stack([numpy.asarray(image) for image in images])
+        else:
+            width, height = plan.canvas or images[0].size
+            base = numpy.empty((len(images), height, width, 4), dtype=numpy.uint8)
+            base[...] = (*plan.background, 255)[:4]
+            layer = numpy.stack([numpy.asarray(image.convert('RGBA')) for image in images])
+            h, w = min(height, layer.shape[1]), min(width, layer.shape[2])
+            alpha = ArrayCompositor.__alpha(images, layer)
+            if plan.layer == 'over':
+                base[:, :h, :w] = ArrayCompositor.__blend(base[:, :h, :w], layer[:, :h, :w], alpha[:, :h, :w])
+            else:
+                front = numpy.zeros_like(base)
+                front[:, :h, :w] = layer[:, :h, :w]
+                mask = numpy.zeros(base.shape[:3] + (1,), dtype=numpy.uint8)
+                mask[:, :h, :w] = alpha[:, :h, :w]
+                composed = ArrayCompositor.__blend(base, front, mask)
+        with self.__lock:
+            self.__stacks[id(plan)] = (plan, base, front, mask, composed)
+        return base, front, mask, composed
+
+    def __grid(self, size: tuple, angle: float, expand: bool) -> 'numpy.ndarray | None':
+        """私有成员函数：取出（第一次时生成）旋转的最近邻采样网格，算法与 Pillow 的 `rotate()` 相同。
+
+        Args:
+            size (tuple): 旋转前的大小 `(宽, 高)`。
+            angle (float): 逆时针旋转的角度。
+            expand (bool): 是否扩大画布以容纳旋转后的图片。
+
+        Returns:
+            numpy.ndarray | None: 返回旋转后每个像素在原图中的一维下标，不旋转时返回空。
+        """
+        angle = angle % 360
+        if not angle:
+            return None
+        key = (size, angle, expand)
+        grid = self.__grids.get(key)
+        if grid is not None:
+            return grid
+        w, h = size
+        if (angle == 180) or ((angle in (90, 270)) and (expand or w == h)):
+            # Pillow 对这几个角度直接转置，不经过仿射变换。
+            y, x = numpy.mgrid[0:h, 0:w] if angle == 180 else numpy.mgrid[0:w, 0:h]
+            if angle == 180:
+                yin, xin = h - 1 - y, w - 1 - x
+            elif angle == 90:
+                yin, xin = x, w - 1 - y
+            else:
+                yin, xin = h - 1 - x, y
+        else:
+            radians = -math.radians(angle)
+            a, b = round(math.cos(radians), 15), round(math.sin(radians), 15)
+            d, e = round(-math.sin(radians), 15), round(math.cos(radians), 15)
+            cx, cy = w / 2, h / 2
+            c = a * -cx + b * -cy + cx
+            f = d * -cx + e * -cy + cy
+            if expand:
+                xs, ys = list(), list()
+                for x, y in ((0, 0), (w, 0), (w, h), (0, h)):
+                    xs.append(a * x + b * y + c)
+                    ys.append(d * x + e * y + f)
+                nw = math.ceil(max(xs)) - math.floor(min(xs))
+                nh = math.ceil(max(ys)) - math.floor(min(ys))
+                c, f = a * -(nw - w) / 2 + b * -(nh - h) / 2 + c, d * -(nw - w) / 2 + e * -(nh - h) / 2 + f
+            # 与 Pillow 相同，以像素中心取样，16.16 定点数运算。
+            fixed = lambda v: math.floor(v * 65536.0 + 0.5)
+            y, x = numpy.mgrid[0:nh, 0:nw] if expand else numpy.mgrid[0:h, 0:w]
+            xin = (fixed(c + a * 0.5 + b * 0.5) + x * fixed(a) + y * fixed(b)) >> 16
+            yin = (fixed(f + d * 0.5 + e * 0.5) + x * fixed(d) + y * fixed(e)) >> 16
+        # 展平为一维下标，越界的像素指向末尾追加的透明像素。
+        inside = (xin >= 0) & (xin < w) & (yin >= 0) & (yin < h)
+        grid = numpy.where(inside, yin * w + xin, w * h).astype(numpy.intp)
+        with self.__lock:
+            self.__grids[key] = grid
+        return grid
+
+    @staticmethod
+    def __sample(source: 'numpy.ndarray', grid: 'numpy.ndarray | None') -> 'numpy.ndarray':
+        """静态私有函数：按采样网格取像素，每个 RGBA 像素作为一个 uint32 整体读取，越界处为透明。"""
+        if grid is None:
+            return source
+        pixels = numpy.append(numpy.ascontiguousarray(source).view(numpy.uint32).reshape(-1), numpy.uint32(0))
+        return pixels[grid].view(numpy.uint8).reshape(grid.shape + (4,))
+
+    @staticmethod
+    def __alpha(images: list, layer: 'numpy.ndarray') -> 'numpy.ndarray':
+        """静态私有函数：取模板的透明通道，没有透明通道的模板整张覆盖。"""
+        if all('A' in image.getbands() for image in images):
+            return layer[..., 3:4]
+        return numpy.full(layer.shape[:3] + (1,), 255, dtype=numpy.uint8)
+
+    @staticmethod
+    def __blend(target: 'numpy.ndarray', source: 'numpy.ndarray', mask: 'numpy.ndarray') -> 'numpy.ndarray':
+        """静态私有函数：按透明通道混合，舍入方式与 Pillow 的 `paste()` 相同。
+
+        Args:
+            target (numpy.ndarray): 底图。
+            source (numpy.ndarray): 盖在上面的图片，所有通道（包括透明通道）一起混合。
+            mask (numpy.ndarray): 透明通道，最后一维为 1。
+
+        Returns:
+            numpy.ndarray: 返回混合结果。
+        """
+        # 最大值 255 * 255 + 128 + 254，uint16 不会溢出。
+        mask = mask.astype(numpy.uint16)
+        value = target.astype(numpy.uint16) * (255 - mask) + source.astype(numpy.uint16) * mask + 128
+        return ((value + (value >> 8)) >> 8).astype(numpy.uint8)
\ No newline at end of file
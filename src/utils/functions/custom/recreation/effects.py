@@ -0,0 +1,386 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> effects.py
+# Author --> Illusionna
+# Create --> 2024/12/18 21:06:12
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import random
+from dataclasses import dataclass
+from PIL import Image
+
+
+# 白底。
+WHITE = (255, 255, 255)
+
+
+# 效果表：效果名称到各个样式的声明，启动时由 "compile_effects()" 编译为帧计划。
+#   template    模板，相对于 draw 目录；多帧时含 "{}"，按 1 ~ count 编号；random 为真时是目录，每次随机取一张
+#   count       帧数，默认 1
+#   resize      模板缩放到的大小，默认不缩放
+#   avatar      头像的初始大小
+#   clip        头像是否裁剪为圆形，默认是
+#   background  底色，为空时直接在模板上绘制
+#   layer       'over' 头像盖在模板上，'under' 头像垫在模板下（需要底色）
+#   canvas      画布大小，默认与模板相同
+#   positions   每帧头像的位置，单个元组表示每帧相同
+#   sizes       每帧头像的大小，单个元组表示每帧相同，为空则不缩放
+#   spin        每帧头像旋转的角度增量
+#   frames      不规则的帧直接逐帧给出 [(大小, 位置[, 角度[, 扩展]]), ...]，与 positions 二选一
+#   duration    动图每帧的毫秒数
+#   suffix      扩展名，默认多帧为 gif，单帧与模板相同
+EFFECTS = {
+    '丢': (
+        {'template': '丢.jpg', 'resize': (512, 512), 'avatar': (300, 300), 'positions': (30, 200), 'sizes': (100, 100)},
+        {
+            'template': 'throw/throw_{}.png', 'count': 8, 'avatar': (300, 300), 'duration': 100,
+            'frames': [
+                [((34, 34), (108, 35))],
+                [((34, 34), (122, 34))],
+                [((19, 19), (143, 41))],
+                [((126, 126), (17, 128))],
+                [((190, 190), (-53, 199)), ((39, 39), (287, 67))],
+                [((37, 37), (276, 69))],
+                [((38, 38), (258, 30))],
+                [((180, 180), (-53, 219))]
+            ]
+        },
+        {
+            'template': 'throw-2/throw_{}.png', 'count': 6, 'avatar': (300, 300), 'duration': 100, 'sizes': (84, 84),
+            'positions': [(199, 32), (114, -1), (22, 30), (0, 46), (100, -1), (195, 29)]
+        }
+    ),
+    '仰望大佬': (
+        {'template': '仰望大佬.jpg', 'resize': (1080, 1080), 'avatar': (100, 100), 'frames': [[(None, (395, 460)), (None, (606, 442))]]},
+    ),
+    '打拳': (
+        {
+            'template': 'boxing/boxing_{}.png', 'count': 16, 'avatar': (73, 73), 'background': WHITE, 'layer': 'under', 'duration': 40,
+            'positions': [(6, 25), (12, 20), (17, 13), (21, 8), (27, 4), (32, 7), (37, 12), (41, 17), (42, 19), (34, 13), (25, 8), (17, 5), (11, 5), (7, 10), (6, 18), (5, 23)]
+        },
+    ),
+    '打': (
+        {
+            'template': 'hit/hit_{}.png', 'count': 3, 'avatar': (300, 300), 'duration': 100,
+            'positions': [(161, 121), (173, 124), (208, 166)],
+            'sizes': [(75, 75), (68, 68), (52, 52)]
+        },
+        {
+            'template': 'hit-2/hit_{}.png', 'count': 6, 'avatar': (300, 300), 'duration': 100, 'sizes': (27, 27),
+            'positions': [(66, 58), (72, 62), (66, 58), (72, 62), (66, 58), (72, 62)]
+        }
+    ),
+    '摸头': (
+        {
+            'template': 'touchHead/touchHead_{}.bmp', 'count': 5, 'avatar': (30, 30), 'background': WHITE, 'layer': 'under', 'canvas': (160, 160), 'duration': 60,
+            'positions': [(50, 50), (52, 50), (54, 50), (56, 50), (58, 50)],
+            'sizes': [(80, 80), (70, 75), (60, 70), (50, 65), (80, 80)]
+        },
+    ),
+    '摸鱼': (
+        {'template': '摸鱼.png', 'avatar': (287, 287), 'background': WHITE, 'layer': 'under', 'positions': (14, 11)},
+        {'template': 'touchFish/touchFish_{}.png', 'count': 6, 'avatar': (287, 287), 'background': WHITE, 'layer': 'under', 'duration': 130, 'sizes': (144, 144), 'positions': (78, 77)}
+    ),
+    '摸': (
+        {'template': 'touch/touch_{}.png', 'count': 4, 'avatar': (30, 30), 'background': WHITE, 'layer': 'under', 'duration': 60, 'positions': (11, 45)},
+    ),
+    '敲': (
+        {'template': 'knock/knock_{}.png', 'count': 2, 'avatar': (75, 75), 'duration': 80, 'positions': (25, 95), 'sizes': [None, (70, 70)]},
+        {'template': 'knock-2/knock_{}.png', 'count': 3, 'avatar': (75, 75), 'duration': 200, 'positions': (63, 57), 'sizes': (25, 25)}
+    ),
+    '赞': (
+        {
+            'template': 'praise/praise_{}.png', 'count': 6, 'avatar': (70, 70), 'duration': 200,
+            'frames': [[], [], [], [(None, (200, 10))], [(None, (200, 10))], [(None, (200, 10))]]
+        },
+    ),
+    '旋转': (
+        {'template': 'whirl/whirl_{}.png', 'count': 30, 'avatar': (146, 146), 'duration': 50, 'positions': (43, 17), 'spin': -12},
+    ),
+    '吃': (
+        {'template': 'eat.png', 'avatar': (290, 290), 'background': WHITE, 'layer': 'under', 'positions': (86, 155)},
+        {'template': 'eat-2.jpg', 'avatar': (290, 290), 'positions': (179, 172), 'sizes': (158, 152)}
+    ),
+    '吞': (
+        {
+            'template': 'swallow/swallow_{}.png', 'count': 31, 'avatar': (300, 300), 'background': WHITE, 'layer': 'under', 'duration': 50,
+            'positions': [(0, 174)] * 5 + [
+                (12, 160), (19, 152), (23, 148), (26, 145), (32, 140), (37, 136), (42, 131), (49, 127), (70, 126), (88, 128),
+                (-30, 210), (-19, 207), (-14, 200), (-10, 188), (-7, 179), (-3, 170), (-3, 175), (-1, 174)
+            ] + [(0, 174)] * 8,
+            'sizes': [(82, 82)] * 5 + [
+                (82, 83), (81, 83), (81, 83), (81, 83), (80, 83), (82, 83), (81, 84), (82, 83), (82, 82), (79, 80),
+                (80, 79), (76, 77), (74, 75), (81, 82), (82, 84), (81, 83), (82, 82), (82, 82)
+            ] + [(82, 82)] * 8
+        },
+    ),
+    '咬': (
+        {
+            'template': 'bite/bite_{}.png', 'count': 2, 'avatar': (96, 97), 'background': WHITE, 'layer': 'under', 'duration': 100,
+            'positions': [(108, 234), (108, 237)],
+            'sizes': [(98, 101), (96, 100)]
+        },
+    ),
+    '快逃': (
+        {
+            'template': 'escape/escape_{}.png', 'count': 8, 'avatar': (100, 100), 'background': WHITE, 'layer': 'under', 'duration': 150,
+            'positions': [(112, 95), (112, 95), (93, 87), (82, 67), (82, 76), (85, 75), (85, 75), (85, 75)],
+            'sizes': [(86, 86), (86, 86), (100, 100), (104, 104), (103, 103), (103, 103), (103, 103), (103, 103)]
+        },
+    ),
+    '色色': (
+        {
+            'template': 'erotic/erotic_{}.png', 'count': 22, 'avatar': (103, 103), 'background': WHITE, 'layer': 'under', 'duration': 100,
+            'positions': [(14, 36), (-12, 18), (38, 28), (4, 9), (50, 42), (18, 1), (-4, 3), (51, 20), (2, 26), (44, 40), (12, 5), (50, 30), (3, 35), (53, 2), (8, 23), (8, 22), (57, 12), (-3, 13), (-8, 7), (-14, 28), (41, 43), (26, 9)]
+        },
+    ),
+    '舔': (
+        {'template': 'lick/lick_{}.png', 'count': 2, 'avatar': (44, 44), 'duration': 100, 'positions': (10, 138)},
+    ),
+    '拍': (
+        {'template': 'pat/pat_{}.png', 'count': 2, 'avatar': (29, 29), 'duration': 100, 'positions': [(2, 45), (2, 65)]},
+    ),
+    '爬': (
+        {'template': '爬', 'random': True, 'resize': (500, 500), 'avatar': (83, 83), 'positions': (0, 415), 'suffix': 'jpg'},
+    ),
+    '推': (
+        {'template': 'push/push_{}.png', 'count': 16, 'avatar': (279, 279), 'duration': 100, 'positions': (384, 152), 'spin': -22.5},
+    ),
+    '踢': (
+        {
+            'template': 'kick/kick_{}.png', 'count': 15, 'avatar': (74, 74), 'duration': 100, 'spin': -24,
+            'positions': [(58, 137), (57, 118), (56, 100), (53, 114), (51, 127), (49, 140), (48, 113), (48, 86), (48, 58), (49, 98), (51, 137), (52, 177), (53, 170), (56, 182), (59, 154)]
+        },
+    ),
+    '捂脸': (
+        {'template': '捂脸.png', 'avatar': (419, 419), 'background': WHITE, 'layer': 'under', 'positions': (46, 0)},
+    ),
+    '踩': (
+        {
+            'template': 'tread/tread_{}.png', 'count': 5, 'avatar': (300, 300), 'background': WHITE, 'layer': 'under', 'duration': 70,
+            'frames': [
+                [((103, 65), (31, 188), -26, True)],
+                [((103, 65), (31, 188), -26, True)],
+                [((90, 71), (51, 209), -14)],
+                [((85, 76), (52, 203), -7)],
+                [((88, 82), (49, 198), -7)]
+            ]
+        },
+    ),
+    '脆弱': (
+        {'template': '脆弱.png', 'avatar': (73, 73), 'background': WHITE, 'layer': 'under', 'positions': (45, 62)},
+    ),
+    '吸': (
+        {
+            'template': 'inhale/inhale_{}.png', 'count': 12, 'avatar': (300, 300), 'background': WHITE, 'layer': 'under', 'duration': 60,
+            'positions': [(65, 88), (61, 89), (60, 112), (70, 142), (68, 151), (70, 129), (73, 141), (69, 145), (70, 154), (68, 119), (64, 115), (64, 99)],
+            'sizes': [(162, 151), (167, 146), (165, 120), (151, 90), (151, 84), (149, 109), (145, 94), (151, 89), (149, 76), (152, 118), (160, 121), (161, 140)]
+        },
+    ),
+    '好玩': (
+        {'template': 'interesting.png', 'avatar': (90, 90), 'background': WHITE, 'layer': 'under', 'positions': (321, 172)},
+    ),
+    '贴贴': (
+        {
+            'template': 'snuggle/snuggle_{}.png', 'count': 5, 'avatar': (300, 300), 'background': WHITE, 'layer': 'under', 'duration': 110,
+            'positions': [(77, 257), (82, 271), (82, 271), (81, 261), (64, 243)],
+            'sizes': [(174, 183), (175, 169), (175, 169), (175, 178), (194, 193)]
+        },
+    ),
+    '弹': (
+        {
+            'template': 'bounce/bounce_{}.png', 'count': 5, 'avatar': (100, 100), 'background': WHITE, 'layer': 'under', 'duration': 70,
+            'positions': [(103, 51), (103, 46), (101, 10), (101, 27), (103, 46)],
+            'sizes': [(35, 35), (35, 35), (39, 35), (38, 37), (35, 35)]
+        },
+    ),
+    '致电': (
+        {'template': 'call.jpg', 'avatar': (90, 90), 'positions': (156, 50)},
+    ),
+    '需要': (
+        {'template': 'need.png', 'avatar': (113, 113), 'clip': False, 'background': WHITE, 'layer': 'under', 'positions': (328, 232)},
+    ),
+    '扭': (
+        {'template': 'twist/twist_{}.png', 'count': 5, 'avatar': (33, 32), 'background': WHITE, 'duration': 40, 'positions': (12, 3)},
+    ),
+    '看到': (
+        {'template': 'sight.jpg', 'avatar': (176, 176), 'positions': (610, 160)},
+    )
+}
+
+
+@dataclass(frozen=True)
+class Plan:
+    """普通类：编译后的效果样式（帧计划），由 `"compile_effects()"` 生成。
+
+    .. Contents::
+        - `"Plan.templates"` 每一帧模板的绝对路径，随机效果是可选模板的列表。
+        - `"Plan.transforms"` 去重后的头像变换 `(大小, 角度, 扩展)`，每次绘制每种变换只计算一次。
+        - `"Plan.frames"` 每一帧的 `((变换序号, 位置), ...)`。
+        - `"Plan.ready"` 模板文件是否齐全，缺少素材的样式不会被选中。
+        - `"Plan.compositor"` 合成方式，`'pillow'` 或 `'numpy'`（见 `"ArrayCompositor"`）。
+        - `"Plan.compose()"` 按计划把头像合成到各帧上。
+    """
+    templates: tuple
+    size: tuple
+    clip: bool
+    resize: tuple | None
+    background: tuple | None
+    layer: str
+    canvas: tuple | None
+    transforms: tuple
+    frames: tuple
+    duration: int | None
+    suffix: str
+    random: bool
+    ready: bool
+    compositor: str = 'pillow'
+
+    def compose(self, avatar: Image.Image, templates: 'TemplateCache') -> list:
+        """公有成员函数：按计划合成各帧。
+
+        Args:
+            avatar (Image.Image): 已经按 `"Plan.size"` 缩放（及裁剪）的 RGBA 头像。
+            templates (TemplateCache): 模板帧缓存。
+
+        Returns:
+            list: 返回帧列表。
+        """
+        avatars = [Plan.__transform(avatar, *transform) for transform in self.transforms]
+        sources = self.templates
+        if self.random:
+            sources = (random.choice(self.templates),)
+        images = list()
+        for source, placements in zip(sources, self.frames):
+            template = templates.get(source, self.resize)
+            if self.background is None:
+                canvas = template
+            else:
+                canvas = Image.new('RGBA', self.canvas or template.size, self.background)
+                if self.layer == 'over':
+                    canvas.paste(template, (0, 0), Plan.__mask(template))
+            for index, position in placements:
+                canvas.paste(avatars[index], position, avatars[index].getchannel('A'))
+            if (self.background is not None) and (self.layer == 'under'):
+                canvas.paste(template, (0, 0), Plan.__mask(template))
+            images.append(canvas)
+        return images
+
+    @staticmethod
+    def __transform(avatar: Image.Image, size: tuple | None, angle: float, expand: bool) -> Image.Image:
+        """静态私有函数：缩放、旋转头像。"""
+        if size is not None:
+            avatar = avatar.resize(size)
+        if angle:
+            avatar = avatar.rotate(angle, expand=expand)
+        return avatar
+
+    @staticmethod
+    def __mask(image: Image.Image) -> Image.Image | None:
+        """静态私有函数：取模板的透明通道，没有则整张覆盖。"""
+        return image.getchannel('A') if 'A' in image.getbands() else None
+
+
+def compile_effects(table: dict, root: str, compositors: dict | None = None) -> dict:
+    """普通函数：把效果表编译为帧计划。
+
+    Args:
+        table (dict): 效果表，见 `EFFECTS`。
+        root (str): 模板所在的 draw 目录。
+        compositors (dict | None, optional): 效果名称到合成方式的映射，没有列出的效果使用 `'pillow'`。
+
+    Returns:
+        dict: 返回效果名称到 `(Plan, ...)` 的映射，每个样式一个帧计划。
+
+    .. Usage::
+    >>> plans = compile_effects(EFFECTS, os.path.join(os.path.dirname(os.path.realpath(__file__)), 'draw'))
+    >>> frames = plans['丢'][0].compose(avatar, templates)
+    """
+    compositors = compositors or {}
+    return {effect: tuple(_compile(spec, root, compositors.get(effect, 'pillow')) for spec in specs) for effect, specs in table.items()}
+
+
+def _compile(spec: dict, root: str, compositor: str = 'pillow') -> Plan:
+    """普通函数：编译一个样式。
+
+    Args:
+        spec (dict): 样式声明。
+        root (str): 模板所在的 draw 目录。
+        compositor (str, optional): 合成方式，默认 `'pillow'`。
+
+    Returns:
+        Plan: 返回帧计划。
+    """
+    count = spec.get('count', 1)
+    choose = spec.get('random', False)
+    if choose:
+        directory = os.path.join(root, spec['template'])
+        names = sorted(os.listdir(directory)) if os.path.isdir(directory) else list()
+        templates = tuple(os.path.join(directory, name) for name in names)
+        ready = bool(templates)
+        count = 1
+    else:
+        if count > 1:
+            templates = tuple(os.path.join(root, spec['template'].format(i + 1)) for i in range(count))
+        else:
+            templates = (os.path.join(root, spec['template']),)
+        ready = all(os.path.isfile(path) for path in templates)
+
+    if 'frames' in spec:
+        frames = spec['frames']
+    else:
+        positions = _expand(spec['positions'], count)
+        sizes = _expand(spec.get('sizes'), count)
+        spin = spec.get('spin', 0)
+        frames = [[(sizes[i], positions[i], spin * i)] for i in range(count)]
+
+    # 相同的头像变换只保留一份。
+    transforms = list()
+    compiled = list()
+    for placements in frames:
+        row = list()
+        for placement in placements:
+            size, position = placement[0], placement[1]
+            transform = (size, placement[2] if len(placement) > 2 else 0, placement[3] if len(placement) > 3 else False)
+            if transform not in transforms:
+                transforms.append(transform)
+            row.append((transforms.index(transform), position))
+        compiled.append(tuple(row))
+
+    suffix = spec.get('suffix')
+    if suffix is None:
+        suffix = 'gif' if count > 1 else ('jpg' if spec['template'].endswith('.jpg') else 'png')
+    return Plan(
+        templates = templates,
+        size = spec['avatar'],
+        clip = spec.get('clip', True),
+        resize = spec.get('resize'),
+        background = spec.get('background'),
+        layer = spec.get('layer', 'over'),
+        canvas = spec.get('canvas'),
+        transforms = tuple(transforms),
+        frames = tuple(compiled),
+        duration = spec.get('duration'),
+        suffix = suffix,
+        random = choose,
+        ready = ready,
+        compositor = compositor
+    )
+
+
+def _expand(value: 'tuple | list | None', count: int) -> list:
+    """普通函数：把每帧相同的单个元组展开为列表。
+
+    Args:
+        value (tuple | list | None): 单个元组、逐帧列表或空。
+        count (int): 帧数。
+
+    Returns:
+        list: 返回逐帧列表。
+    """
+    if isinstance(value, list):
+        return value
+    return [value] * count
\ No newline at end of file
@@ -0,0 +1,185 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> encoder.py
+# Author --> Illusionna
+# Create --> 2024/12/17 22:10:39
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import io
+import time
+import threading
+from PIL import Image, features
+
+# 兼容 Pillow 9.1 之前的常量位置。
+MEDIANCUT = Image.Quantize.MEDIANCUT if hasattr(Image, 'Quantize') else Image.MEDIANCUT
+NO_DITHER = Image.Dither.NONE if hasattr(Image, 'Dither') else Image.NONE
+
+
+class Encoder:
+    """普通类：表情结果的编码器。
+
+    .. Contents::
+        - 静态图片按 `jpg`、`png` 原样编码。
+        - 动图默认编码为 GIF，有两种方式，每个帧计划在本进程第一次编码时两种都试一次，记下胜出的方式，之后直接使用：
+            - `'pillow'` 直接交给 Pillow 保存，逐帧选择调色板，帧间差分及调色板压缩（`optimize`）由 Pillow 完成。
+            - `'shared'` 所有帧共用一个调色板：模板部分的颜色按帧计划只计算一次并缓存，每次只补充头像的颜色，
+              所有帧拼在一起一次映射到调色板；只有确实带透明区域的动图才占用一格透明色。
+          共用调色板的结果更小且不更慢才算胜出，否则退回 `'pillow'`；随机模板的效果及没有帧计划的绘制函数只使用 `'pillow'`。
+        - `animation` 可选 `'webp'` 或 `'apng'`，体积更小，但需要客户端支持；Pillow 不支持 WebP 动图时退回 GIF。
+
+    .. Usage::
+    >>> encoder = Encoder('gif', templates)
+    >>> suffix, content = encoder.encode(frames, 'gif', duration=100, plan=plan, avatar=avatar)
+    """
+    # 动图格式到扩展名的映射。
+    SUFFIXES = {'gif': 'gif', 'webp': 'webp', 'apng': 'png'}
+
+    def __init__(self, animation: str = 'gif', templates: 'TemplateCache | None' = None, share: int = 192) -> None:
+        """构造函数：设置编码格式。
+
+        Args:
+            animation (str, optional): 动图格式，`'gif'`、`'webp'` 或 `'apng'`，默认 `'gif'`。
+            templates (TemplateCache | None, optional): 模板帧缓存，用于计算共用调色板中模板部分的颜色，为空则只使用 `'pillow'`。
+            share (int, optional): 共用调色板中留给模板的颜色数量，其余留给头像，默认 192。
+        """
+        if (animation == 'webp') and (not features.check('webp_anim')):
+            animation = 'gif'
+        self.animation = animation if animation in Encoder.SUFFIXES else 'gif'
+        self.templates = templates
+        self.share = max(1, min(share, 254))
+        # 帧计划 -> 模板部分的颜色 / 胜出的编码方式，每个进程各有一份。
+        self.__palettes: dict = dict()
+        self.__choices: dict = dict()
+        self.__lock = threading.Lock()
+
+    def encode(self, frames: list, suffix: str, duration: int | None = None, plan: 'Plan | None' = None, avatar: Image.Image | None = None) -> tuple:
+        """公有成员函数：编码结果图片。
+
+        Args:
+            frames (list): 帧列表，静态图片只有一帧。
+            suffix (str): 绘制代码给出的扩展名，`'gif'` 表示动图，按 `animation` 重新选择格式。
+            duration (int | None, optional): 动图每帧的毫秒数。
+            plan (Plan | None, optional): 帧计划，用于缓存共用调色板和编码方式。
+            avatar (Image.Image | None, optional): 合成到各帧上的头像，用于补充共用调色板的颜色。
+
+        Returns:
+            tuple: 返回 `(扩展名, 图片内容)`。
+        """
+        if suffix != 'gif':
+            buffer = io.BytesIO()
+            frames[0].save(buffer, format={'jpg': 'JPEG', 'png': 'PNG'}[suffix])
+            return suffix, buffer.getvalue()
+        if self.animation == 'webp':
+            buffer = io.BytesIO()
+            frames[0].save(buffer, format='WEBP', save_all=True, append_images=frames[1:], duration=duration, loop=0, quality=80, method=4)
+            return 'webp', buffer.getvalue()
+        if self.animation == 'apng':
+            buffer = io.BytesIO()
+            frames[0].save(buffer, format='PNG', save_all=True, append_images=frames[1:], duration=duration, loop=0)
+            return 'png', buffer.getvalue()
+        if (plan is None) or plan.random or (avatar is None) or (self.templates is None):
+            return 'gif', Encoder.__pillow(frames, duration)
+        choice = self.__choices.get(plan)
+        if choice == 'pillow':
+            return 'gif', Encoder.__pillow(frames, duration)
+        if choice == 'shared':
+            return 'gif', self.__shared(frames, duration, plan, avatar)
+        # 第一次编码该帧计划：两种方式都试一次，共用调色板更小且不更慢才采用。
+        start = time.perf_counter()
+        plain = Encoder.__pillow(frames, duration)
+        middle = time.perf_counter()
+        shared = self.__shared(frames, duration, plan, avatar)
+        end = time.perf_counter()
+        win = (len(shared) < len(plain)) and (end - middle <= middle - start)
+        with self.__lock:
+            self.__choices[plan] = 'shared' if win else 'pillow'
+        return 'gif', shared if win else plain
+
+    @staticmethod
+    def __pillow(frames: list, duration: int | None) -> bytes:
+        """静态私有函数：直接交给 Pillow 保存 GIF。
+
+        Args:
+            frames (list): 帧列表。
+            duration (int | None): 每帧的毫秒数。
+
+        Returns:
+            bytes: 返回图片内容。
+        """
+        buffer = io.BytesIO()
+        frames[0].save(buffer, format='GIF', save_all=True, append_images=frames[1:], duration=duration, loop=0)
+        return buffer.getvalue()
+
+    def __shared(self, frames: list, duration: int | None, plan: 'Plan', avatar: Image.Image) -> bytes:
+        """私有成员函数：使用共用调色板编码 GIF。
+
+        Args:
+            frames (list): 帧列表。
+            duration (int | None): 每帧的毫秒数。
+            plan (Plan): 帧计划。
+            avatar (Image.Image): 头像。
+
+        Returns:
+            bytes: 返回图片内容。
+        """
+        # 任意一帧有半透明以下的像素，才需要透明色。
+        transparent = any((frame.mode == 'RGBA') and (frame.getchannel('A').getextrema()[0] < 128) for frame in frames)
+        size = 255 if transparent else 256
+        colors = self.__template_colors(plan)
+        colors = colors + Encoder.__colors([avatar], size - len(colors) // 3)
+        # 不足的格子用第一种颜色补齐，量化时不会选到空白颜色。
+        colors = colors + colors[:3] * (256 - len(colors) // 3)
+        palette = Image.new('P', (1, 1))
+        palette.putpalette(colors)
+        # 所有帧拼成一张一次映射到调色板，只建一次颜色查找表。
+        width, height = frames[0].size
+        montage = Image.new('RGB', (width, height * len(frames)))
+        for index, frame in enumerate(frames):
+            montage.paste(frame.convert('RGB'), (0, index * height))
+        montage = montage.quantize(palette=palette, dither=NO_DITHER)
+        indexed = [montage.crop((0, index * height, width, (index + 1) * height)) for index in range(len(frames))]
+        option = dict()
+        if transparent:
+            for image, frame in zip(indexed, frames):
+                image.paste(255, mask=frame.getchannel('A').point(lambda alpha: 255 if alpha < 128 else 0))
+            option = {'disposal': 2, 'transparency': 255}
+        buffer = io.BytesIO()
+        indexed[0].save(buffer, format='GIF', save_all=True, append_images=indexed[1:], duration=duration, loop=0, **option)
+        return buffer.getvalue()
+
+    def __template_colors(self, plan: 'Plan') -> list:
+        """私有成员函数：取出帧计划模板部分的颜色，第一次时由模板帧计算并缓存。
+
+        Args:
+            plan (Plan): 帧计划。
+
+        Returns:
+            list: 返回 `[r, g, b, ...]`，最多 `share` 种颜色。
+        """
+        colors = self.__palettes.get(plan)
+        if colors is None:
+            colors = Encoder.__colors([self.templates.get(source, plan.resize) for source in plan.templates], self.share)
+            with self.__lock:
+                self.__palettes[plan] = colors
+        return colors
+
+    @staticmethod
+    def __colors(images: list, count: int) -> list:
+        """静态私有函数：把图片缩小后拼在一起量化一次，取出代表颜色。
+
+        Args:
+            images (list): 图片列表。
+            count (int): 颜色数量。
+
+        Returns:
+            list: 返回 `[r, g, b, ...]`，最多 `count` 种颜色。
+        """
+        width, height = images[0].size
+        scale = max(1, max(width, height) // 64)
+        size = (max(1, width // scale), max(1, height // scale))
+        montage = Image.new('RGB', (size[0] * len(images), size[1]))
+        for index, image in enumerate(images):
+            montage.paste(image.convert('RGB').resize(size, Image.NEAREST), (index * size[0], 0))
+        return montage.quantize(colors=count, method=MEDIANCUT).getpalette()[:count * 3]
@@ -0,0 +1,166 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> render.py
+# Author --> Illusionna
+# Create --> 2024/12/15 13:27:51
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import base64
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+class RenderCache:
+    """普通类：按内容寻址的表情结果缓存。
+
+    .. Contents::
+        - 以 `(效果, 样式, 头像内容摘要, 渲染器版本)` 计算文件名，同一个人的同一个表情直接复用已有的结果。
+        - 头像更换后摘要随之改变，旧结果自然失效，由 `"CacheManager"` 按配额清理。
+        - 命中时刷新结果的修改时间，清理时最近使用的结果最后删除。
+
+    .. Usage::
+    >>> renders = RenderCache(os.path.join(os.getcwd(), 'cache', 'avatar-result'))
+    >>> key = renders.key('丢', 0, digest, version=1)
+    >>> path = renders.get(key)
+    >>> if path is None:
+            path = renders.write(key, 'gif', content)
+    """
+    # 结果文件的扩展名。
+    SUFFIXES = ('.gif', '.jpg', '.png', '.webp')
+
+    def __init__(self, directory: str) -> None:
+        """构造函数：创建结果缓存。
+
+        Args:
+            directory (str): 结果目录。
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, effect: str, variant: int, digest: str, version: int | str = 1) -> str:
+        """公有成员函数：计算结果的缓存键。
+
+        Args:
+            effect (str): 效果名称。
+            variant (int): 样式序号。
+            digest (str): 头像内容摘要。
+            version (int | str, optional): 渲染器版本，修改绘制代码或者编码格式后随之改变，旧结果随之失效。
+
+        Returns:
+            str: 返回缓存键，同时也是结果文件名（不含扩展名）。
+        """
+        return hashlib.sha1(f'{version}:{effect}:{variant}:{digest}'.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """公有成员函数：查找已有的结果，命中则刷新其使用时间。
+
+        Args:
+            key (str): 缓存键。
+
+        Returns:
+            str | None: 返回结果的绝对路径，未命中则返回空。
+        """
+        for suffix in RenderCache.SUFFIXES:
+            path = os.path.join(self.directory, key + suffix)
+            try:
+                os.utime(path)
+            except OSError:
+                continue
+            return path
+        return None
+
+    def write(self, key: str, suffix: str, content: bytes) -> str:
+        """公有成员函数：把渲染服务返回的图片内容写入缓存键对应的位置。
+
+        Args:
+            key (str): 缓存键。
+            suffix (str): 扩展名，例如 `'gif'`。
+            content (bytes): 图片内容。
+
+        Returns:
+            str: 返回缓存中结果的绝对路径。
+        """
+        target = os.path.join(self.directory, f'{key}.{suffix}')
+        # 先写同目录下独有的临时文件再改名，其它线程不会读到写了一半的结果，同时渲染同一个键也互不覆盖。
+        fd, temp = tempfile.mkstemp(prefix=key + '.', suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(temp, target)
+        except OSError:
+            os.remove(temp)
+            # Windows 下目标正被读取时无法替换，内容相同，已有的结果即可使用。
+            if not os.path.exists(target):
+                raise
+        return target
+
+
+class MemoryRenderCache(RenderCache):
+    """派生子类：只保存在内存中的结果缓存，结果以 `base64://` 的形式直接发送，不经过磁盘。
+
+    Args:
+        RenderCache (_type_): 继承 `"RenderCache"` 结果缓存父类，缓存键的算法相同。
+
+    .. Contents::
+        - 按 LRU 淘汰，总大小不超过 `budget` 字节。
+        - `"MemoryRenderCache.get()"`、`"MemoryRenderCache.write()"` 返回 `base64://...`，可直接作为 `[CQ:image,file=...]` 的参数。
+
+    .. Usage::
+    >>> renders = MemoryRenderCache(budget=64 << 20)
+    >>> key = renders.key('丢', 0, digest, version=1)
+    >>> file = renders.get(key) or renders.write(key, 'gif', content)
+    """
+
+    def __init__(self, budget: int = 64 << 20) -> None:
+        """构造函数：创建结果缓存。
+
+        Args:
+            budget (int, optional): 内存预算字节数，默认 64 MB。
+        """
+        self.directory = None
+        self.budget = budget
+        self.used = 0
+        self.__files: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """公有成员函数：查找已有的结果。
+
+        Args:
+            key (str): 缓存键。
+
+        Returns:
+            str | None: 返回 `base64://...`，未命中则返回空。
+        """
+        with self.__lock:
+            file = self.__files.get(key)
+            if file is None:
+                return None
+            self.__files.move_to_end(key)
+            return file
+
+    def write(self, key: str, suffix: str, content: bytes) -> str:
+        """公有成员函数：保存渲染服务返回的图片内容。
+
+        Args:
+            key (str): 缓存键。
+            suffix (str): 扩展名，`base64://` 不需要。
+            content (bytes): 图片内容。
+
+        Returns:
+            str: 返回 `base64://...`。
+        """
+        file = 'base64://' + base64.b64encode(content).decode('ascii')
+        with self.__lock:
+            if key not in self.__files:
+                self.__files[key] = file
+                self.used = self.used + len(file)
+            while (self.used > self.budget) and self.__files:
+                _, old = self.__files.popitem(last=False)
+                self.used = self.used - len(old)
+        return file
\ No newline at end of file
@@ -0,0 +1,116 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> service.py
+# Author --> Illusionna
+# Create --> 2024/12/16 19:35:02
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+
+
+def _ping() -> int:
+    """普通函数：空任务，用于提前拉起工作进程。
+
+    Returns:
+        int: 返回工作进程号。
+    """
+    return os.getpid()
+
+
+class RenderService:
+    """普通类：渲染服务，在预先启动的工作进程中绘制表情，绕开 GIL 用满多核。
+
+    .. Contents::
+        - 每个工作进程由 `initializer` 初始化一次（例如预热各自的模板帧缓存）。
+        - 调用者传入头像内容等可序列化的参数，工作进程返回编码后的图片内容，不经过磁盘。
+        - 单次渲染超过 `timeout` 秒视为失败，调用者不再等待。
+
+    .. Usage::
+    >>> service = RenderService(workers=4, timeout=10, initializer=_initialize)
+    >>> suffix, content = service.render(_render, '丢', 0, avatar)
+    >>> service.shutdown()
+    """
+
+    def __init__(self, workers: int = 4, timeout: float = 10, initializer: 'function | None' = None, initargs: tuple = ()) -> None:
+        """构造函数：创建进程池并立即拉起工作进程。
+
+        Args:
+            workers (int, optional): 工作进程数量，默认 4。
+            timeout (float, optional): 单次渲染的超时秒数，默认 10。
+            initializer (function | None, optional): 工作进程的初始化函数。
+            initargs (tuple, optional): 初始化函数的参数。
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+        # Python 3.10 提交第一个任务时会一次拉起全部工作进程，初始化不再占用第一次渲染的时间。
+        self.pool.submit(_ping)
+
+    def render(self, func: 'function', *args) -> object:
+        """公有成员函数：在工作进程中执行一次渲染。
+
+        Args:
+            func (function): 模块级的渲染函数（需要能被子进程导入）。
+            *args: 渲染函数的参数。
+
+        Raises:
+            TimeoutError: 渲染超时。
+
+        Returns:
+            object: 返回渲染函数的返回值。
+        """
+        future = self.pool.submit(func, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            # 还在排队的任务直接取消，已经开始的任务无法中断，结果丢弃。
+            future.cancel()
+            raise
+
+    def shutdown(self, cancel: bool = True) -> None:
+        """公有成员函数：关闭进程池。
+
+        Args:
+            cancel (bool, optional): 是否取消还在排队的任务，默认是；为否时排队的任务照常完成。
+        """
+        self.pool.shutdown(wait=False, cancel_futures=cancel)
+
+
+# 只在调用渲染的进程（主进程）中创建，工作进程导入模块时不会再创建进程池。
+_services: dict = dict()
+_lock = threading.Lock()
+
+
+def render_service(workers: int = 4, timeout: float = 10, initializer: 'function | None' = None, initargs: tuple = ()) -> RenderService:
+    """普通函数：获取当前进程的渲染服务，第一次调用时按参数创建。
+
+    Args:
+        workers (int, optional): 工作进程数量，默认 4。
+        timeout (float, optional): 单次渲染的超时秒数，默认 10。
+        initializer (function | None, optional): 工作进程的初始化函数。
+        initargs (tuple, optional): 初始化函数的参数。
+
+    Returns:
+        RenderService: 返回渲染服务。
+    """
+    pid = os.getpid()
+    if pid not in _services:
+        with _lock:
+            if pid not in _services:
+                _services[pid] = RenderService(workers, timeout, initializer, initargs)
+    return _services[pid]
+
+
+def reset_service() -> None:
+    """普通函数：关闭当前进程的渲染服务，下一次调用 `"render_service()"` 时重新拉起工作进程。
+
+    重新加载绘制代码后调用，新的工作进程导入新的代码；已经提交的渲染照常完成。
+    """
+    with _lock:
+        service = _services.pop(os.getpid(), None)
+    if service is not None:
+        service.shutdown(cancel=False)
\ No newline at end of file
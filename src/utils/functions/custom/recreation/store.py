@@ -0,0 +1,256 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> store.py
+# Author --> Illusionna
+# Create --> 2024/12/14 16:52:10
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import io
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from PIL import Image
+from ....tools.client import client
+
+
+class AvatarStore:
+    """普通类：QQ 头像缓存，内存 LRU 加磁盘两级，过期后用条件请求重新验证。
+
+    .. Contents::
+        - 内存中保存解码后的头像，磁盘上保存 `cache/avatar/<qq>.jpg` 及其 `ETag`、`Last-Modified`。
+        - 缓存未过期（`ttl` 秒内）直接使用，过期后带上 `If-None-Match`、`If-Modified-Since` 重新验证，304 则续期。
+        - 同一个 QQ 的并发请求合并为一次下载，其余线程等待同一个结果。
+        - 有旧缓存时只等待 `stale_timeout` 秒，上游缓慢或出错就先用旧缓存（`stale` 秒以内），`retry` 秒内不再重新验证，
+          上游故障期间的请求直接使用旧缓存，不必每次都等待超时。
+        - `directory` 为空时不使用磁盘，头像及旧缓存只保存在内存中。
+
+    .. Usage::
+    >>> avatars = AvatarStore(os.path.join(os.getcwd(), 'cache', 'avatar'))
+    >>> image = avatars.get(2141904)
+    >>> image, digest, content = avatars.lookup(2141904)
+    """
+    URL = 'http://q1.qlogo.cn/g?b=qq&nk={}&s=640'
+
+    def __init__(self, directory: str | None, ttl: float = 3600, stale: float = 604800, memory: int = 128, stale_timeout: float = 1.5, retry: float = 30) -> None:
+        """构造函数：创建头像缓存。
+
+        Args:
+            directory (str | None): 磁盘缓存目录，为空则只缓存在内存中。
+            ttl (float, optional): 缓存有效秒数，默认 1 小时。
+            stale (float, optional): 过期后仍可作为旧缓存使用的秒数，默认 7 天。
+            memory (int, optional): 内存中最多保存的头像数量，默认 128。
+            stale_timeout (float, optional): 有旧缓存时重新验证的超时秒数，默认 1.5。
+            retry (float, optional): 重新验证失败后暂停验证、直接使用旧缓存的秒数，默认 30。
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.stale = stale
+        self.memory = memory
+        self.stale_timeout = stale_timeout
+        self.retry = retry
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        # qq -> (图片, 内存中的有效起点, 内容摘要, 原始内容, 验证信息)，验证信息中的 stamp 才是真正的验证时间
+        self.__images: OrderedDict = OrderedDict()
+        self.__inflight: dict = dict()
+        self.__lock = threading.Lock()
+
+    def get(self, qq: int | str) -> Image.Image | None:
+        """公有成员函数：取出 640 像素的头像，返回的图片是共享的，只读！
+
+        Args:
+            qq (int | str): QQ 号。
+
+        Returns:
+            Image.Image | None: 返回头像，下载失败且没有旧缓存则返回空。
+        """
+        entry = self.lookup(qq)
+        return None if entry is None else entry[0]
+
+    def lookup(self, qq: int | str) -> tuple | None:
+        """公有成员函数：取出 640 像素的头像、内容摘要及原始内容，返回的图片是共享的，只读！
+
+        Args:
+            qq (int | str): QQ 号。
+
+        Returns:
+            tuple | None: 返回 `(头像, 内容摘要, 原始内容)`，下载失败且没有旧缓存则返回空。
+        """
+        if not str(qq).isdigit():
+            return None
+        qq = int(qq)
+        now = time.time()
+        with self.__lock:
+            entry = self.__images.get(qq)
+            if (entry is not None) and (now - entry[1] < self.ttl):
+                self.__images.move_to_end(qq)
+                return entry[0], entry[2], entry[3]
+            future: Future | None = self.__inflight.get(qq)
+            leader = future is None
+            if leader:
+                future = self.__inflight[qq] = Future()
+        if leader:
+            try:
+                future.set_result(self.__load(qq, now))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self.__lock:
+                    del self.__inflight[qq]
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def __load(self, qq: int, now: float) -> tuple | None:
+        """私有成员函数：从磁盘缓存或者上游加载头像，只由合并请求中的第一个线程执行。
+
+        Args:
+            qq (int): QQ 号。
+            now (float): 当前时间戳。
+
+        Returns:
+            tuple | None: 返回 `(头像, 内容摘要, 原始内容)`。
+        """
+        # 不使用磁盘时，过期的内存缓存就是旧缓存。
+        entry = self.__images.get(qq)
+        if self.directory is None:
+            path = None
+            meta = dict(entry[4]) if entry is not None else dict()
+            stamp = meta.get('stamp', entry[1]) if entry is not None else 0
+        else:
+            path = os.path.join(self.directory, f'{qq}.jpg')
+            meta = AvatarStore.__meta(path)
+            stamp = meta.get('stamp', 0) if os.path.exists(path) else 0
+        if now - stamp < self.ttl:
+            return self.__remember(qq, *self.__previous(path, entry), meta, stamp)
+
+        usable = now - stamp < self.ttl + self.stale
+        headers = dict()
+        if usable and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if usable and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        try:
+            response = client().fetch(AvatarStore.URL.format(qq), headers=headers, timeout=self.stale_timeout if usable else None)
+        except Exception:
+            response = None
+
+        if (response is not None) and (response.status_code == 304) and usable:
+            meta['stamp'] = now
+            if path is not None:
+                AvatarStore.__save_meta(path, meta)
+            return self.__remember(qq, *self.__previous(path, entry), meta, now)
+        if (response is not None) and (response.status_code == 200) and response.content:
+            image = AvatarStore.__image(response.content)
+            meta = {
+                'stamp': now,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+            if path is not None:
+                with open(path, 'wb') as f:
+                    f.write(response.content)
+                AvatarStore.__save_meta(path, meta)
+            return self.__remember(qq, image, hashlib.sha1(response.content).hexdigest(), response.content, meta, now)
+        # 上游缓慢或出错，先用旧缓存；内存中记下退避时间，`retry` 秒内直接使用旧缓存，之后再重新验证。
+        # 真正的验证时间仍留在验证信息中，旧缓存的期限仍按它计算。
+        if usable:
+            return self.__remember(qq, *self.__previous(path, entry), meta, now - self.ttl + min(self.retry, self.ttl))
+        return None
+
+    def __previous(self, path: str | None, entry: tuple | None) -> tuple:
+        """私有成员函数：取出旧缓存。
+
+        Args:
+            path (str | None): 磁盘上的头像路径，不使用磁盘时为空。
+            entry (tuple | None): 内存中的旧缓存。
+
+        Returns:
+            tuple: 返回 `(头像, 内容摘要, 原始内容)`。
+        """
+        if path is None:
+            return entry[0], entry[2], entry[3]
+        return AvatarStore.__decode(path)
+
+    def __remember(self, qq: int, image: Image.Image, digest: str, content: bytes, meta: dict, stamp: float) -> tuple:
+        """私有成员函数：放入内存缓存，超出数量时淘汰最久未使用的头像。
+
+        Args:
+            qq (int): QQ 号。
+            image (Image.Image): 头像。
+            digest (str): 内容摘要。
+            content (bytes): 原始内容。
+            meta (dict): 验证信息。
+            stamp (float): 验证时间。
+
+        Returns:
+            tuple: 返回 `(头像, 内容摘要, 原始内容)`。
+        """
+        with self.__lock:
+            self.__images[qq] = (image, stamp, digest, content, meta)
+            self.__images.move_to_end(qq)
+            while len(self.__images) > self.memory:
+                self.__images.popitem(last=False)
+        return image, digest, content
+
+    @staticmethod
+    def __decode(path: str) -> tuple:
+        """静态私有函数：解码磁盘上的头像。
+
+        Args:
+            path (str): 头像路径。
+
+        Returns:
+            tuple: 返回 `(头像, 内容摘要, 原始内容)`。
+        """
+        with open(path, 'rb') as f:
+            content = f.read()
+        return AvatarStore.__image(content), hashlib.sha1(content).hexdigest(), content
+
+    @staticmethod
+    def __image(content: bytes) -> Image.Image:
+        """静态私有函数：解码头像。
+
+        Args:
+            content (bytes): 图片内容。
+
+        Returns:
+            Image.Image: 返回头像。
+        """
+        image = Image.open(io.BytesIO(content))
+        image.load()
+        return image
+
+    @staticmethod
+    def __meta(path: str) -> dict:
+        """静态私有函数：读取头像的验证信息。
+
+        Args:
+            path (str): 头像路径。
+
+        Returns:
+            dict: 返回 `{'stamp': 验证时间, 'etag': ..., 'last_modified': ...}`，没有则返回空字典。
+        """
+        try:
+            with open(path + '.json', mode='r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return dict()
+
+    @staticmethod
+    def __save_meta(path: str, meta: dict) -> None:
+        """静态私有函数：保存头像的验证信息。
+
+        Args:
+            path (str): 头像路径。
+            meta (dict): 验证信息。
+        """
+        with open(path + '.json', mode='w', encoding='utf-8') as f:
+            json.dump(meta, f)
\ No newline at end of file
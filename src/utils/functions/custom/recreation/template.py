@@ -0,0 +1,143 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> template.py
+# Author --> Illusionna
+# Create --> 2024/12/13 21:08:44
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import threading
+from collections import OrderedDict
+from PIL import Image
+
+
+class TemplateCache:
+    """普通类：进程内的模板帧缓存，保存已解码、已缩放、已转换模式的模板图片。
+
+    .. Contents::
+        - 以 `(模板路径, 尺寸)` 为键，按 LRU 淘汰，总内存不超过 `budget` 字节。
+        - 带透明通道或调色板的模板统一转换为 RGBA，JPG 模板保持 RGB 以便直接另存为 JPG。
+        - `"TemplateCache.get()"` 返回副本，调用者可以随意在上面粘贴头像。
+        - `"TemplateCache.warmup()"` 启动时预先加载整个模板目录。
+
+    .. Usage::
+    >>> templates = TemplateCache(budget=64 << 20)
+    >>> frame = templates.get(os.path.join(drawPath, 'push', 'push_1.png'))
+    >>> throw = templates.get(os.path.join(drawPath, '丢.jpg'), (512, 512))
+    """
+
+    def __init__(self, budget: int = 64 << 20) -> None:
+        """构造函数：创建空缓存。
+
+        Args:
+            budget (int, optional): 内存预算字节数，默认 64 MB，为 0 则不缓存。
+        """
+        self.budget = budget
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.__frames: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, path: str, size: tuple | None = None) -> Image.Image:
+        """公有成员函数：取出模板图片的副本。
+
+        Args:
+            path (str): 模板图片路径。
+            size (tuple | None, optional): 缩放尺寸 `(width, height)`，默认不缩放。
+
+        Returns:
+            Image.Image: 返回图片副本。
+        """
+        key = (path, size)
+        with self.__lock:
+            image = self.__frames.get(key)
+            if image is not None:
+                self.__frames.move_to_end(key)
+                self.hits = self.hits + 1
+                return image.copy()
+            self.misses = self.misses + 1
+        image = TemplateCache.__decode(path, size)
+        self.__put(key, image)
+        return image.copy()
+
+    def warmup(self, root: str) -> int:
+        """公有成员函数：预先加载目录下的全部模板图片（原尺寸），直到内存预算用完。
+
+        Args:
+            root (str): 模板目录。
+
+        Returns:
+            int: 返回加载的图片数量。
+        """
+        count = 0
+        for parent, _, files in os.walk(root):
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() not in {'.png', '.jpg', '.jpeg', '.bmp', '.gif'}:
+                    continue
+                path = os.path.join(parent, name)
+                image = TemplateCache.__decode(path, None)
+                if self.used + TemplateCache.__bytes(image) > self.budget:
+                    return count
+                self.__put((path, None), image)
+                count = count + 1
+        return count
+
+    def clear(self) -> None:
+        """公有成员函数：清空缓存。"""
+        with self.__lock:
+            self.__frames.clear()
+            self.used = 0
+
+    def __len__(self) -> int:
+        return len(self.__frames)
+
+    def __put(self, key: tuple, image: Image.Image) -> None:
+        """私有成员函数：放入缓存，超出预算时淘汰最久未使用的模板。
+
+        Args:
+            key (tuple): `(模板路径, 尺寸)`。
+            image (Image.Image): 图片。
+        """
+        size = TemplateCache.__bytes(image)
+        if size > self.budget:
+            return
+        with self.__lock:
+            if key in self.__frames:
+                return
+            self.__frames[key] = image
+            self.used = self.used + size
+            while self.used > self.budget:
+                _, old = self.__frames.popitem(last=False)
+                self.used = self.used - TemplateCache.__bytes(old)
+
+    @staticmethod
+    def __decode(path: str, size: tuple | None) -> Image.Image:
+        """静态私有函数：解码、转换模式并缩放模板图片。
+
+        Args:
+            path (str): 模板图片路径。
+            size (tuple | None): 缩放尺寸。
+
+        Returns:
+            Image.Image: 返回图片。
+        """
+        with Image.open(path) as image:
+            image = image.convert('RGB' if image.mode == 'RGB' else 'RGBA')
+        if size is not None:
+            image = image.resize(size)
+        return image
+
+    @staticmethod
+    def __bytes(image: Image.Image) -> int:
+        """静态私有函数：估算图片占用的内存字节数。
+
+        Args:
+            image (Image.Image): 图片。
+
+        Returns:
+            int: 返回字节数。
+        """
+        return image.width * image.height * len(image.getbands())
\ No newline at end of file
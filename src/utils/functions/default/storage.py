@@ -0,0 +1,43 @@
+from ...tools.inherit import Function, Run
+from ...tools.send import send_message
+from ...tools.cache import cache_manager
+
+
+class Storage(Function, Run):
+    invoke = '/cache'
+    permission = 3
+    lane = 'control'
+    description = '查看缓存占用，"/cache sweep" 立即清理'
+
+    def __init__(self, params: dict, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        super().__auto__(self, **locals())
+        self.run()
+
+    @Run.authorize()
+    def run(self) -> None:
+        data = self.params['data']
+        text: str = self.params['context'].argument
+        manager = cache_manager()
+        if not text:
+            removed = dict()
+            usage = manager.usage(refresh=True)
+        elif text == 'sweep':
+            removed = manager.sweep()
+            usage = manager.usage()
+        else:
+            send_message('格式不正确 ：）', self.params['config']['socket'], data)
+            return
+
+        docs = ''
+        for name, (count, size) in sorted(usage.items()):
+            quota: dict = manager.quotas.get(name, {})
+            docs = docs + f'- {name}\n\t文件：{count} 个\n\t大小：{size / (1 << 20):.2f} MB'
+            if 'max_mb' in quota:
+                docs = docs + f' / {quota["max_mb"]} MB'
+            if removed.get(name):
+                docs = docs + f'\n\t清理：{removed[name]} 个'
+            docs = docs + '\n'
+
+        send_message(docs.rstrip(), self.params['config']['socket'], data)
+        self.params['config']['log'].info(f"[+] {data.get('user_id')} /cache {text}")
\ No newline at end of file
@@ -0,0 +1,180 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> cache.py
+# Author --> Illusionna
+# Create --> 2024/12/15 20:44:16
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import time
+import logging
+import threading
+from .read import read_json
+
+
+class CacheManager:
+    """普通类：管理 `cache/` 目录的磁盘占用，后台线程定期清理。
+
+    .. Contents::
+        - 按子目录统计文件数量及大小，根目录下的文件（例如日志）归入 `'.'`。
+        - 每个子目录可配置配额 `{'max_mb': 大小上限, 'max_age': 未使用的最长秒数}`。
+        - 清理时先删除超过 `max_age` 秒未修改的文件，再从最久未修改的文件开始删除直到不超过 `max_mb`（LRU，缓存命中时会刷新修改时间）。
+        - `"CacheManager.start()"` 启动后台清理线程，每次清理后把占用情况写入日志。
+
+    .. Usage::
+    >>> manager = cache_manager()
+    >>> manager.start(log)
+    >>> manager.usage()
+    {'avatar': (120, 4718592), 'avatar-result': (35, 20971520), '.': (1, 1048576)}
+    """
+
+    def __init__(self, root: str, quotas: dict | None = None, interval: float = 600) -> None:
+        """构造函数：设置清理策略。
+
+        Args:
+            root (str): 缓存根目录。
+            quotas (dict | None, optional): 子目录名称到配额的映射，没有配额的子目录只统计不清理。
+            interval (float, optional): 后台清理的间隔秒数，默认 600。
+        """
+        self.root = root
+        self.quotas = quotas or {}
+        self.interval = interval
+        self.__usage: dict = dict()
+        self.__lock = threading.Lock()
+        self.__event = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def usage(self, refresh: bool = False) -> dict:
+        """公有成员函数：查询各子目录的占用情况。
+
+        Args:
+            refresh (bool, optional): 是否重新统计，默认返回上一次清理时的统计结果。
+
+        Returns:
+            dict: 返回子目录名称到 `(文件数量, 字节数)` 的映射。
+        """
+        if refresh or not self.__usage:
+            with self.__lock:
+                self.__usage = {name: (len(files), sum(size for _, size, _ in files)) for name, files in self.__scan().items()}
+        return dict(self.__usage)
+
+    def sweep(self, now: float | None = None) -> dict:
+        """公有成员函数：按配额清理一次。
+
+        Args:
+            now (float | None, optional): 当前时间戳。
+
+        Returns:
+            dict: 返回子目录名称到删除文件数量的映射。
+        """
+        now = time.time() if now is None else now
+        removed = dict()
+        with self.__lock:
+            usage = dict()
+            for name, files in self.__scan().items():
+                quota: dict | None = self.quotas.get(name)
+                total = sum(size for _, size, _ in files)
+                count = 0
+                if quota is not None:
+                    max_bytes = quota['max_mb'] * (1 << 20) if 'max_mb' in quota else float('inf')
+                    max_age = quota.get('max_age', float('inf'))
+                    files.sort()
+                    for mtime, size, path in files:
+                        if (now - mtime <= max_age) and (total <= max_bytes):
+                            break
+                        try:
+                            os.remove(path)
+                            count = count + 1
+                        except OSError:
+                            continue
+                        total = total - size
+                    removed[name] = count
+                usage[name] = (len(files) - count, total)
+            self.__usage = usage
+        return removed
+
+    def start(self, log: logging.Logger | None = None) -> None:
+        """公有成员函数：启动后台清理线程，重复调用无效。
+
+        Args:
+            log (logging.Logger | None, optional): 记录占用情况的日志对象。
+        """
+        if (self.__thread is not None) and self.__thread.is_alive():
+            return
+        self.__event.clear()
+        self.__thread = threading.Thread(target=self.__loop, args=(log,), name='iQQbot-cache', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """公有成员函数：停止后台清理线程。"""
+        self.__event.set()
+
+    def __loop(self, log: logging.Logger | None) -> None:
+        """私有成员函数：后台线程，定期清理并记录占用情况。
+
+        Args:
+            log (logging.Logger | None): 日志对象。
+        """
+        while not self.__event.is_set():
+            try:
+                removed = self.sweep()
+                if log is not None:
+                    log.info('[+] 缓存占用 ' + ', '.join(
+                        f'{name} {count} 个 {size / (1 << 20):.1f} MB' + (f' (清理 {removed[name]} 个)' if removed.get(name) else '')
+                        for name, (count, size) in sorted(self.__usage.items())
+                    ))
+            except Exception as e:
+                if log is not None:
+                    log.error(f'[x] 缓存清理异常 {e!r}')
+            self.__event.wait(self.interval)
+
+    def __scan(self) -> dict:
+        """私有成员函数：遍历缓存目录。
+
+        Returns:
+            dict: 返回子目录名称到 `[(修改时间, 字节数, 路径), ...]` 的映射。
+        """
+        ans = {'.': list()}
+        if not os.path.isdir(self.root):
+            return ans
+        for entry in os.scandir(self.root):
+            try:
+                if entry.is_file():
+                    stat = entry.stat()
+                    ans['.'].append((stat.st_mtime, stat.st_size, entry.path))
+                elif entry.is_dir():
+                    files = ans.setdefault(entry.name, list())
+                    for parent, _, names in os.walk(entry.path):
+                        for name in names:
+                            path = os.path.join(parent, name)
+                            stat = os.stat(path)
+                            files.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                continue
+        return ans
+
+
+# 每个进程一个缓存管理器，只有主进程启动后台清理线程。
+_managers: dict = dict()
+_lock = threading.Lock()
+
+
+def cache_manager() -> CacheManager:
+    """普通函数：获取当前进程的缓存管理器，配额读取 `configs/init.json` 的 `cache_quota` 配置。
+
+    Returns:
+        CacheManager: 返回缓存管理器。
+    """
+    pid = os.getpid()
+    if pid not in _managers:
+        with _lock:
+            if pid not in _managers:
+                service = read_json(os.path.join(os.getcwd(), 'configs', 'init.json'))
+                _managers[pid] = CacheManager(
+                    root = os.path.join(os.getcwd(), 'cache'),
+                    quotas = service.get('cache_quota'),
+                    interval = service.get('cache_sweep_interval', 600)
+                )
+    return _managers[pid]
\ No newline at end of file
@@ -0,0 +1,180 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> client.py
+# Author --> Illusionna
+# Create --> 2024/12/11 22:17:36
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import asyncio
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from .read import read_json
+
+try:
+    # 可选依赖：安装了 httpx 则异步接口使用原生的异步连接池。
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class Client:
+    """普通类：共享的 HTTP 连接池，保持长连接调用 LLOneBot 的 HTTP API。
+
+    .. Contents::
+        - `"Client.call_api()"` 同步调用 HTTP API。
+        - `"Client.acall_api()"` 异步调用 HTTP API。
+        - `"Client.fetch()"` 下载外部资源（例如头像）。
+
+    .. Usage::
+    >>> client('127.0.0.1:3000').call_api('send_like', user_id=2141904, times=10)
+    >>> call_api('get_stranger_info', user_id=2141904)
+    """
+
+    def __init__(self, socket: str, pool_size: int = 16, timeouts: dict | None = None) -> None:
+        """构造函数：创建连接池。
+
+        Args:
+            socket (str): QQ 机器人 HTTP 服务监听套接字。
+            pool_size (int, optional): 连接池大小，默认 16。
+            timeouts (dict | None, optional): 各 API 的超时秒数，`'default'` 为默认值。
+        """
+        self.socket = socket
+        self.pool_size = pool_size
+        self.timeouts = {'default': 5}
+        self.timeouts.update(timeouts or {})
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.__async = None
+
+    def timeout(self, action: str) -> float:
+        """公有成员函数：查询某个 API 的超时秒数。
+
+        Args:
+            action (str): API 名称，例如 `'send_group_msg'`。
+
+        Returns:
+            float: 返回超时秒数。
+        """
+        return self.timeouts.get(action, self.timeouts['default'])
+
+    def call_api(self, action: str, **params) -> dict:
+        """公有成员函数：同步调用 HTTP API。
+
+        Args:
+            action (str): API 名称，例如 `'send_group_msg'`。
+
+        Returns:
+            dict: 返回 API 响应的 JSON 字典。
+        """
+        response = self.session.post(f'http://{self.socket}/{action}', json=params, timeout=self.timeout(action))
+        return response.json() if response.content else dict()
+
+    async def acall_api(self, action: str, **params) -> dict:
+        """公有成员函数：异步调用 HTTP API，未安装 httpx 时在线程中执行同步调用。
+
+        Args:
+            action (str): API 名称，例如 `'send_group_msg'`。
+
+        Returns:
+            dict: 返回 API 响应的 JSON 字典。
+        """
+        if httpx is None:
+            return await asyncio.to_thread(self.call_api, action, **params)
+        if self.__async is None:
+            self.__async = httpx.AsyncClient(
+                base_url = f'http://{self.socket}',
+                limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+            )
+        response = await self.__async.post(f'/{action}', json=params, timeout=self.timeout(action))
+        return response.json() if response.content else dict()
+
+    def fetch(self, url: str, headers: dict | None = None, timeout: float | None = None) -> requests.Response:
+        """公有成员函数：下载外部资源。
+
+        Args:
+            url (str): 资源链接。
+            headers (dict | None, optional): 额外的请求头，例如条件请求的 `If-None-Match`。
+            timeout (float | None, optional): 超时秒数，默认取 `'fetch'` 项。
+
+        Returns:
+            requests.Response: 返回 HTTP 响应。
+        """
+        return self.session.get(url, headers=headers, timeout=self.timeout('fetch') if timeout is None else timeout)
+
+
+# 每个进程、每个套接字一个连接池（连接池不能跨进程共享）。
+_clients: dict = dict()
+_lock = threading.Lock()
+# 每个进程读取一次的 `configs/init.json`。
+_services: dict = dict()
+
+
+def _service() -> dict:
+    """普通函数：读取当前进程的 HTTP 服务配置，只读取一次。
+
+    Returns:
+        dict: 返回 `configs/init.json` 的内容。
+    """
+    pid = os.getpid()
+    ans = _services.get(pid)
+    if ans is None:
+        ans = _services.setdefault(pid, read_json(os.path.join(os.getcwd(), 'configs', 'init.json')))
+    return ans
+
+
+def client(socket: str | None = None) -> Client:
+    """普通函数：获取当前进程的共享连接池，连接池大小和超时读取 `configs/init.json`。
+
+    默认套接字先解析为配置中的值再查找，`client()` 与 `client(<配置中的套接字>)` 共用同一个连接池。
+
+    Args:
+        socket (str | None, optional): QQ 机器人 HTTP 服务监听套接字，默认读取配置。
+
+    Returns:
+        Client: 返回连接池。
+    """
+    socket = socket or _service()['http_service_listening_socke']
+    key = (os.getpid(), socket)
+    ans = _clients.get(key)
+    if ans is None:
+        with _lock:
+            ans = _clients.get(key)
+            if ans is None:
+                service = _service()
+                ans = Client(
+                    socket = socket,
+                    pool_size = service.get('http_pool_size', 16),
+                    timeouts = service.get('http_timeouts')
+                )
+                _clients[key] = ans
+    return ans
+
+
+def call_api(action: str, **params) -> dict:
+    """普通函数：使用默认连接池同步调用 HTTP API。
+
+    Args:
+        action (str): API 名称，例如 `'send_group_msg'`。
+
+    Returns:
+        dict: 返回 API 响应的 JSON 字典。
+    """
+    return client().call_api(action, **params)
+
+
+async def acall_api(action: str, **params) -> dict:
+    """普通函数：使用默认连接池异步调用 HTTP API。
+
+    Args:
+        action (str): API 名称，例如 `'send_group_msg'`。
+
+    Returns:
+        dict: 返回 API 响应的 JSON 字典。
+    """
+    return await client().acall_api(action, **params)
\ No newline at end of file
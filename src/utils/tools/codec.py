@@ -0,0 +1,80 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> codec.py
+# Author --> Illusionna
+# Create --> 2024/12/10 19:42:05
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import re
+import json
+
+try:
+    # 可选依赖：安装了 orjson 则使用更快的 JSON 编解码。
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(body: bytes | str) -> dict:
+    """普通函数：解码 JSON。
+
+    Args:
+        body (bytes | str): JSON 文本。
+
+    Returns:
+        dict: 返回字典。
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def dumps(obj: object) -> bytes:
+    """普通函数：编码 JSON。
+
+    Args:
+        obj (object): 待编码的对象。
+
+    Returns:
+        bytes: 返回 UTF-8 编码的 JSON 文本。
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class Prefilter:
+    """普通类：在完整解码 JSON 之前，直接检查原始上报内容，快速丢弃不是在调用机器人的事件。
+
+    心跳、元事件、通知以及普通聊天消息都无需构造 Python 对象。
+
+    .. Usage::
+    >>> prefilter = Prefilter(bot_qq_account_uid)
+    >>> if prefilter.accept(body):
+            data = loads(body)
+    """
+
+    def __init__(self, bot_qq_account_uid: int | str) -> None:
+        """构造函数：预编译匹配规则。
+
+        Args:
+            bot_qq_account_uid (int | str): 机器人账号。
+        """
+        self.__message = re.compile(rb'"post_type"\s*:\s*"message"')
+        # 以 / 开头的指令（JSON 允许把 / 转义为 \/），或者艾特机器人。
+        self.__command = re.compile(
+            rb'"raw_message"\s*:\s*"(?:\\?/|\[CQ:at,qq=' + re.escape(str(bot_qq_account_uid).encode('utf-8')) + rb'[,\]])'
+        )
+
+    def accept(self, body: bytes) -> bool:
+        """公有成员函数：判断上报内容是否需要进一步处理。
+
+        Args:
+            body (bytes): HTTP 上报的原始内容。
+
+        Returns:
+            bool: 需要处理则返回真。
+        """
+        return (self.__message.search(body) is not None) and (self.__command.search(body) is not None)
\ No newline at end of file
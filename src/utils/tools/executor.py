@@ -0,0 +1,105 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> executor.py
+# Author --> Illusionna
+# Create --> 2024/12/08 16:20:41
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class Executor:
+    """普通类：有界的功能执行器，把派生子类功能移出 FastAPI 事件循环。
+
+    .. Contents::
+        - 功能按优先级分为三条通道，每条通道有独立的线程池和排队上限，互不抢占：
+            - `'control'` 控制通道，`"/stop"`、`"/start"`、`"/power"`、`"/recall"` 等应急指令，永远不会排在重任务之后。
+            - `'light'` 轻量通道（默认），文本回复之类的短任务。
+            - `'heavy'` 重量通道，头像 GIF 渲染、`"/gpt"` 等耗时任务。
+        - 派生子类声明静态变量 `lane` 指定通道，未声明时归入轻量通道。
+        - CPU 密集型的头像渲染由重量通道中的功能交给 `"RenderService"` 的工作进程完成，执行器本身只使用线程池。
+        - 某条通道排队及执行的任务数量达到上限时，该通道的事件直接丢弃。
+
+    .. Usage::
+    >>> executor = Executor(lanes={'control': {'workers': 2, 'pending': 16}})
+    >>> executor.submit(Admin_QQ_Bot_Function, params)
+    >>> executor.shutdown()
+    """
+    # 各通道的默认线程数和排队上限。
+    LANES = {
+        'control': {'workers': 2, 'pending': 16},
+        'light': {'workers': 8, 'pending': 256},
+        'heavy': {'workers': 4, 'pending': 32}
+    }
+
+    def __init__(self, lanes: dict | None = None) -> None:
+        """构造函数：为每条通道创建线程池。
+
+        Args:
+            lanes (dict | None, optional): 各通道的 `{'workers': 线程数, 'pending': 排队上限}`，缺省项取 `"Executor.LANES"`。
+        """
+        self.lanes = dict()
+        self.__pending = dict()
+        for lane, default in Executor.LANES.items():
+            option = dict(default)
+            option.update((lanes or {}).get(lane, {}))
+            self.lanes[lane] = ThreadPoolExecutor(max_workers=option['workers'], thread_name_prefix=f'iQQbot-{lane}')
+            self.__pending[lane] = threading.BoundedSemaphore(option['pending'])
+
+    @staticmethod
+    def lane(cls: object) -> str:
+        """静态函数：查询派生子类所在的通道。
+
+        Args:
+            cls (object): 派生子类。
+
+        Returns:
+            str: 返回 `'control'`、`'light'` 或 `'heavy'`。
+        """
+        lane = cls.__dict__.get('lane')
+        return lane if lane in Executor.LANES else 'light'
+
+    def submit(self, cls: object, params: dict) -> Future | None:
+        """公有成员函数：提交一次派生子类功能。
+
+        Args:
+            cls (object): 派生子类。
+            params (dict): HTTP 路由捕获的数据以及配置参数。
+
+        Returns:
+            Future | None: 返回任务句柄，所在通道的任务数量已达上限则返回空。
+        """
+        lane = Executor.lane(cls)
+        if not self.__pending[lane].acquire(blocking=False):
+            params['config']['log'].warning(f"[!] {params['data'].get('user_id')} 任务繁忙丢弃 {cls.__dict__.get('invoke')} ({lane})")
+            return None
+        try:
+            # 线程继承当前上下文，派生子类的第一条消息可以作为快速回复。
+            future = self.lanes[lane].submit(contextvars.copy_context().run, cls, params)
+        except:
+            self.__pending[lane].release()
+            raise
+        future.add_done_callback(lambda future: self.__done(future, lane, cls, params))
+        return future
+
+    def shutdown(self) -> None:
+        """公有成员函数：关闭线程池。"""
+        for pool in self.lanes.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def __done(self, future: Future, lane: str, cls: object, params: dict) -> None:
+        """私有成员函数：任务结束后释放所在通道的名额并记录异常。
+
+        Args:
+            future (Future): 任务句柄。
+            lane (str): 通道。
+            cls (object): 派生子类。
+            params (dict): HTTP 路由捕获的数据以及配置参数。
+        """
+        self.__pending[lane].release()
+        if (not future.cancelled()) and (future.exception() is not None):
+            params['config']['log'].error(f"[x] {cls.__name__} 执行异常 {future.exception()!r}")
\ No newline at end of file
@@ -1,731 +1,1050 @@
-'''
-# System --> Windows & Python3.10.0
-# File ----> inherit.py
-# Author --> Illusionna
-# Create --> 2024/11/28 14:51:30
-'''
-# -*- Encoding: UTF-8 -*-
-
-
-import os
-import re
-from abc import ABCMeta, abstractmethod
-from .send import send_message
-from .read import read_json, write_json
-
-
-class Config:
-    """普通类：读取 config 配置。"""
-    # 是否重载配置。
-    reload = False
-
-    @staticmethod
-    def load() -> dict:
-        """静态函数：加载配置文件。
-
-        Returns:
-            dict: 返回配置字典。
-        """
-        if not os.path.exists(os.path.join(os.getcwd(), 'configs', 'privilege.json')):
-            write_json({}, os.path.join(os.getcwd(), 'configs', 'privilege.json'))
-        ans = dict()
-        ans['init'] = read_json(os.path.join(os.getcwd(), 'configs', 'init.json'))
-        ans['privilege'] = read_json(os.path.join(os.getcwd(), 'configs', 'privilege.json'))
-        return ans
-
-
-config = Config.load()
-
-
-class Run(metaclass=ABCMeta):
-    """抽象类：管理功能是否运行，限制派生子类权限。
-
-    Args:
-        metaclass (_type_, optional): `"Run"` 由 "`ABCMeta`" 抽象基元类派生。
-
-    .. Contents::
-        - `"Run.lock"` 静态变量, 所有派生子类拥有此属性, 用于 `"@Run.authorize()"` 装饰器授权功能开启或禁用。
-        - `"Run.run()"` 纯虚函数, 所有派生子类必须重写 `"run(self)"` 以实现具体功能业务。
-
-    .. Usage::
-    >>> class Admin_QQ_Bot_Function(Run):
-            invoke = '/xxxx'    # 调用方式
-            permission = 2      # 二级权限（管理人员及特权者可用）
-            # 构造函数无需变动，复制粘贴即可
-            def __init__(self, params: dict, *args, **kwargs) -> None:
-                super().__init__(*args, **kwargs)
-                super().__auto__(self, **locals())
-                self.run()
-            @Run.authorize()
-            def run(self) -> None:
-                ... # 具体实现的功能
-    """
-    lock = False
-
-    @abstractmethod
-    def run() -> None:
-        """纯虚函数：运行功能。"""
-        pass
-
-    @staticmethod
-    def authorize() -> 'function':
-        """静态函数：授权管理。
-
-        Returns:
-            function: 返回闭包函数。
-        """
-        def decorator(func: 'function') -> 'function':
-            def wrapper(self, *args, **kwargs) -> 'function':
-                if Config.reload == True:
-                    # 重新加载配置文件。
-                    global config
-                    config = Config.load()
-                    Config.reload = False
-
-                level = self.__class__.__dict__.get('permission')
-                user_id = self.params['data'].get('user_id')
-                invoke = self.__class__.__dict__.get('invoke')
-                managers_qq_account_uid = [int(i) for i in config['init']['managers_qq_account_uid']]
-                owner_qq_account_uid = int(config['init']['owner_qq_account_uid'])
-                privilege = {int(key): value for key, value in config['privilege'].items()}
-
-                # 如果 run(self) 函数上锁了，则停用。
-                if self.lock:
-                    send_message(f'[!] "{invoke}" 已停用', self.params['config']['socket'], self.params['data'])
-                    self.params['config']['log'].warning(f'[!] {user_id} 功能停用 {invoke}')
-                    return lambda *args, **kwargs: ...
-
-                # 一级权限，大家都能用。
-                if level == 1:
-                    return func(self, *args, **kwargs)
-
-                # 二级权限，管理人员及特权者可用。
-                elif level == 2:
-                    # 如果不是管理人员且不是所有者。注意 and 关键字的短路原理, 管理人员需要写在前面.
-                    if (user_id not in managers_qq_account_uid) and (user_id != owner_qq_account_uid):
-                        # 如果用户有特权，亦可使用。
-                        if (user_id in privilege.keys()) and (invoke in privilege.get(user_id)):
-                            return func(self, *args, **kwargs)
-                        # 否则指令不可调用。
-                        send_message(f'"{invoke}" 指令仅管理人员使用, 可联系 ({owner_qq_account_uid}) 所有者授予特权.', self.params['config']['socket'], self.params['data'])
-                        self.params['config']['log'].error(f'[x] {user_id} 普通用户无特权 {invoke}')
-                        return lambda *args, **kwargs: ...
-                    # 否则是管理人员，指令可调用。
-                    return func(self, *args, **kwargs)
-
-                # 三级权限，所有者及特权者可用。
-                elif level == 3:
-                    # 如果不是所有者。
-                    if user_id != owner_qq_account_uid:
-                        # 如果是特权者。
-                        if (user_id in privilege.keys()) and (invoke in privilege.get(user_id)):
-                            return func(self, *args, **kwargs)
-                        # 否则指令不可调用。
-                        send_message(f'"{invoke}" 指令仅限所有者使用, 可联系 ({owner_qq_account_uid}) 所有者授予特权.', self.params['config']['socket'], self.params['data'])
-                        self.params['config']['log'].error(f'[x] {user_id} 普通用户及管理人员无特权 {invoke}')
-                        return lambda *args, **kwargs: ...
-                    # 否则是所有者，指令可调用。
-                    return func(self, *args, **kwargs)
-
-                # 权限不是 1、2、3 个等级，则为异常等级。
-                else:
-                    self.params['config']['log'].critical(f'[x!] {self.__class__.__name__}.permission 权限异常, 系统自动安排为 3 所有者可用')
-                    send_message(f'"{self.__class__.__name__}.permission" 权限异常, 已分配给所有者', self.params['config']['socket'], self.params['data'])
-                    if user_id != owner_qq_account_uid:
-                        return lambda *args, **kwargs: ...
-                    # 所有者可使用异常等级权限的指令。
-                    return func(self, *args, **kwargs)
-
-            return wrapper
-        return decorator
-
-
-class Function:
-    """普通父类：实现派生子类功能配置的初始化和自动化。
-    
-    .. Contents::
-        - `"Function.__auto__()"` 类函数，用于自动初始化实参。
-        - `"Function.add()"` 公有成员函数，用于增加新功能。
-        - `"Function.load()"` 公有成员函数，用于加载 QQ 聊天的数据。
-        - `"Function.execute()"` 公有成员函数，用于执行一次具体的派生子类功能。
-    
-    .. Usage::
-    >>> class Admin_QQ_Bot_Function(Function):
-            invoke = '/yyyy'    # 调用方式
-            permission = 1      # 一级权限（大家都可用）
-            description = '(づ｡◕‿‿◕｡)づ'    # 功能描述，可写可不写
-            # 构造函数无需变动，复制粘贴即可
-            def __init__(self, params: dict, *args, **kwargs):
-                super().__init__(*args, **kwargs)
-                super().__auto__(self, **locals())
-                self.run()
-            @Run.authorize()
-            def run(self) -> None:
-                ... # 具体实现的功能
-    """
-
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.invoke = dict()
-        self.permission = dict()
-        self.description = dict()
-
-    @classmethod
-    def __auto__(cls, obj: object, **kwargs) -> None:
-        """类函数：用于自动收集派生子类初始化的实参变量。"""
-        for key, value in kwargs.items():
-            if key not in {'self', 'args', 'kwargs'}:
-                setattr(obj, key, value)
-
-    def add(self, cls: object) -> None:
-        """公有成员函数：增加新功能。
-
-        Args:
-            cls (object): 派生子类。
-
-        .. Usage::
-        >>> f = Function()
-        >>> f.add(Admin_QQ_Bot_Function)
-        """
-        # 获取所有派生子类的调用方式。
-        invoke: str | None = cls.__dict__.get('invoke')
-        if invoke:
-            self.invoke[invoke] = cls
-        else:
-            print(f'\033[31m[x] "{cls.__name__}" 类缺少静态变量 "invoke" 唤起, 须完善该类的代码\033[0m')
-            print(f'\033[32m[+] e.g.\t{cls.__name__}.invoke = "/{cls.__name__.lower()}"\033[0m')
-            exit(0)
-
-        # 获取所有派生子类的权限等级。
-        permission = cls.__dict__.get('permission')
-        if permission:
-            self.permission[cls.__name__] = permission
-        else:
-            print(f'\033[31m[x] "{cls.__name__}" 类缺少静态变量 "permission" 权限, 须完善该类的代码\033[0m')
-            print(f'\033[32m[+] e.g.\t{cls.__name__}.permission = 1\033[0m')
-            exit(0)
-
-        # 获取所有派生子类的简介描述。
-        description = cls.__dict__.get('description')
-        if description:
-            self.description[cls.__name__] = description
-        else:
-            self.description[cls.__name__] = '开发者很懒 ：）'
-
-    def load(self, params: dict) -> None:
-        """公有成员函数：加载 QQ 聊天的数据。
-
-        Args:
-            params (dict): HTTP 路由捕获的数据以及配置参数。
-
-        .. Usage::
-        >>> f = Function()
-        >>> f.add(Admin_QQ_Bot_Function)
-        >>> f.load(params)
-        """
-        self.params = params
-        raw_message: str = params['data'].get('raw_message')
-        # 如果有消息。
-        if raw_message:
-            if raw_message[0] == '/':
-                raw_message = raw_message.replace('&#91;', '[').replace('&#93;', ']').replace('&amp;', '&').replace('&#44;', ',')
-                self.params['data']['raw_message'] = raw_message
-                prefix = raw_message.split(' ', 1)[0]
-                # 如果用户的消息是在调用指令集，则启用本次功能。
-                if prefix in self.invoke.keys():
-                    self.prefix = prefix
-                    self.lock = False
-                else:
-                    self.lock = True
-            elif raw_message.startswith(f"[CQ:at,qq={config['init']['bot_qq_account_uid']},"):
-                send_message(
-                    text = f"哈喽，{self.params['data'].get('sender').get('nickname')}，你好呀！(..＞◡＜..)\n\n我叫 {config['init']['bot_name']}，很高兴为你效劳！\n\n你可以使用 /info 指令查看我的介绍。",
-                    socket = self.params['config']['socket'],
-                    data = self.params['data']
-                )
-                self.lock = True
-            else:
-                self.lock = True
-        # 否则此处加载的数据无效，给本次功能上锁。
-        else:
-            self.lock = True
-
-    def execute(self) -> None:
-        """公有成员函数：执行一次具体的派生子类功能。
-
-        .. Usage::
-        >>> f = Function()
-        >>> f.add(Admin_QQ_Bot_Function)
-        >>> f.load(params)
-        >>> f.execute()
-        """
-        # 如果功能没上锁，启用状态，则调用指令。
-        if not self.lock:
-            self.invoke.get(self.prefix)(self.params)
-
-
-class Help(Function, Run):
-    """派生子类：查看帮助。
-
-    Args:
-        Function (_type_): 继承 `"Function"` 功能父类。
-        Run (_type_): 继承 `"Run"` 抽象父类。
-
-    .. Usage::
-    >>> f.add(Help)
-    """
-    invoke = '/help'    # 使用 /help 唤起。
-    permission = 1      # 大家都可用。
-    description = '(づ｡◕‿‿◕｡)づ'
-
-    def __init__(self, params: dict, *args, **kwargs) -> None:
-        """构造函数：原封不动复制粘贴过来。
-
-        Args:
-            params (dict): 默认参数不要动！
-        """
-        super().__init__(*args, **kwargs)
-        super().__auto__(self, **locals())
-        self.run()
-
-    @Run.authorize()
-    def run(self) -> None:
-        """抽象类 `"Run"` 的派生子类 `"Help"` 必须重写 `"run(self)"` 函数具体实现方法。
-    
-        装饰器 `"@Run.authorize()"` 限制权限。
-        """
-        data: dict = self.params['data']
-        user_id: int = data.get('user_id')
-        raw_message: str = data.get('raw_message')
-
-        if raw_message == Help.invoke:
-            s = set()
-
-            managers_qq_account_uid = [int(i) for i in config['init']['managers_qq_account_uid']]
-            owner_qq_account_uid = int(config['init']['owner_qq_account_uid'])
-            privilege = {int(key): value for key, value in config['privilege'].items()}
-
-            invoke: dict = self.params['functions']['invoke']
-            permission: dict = self.params['functions']['permission']
-
-            # 普通用户
-            if (user_id not in managers_qq_account_uid) and (user_id != owner_qq_account_uid):
-                for key, value in invoke.items():
-                    if permission[value.__name__] == 1:
-                        s.add(('[x' if value.lock else '[+') + f' {key}]')
-                if user_id in privilege.keys():
-                    for i in privilege[user_id]:
-                        s.add(('[x' if invoke[i].lock else '[+') + f' {key}]')
-            # 管理人员
-            elif user_id in managers_qq_account_uid:
-                for key, value in invoke.items():
-                    if (permission[value.__name__] == 1) or (permission[value.__name__] == 2):
-                        s.add(('[x' if value.lock else '[+') + f' {key}]')
-                if user_id in privilege.keys():
-                    for i in privilege[user_id]:
-                        s.add(('[x' if invoke[i].lock else '[+') + f' {key}]')
-            # 所有者
-            elif user_id == owner_qq_account_uid:
-                for key, value in invoke.items():
-                    s.add(('[x' if value.lock else '[+') + f' {key}]')
-
-            docs = ', '.join(s)
-            docs = docs + '\n\n+ 表示启用  x 表示停用'
-
-            send_message(docs, self.params['config']['socket'], data)
-
-
-class Docs(Function, Run):
-    """派生子类：查看文档。
-
-    Args:
-        Function (_type_): 继承 `"Function"` 功能父类。
-        Run (_type_): 继承 `"Run"` 抽象父类。
-
-    .. Usage::
-    >>> f.add(Docs)
-    """
-    invoke = '/docs'    # 使用 /docs 唤起。
-    permission = 1      # 大家都可用。
-    description = '(づ｡◕‿‿◕｡)づ'
-
-    def __init__(self, params: dict, *args, **kwargs) -> None:
-        """构造函数：原封不动复制粘贴过来。
-
-        Args:
-            params (dict): 默认参数不要动！
-        """
-        super().__init__(*args, **kwargs)
-        super().__auto__(self, **locals())
-        self.run()
-
-    @Run.authorize()
-    def run(self) -> None:
-        """抽象类 `"Run"` 的派生子类 `"Docs"` 必须重写 `"run(self)"` 函数具体实现方法。
-    
-        装饰器 `"@Run.authorize()"` 限制权限。
-        """
-        data: dict = self.params['data']
-        user_id: int = data.get('user_id')
-        raw_message: str = data.get('raw_message')
-
-        if raw_message == Docs.invoke:
-            s = set()
-
-            managers_qq_account_uid = [int(i) for i in config['init']['managers_qq_account_uid']]
-            owner_qq_account_uid = int(config['init']['owner_qq_account_uid'])
-            privilege = {int(key): value for key, value in config['privilege'].items()}
-
-            invoke: dict = self.params['functions']['invoke']
-            permission: dict = self.params['functions']['permission']
-            description: dict = self.params['functions']['description']
-
-            # 普通用户
-            if (user_id not in managers_qq_account_uid) and (user_id != owner_qq_account_uid):
-                for key, value in invoke.items():
-                    if permission[value.__name__] == 1:
-                        s.add((' [x] 停用 ' if value.lock else ' [+] 启用 ') + key + f'\n\te.g. {description[value.__name__]}')
-                if user_id in privilege.keys():
-                    for i in privilege[user_id]:
-                        s.add((' [x] 停用 ' if invoke[i].lock else ' [+] 启用 ') + i + f'\n\te.g. {description[invoke[i].__name__]}')
-            # 管理人员
-            elif user_id in managers_qq_account_uid:
-                for key, value in invoke.items():
-                    if (permission[value.__name__] == 1) or (permission[value.__name__] == 2):
-                        s.add((' [x] 停用 ' if value.lock else ' [+] 启用 ') + key + f'\n\te.g. {description[value.__name__]}')
-                if user_id in privilege.keys():
-                    for i in privilege[user_id]:
-                        s.add((' [x] 停用 ' if invoke[i].lock else ' [+] 启用 ') + i + f'\n\te.g. {description[invoke[i].__name__]}')
-            # 所有者
-            elif user_id == owner_qq_account_uid:
-                for key, value in invoke.items():
-                    s.add((' [x] 停用 ' if value.lock else ' [+] 启用 ') + key + f'\n\te.g. {description[value.__name__]}')
-
-            docs = '\n'.join(s)
-
-            send_message(docs, self.params['config']['socket'], data)
-
-
-class Start(Function, Run):
-    """派生子类：启用功能。
-
-    Args:
-        Function (_type_): 继承 `"Function"` 功能父类。
-        Run (_type_): 继承 `"Run"` 抽象父类。
-
-    .. Usage::
-    >>> f.add(Start)
-    """
-    invoke = '/start'   # 唤起方式
-    permission = 3      # 仅限所有者可用（不建议授权特权者）
-    description = '"/start /x /y" 启用功能'
-
-    def __init__(self, params: dict, *args, **kwargs) -> None:
-        """构造函数：原封不动复制粘贴过来。
-
-        Args:
-            params (dict): 默认参数不要动！
-        """
-        super().__init__(*args, **kwargs)
-        super().__auto__(self, **locals())
-        Start.lock = False      # 该功能类始终保持开启，不可被停用。
-        self.run()
-
-    @Run.authorize()
-    def run(self) -> None:
-        """抽象类 `"Run"` 的派生子类 `"Start"` 必须重写 `"run(self)"` 函数具体实现方法。
-
-        装饰器 `"@Run.authorize()"` 限制权限。
-        """
-        data: dict = self.params['data']
-        raw_message: str = data.get('raw_message')
-        text = raw_message.replace(f'{Start.invoke} ', '', 1)
-
-        instructions = set(text.split())
-        instructions.discard(Start.invoke)
-        instructions.discard(Stop.invoke)
-        invoke: dict = self.params['functions']['invoke']
-        docs = set()
-
-        if instructions:
-            for item in instructions:
-                if item in invoke.keys():
-                    invoke[item].lock = False
-                    docs.add(f' [+] "{item}" 已启用')
-                else:
-                    docs.add(f' [!] "{item}" 无效指令')
-        else:
-            docs.add('想启用什么指令呀 ( ´◔︎ ‸◔︎`)')
-
-        send_message('\n'.join(docs), self.params['config']['socket'], data)
-        self.params['config']['log'].info(f"[+] {data.get('user_id')} /start {text}")
-
-
-class Stop(Function, Run):
-    """派生子类：停用功能。
-
-    Args:
-        Function (_type_): 继承 `"Function"` 功能父类。
-        Run (_type_): 继承 `"Run"` 抽象父类。
-
-    .. Usage::
-    >>> f.add(Stop)
-    """
-    invoke = '/stop'    # 唤起方式
-    permission = 3      # 仅限所有者可用（不建议授权特权者）
-    description = '"/stop /xx /yy" 停用功能'
-
-    def __init__(self, params: dict, *args, **kwargs) -> None:
-        """构造函数：原封不动复制粘贴过来。
-
-        Args:
-            params (dict): 默认参数不要动！
-        """
-        super().__init__(*args, **kwargs)
-        super().__auto__(self, **locals())
-        Stop.lock = False      # 该功能类始终保持开启，不可被自己本身停用。
-        self.run()
-
-    @Run.authorize()
-    def run(self) -> None:
-        """抽象类 `"Run"` 的派生子类 `"Stop"` 必须重写 `"run(self)"` 函数具体实现方法。
-
-        装饰器 `"@Run.authorize()"` 限制权限。
-        """
-        data: dict = self.params['data']
-        raw_message: str = data.get('raw_message')
-        text = raw_message.replace(f'{Stop.invoke} ', '', 1)
-
-        instructions = set(text.split())
-        instructions.discard(Stop.invoke)
-        instructions.discard(Start.invoke)
-        invoke: dict = self.params['functions']['invoke']
-        docs = set()
-
-        if instructions:
-            for item in instructions:
-                if item in invoke.keys():
-                    invoke[item].lock = True
-                    docs.add(f' [-] "{item}" 已停用')
-                else:
-                    docs.add(f' [!] "{item}" 无效指令')
-        else:
-            docs.add('你想停用哪些指令 ૮₍ ˃ ⤙ ˂ ₎ა')
-
-        send_message('\n'.join(docs), self.params['config']['socket'], data)
-        self.params['config']['log'].info(f"[+] {data.get('user_id')} /stop {text}")
-
-
-class Power(Function, Run):
-    """派生子类：授予特权功能。
-
-    Args:
-        Function (_type_): 继承 `"Function"` 功能父类。
-        Run (_type_): 继承 `"Run"` 抽象父类。
-
-    .. Usage::
-    >>> f.add(Power)
-    """
-    invoke = '/power'   # 唤起方式
-    permission = 3      # 仅限所有者可用（不建议授权特权者）
-    description = '/power @小明 /xxx\n\te.g. /power 2141904 /yyy'
-
-    def __init__(self, params: dict, *args, **kwargs) -> None:
-        """构造函数：原封不动复制粘贴过来。
-
-        Args:
-            params (dict): 默认参数不要动！
-        """
-        super().__init__(*args, **kwargs)
-        super().__auto__(self, **locals())
-        self.run()
-
-    @Run.authorize()
-    def run(self) -> None:
-        """抽象类 `"Run"` 的派生子类 `"Power"` 必须重写 `"run(self)"` 函数具体实现方法。
-
-        装饰器 `"@Run.authorize()"` 限制权限。
-        """
-        data: dict = self.params['data']
-        raw_message: str = data.get('raw_message')
-        text = raw_message.replace(f'{Power.invoke} ', '', 1)
-
-        if text != Power.invoke:
-            ans = Power.__parse(text)
-            if ans:
-                if len(ans['who']) != 0:
-                    invoke: set = set(self.params['functions']['invoke'].keys())
-                    # -------------------------------------------------------
-                    # 启用、停用、授权三个功能除了所有者，不建议授予其他用户特权。
-                    invoke.discard(Start.invoke)
-                    invoke.discard(Stop.invoke)
-                    invoke.discard(Power.invoke)
-                    # -------------------------------------------------------
-                    cmd = ans['cmd']
-                    if cmd in invoke:
-                        s = set()
-                        for i in ans['who']:
-                            if i.isdigit():
-                                if config['privilege'].get(i):
-                                    L: list = config['privilege'].get(i)
-                                    L.append(cmd)
-                                    config['privilege'][i] = list(set(L))
-                                else:
-                                    config['privilege'].update({i: [cmd]})
-                                s.add(i)
-                            else:
-                                tmp = i[i.find('qq='):]
-                                tmp = tmp[:tmp.find(',')].replace('qq=', '')
-                                if tmp == 'all':
-                                    pass
-                                else:
-                                    if config['privilege'].get(tmp):
-                                        L: list = config['privilege'].get(tmp)
-                                        L.append(cmd)
-                                        config['privilege'][tmp] = list(set(L))
-                                    else:
-                                        config['privilege'].update({tmp: [cmd]})
-                                    s.add(tmp)
-                        write_json(config['privilege'], os.path.join(os.getcwd(), 'configs', 'privilege.json'))
-                        Config.reload = True
-                        docs = '\n'.join(s)
-                        send_message(f'[+] "{cmd}" 已为以下用户授权\n{docs}', self.params['config']['socket'], data)
-                        self.params['config']['log'].info(f"[+] {data.get('user_id')} {text}")
-                    else:
-                        send_message(f'"{cmd}" 无效 ╭∩╮( ͡⚆ ͜ʖ ͡⚆)╭∩╮', self.params['config']['socket'], data)
-                        self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
-                else:
-                    send_message('格式不对，授权给谁呢 (ﾟω´)', self.params['config']['socket'], data)
-                    self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
-            else:
-                send_message('格式不对哟 ( ×ω× )', self.params['config']['socket'], data)
-                self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
-        else:
-            send_message('想给谁授权什么指令？', self.params['config']['socket'], data)
-            self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
-
-    @staticmethod
-    def __parse(text: str) -> dict | None:
-        """静态私有函数：正则化解析授权指令。
-
-        Args:
-            text (str): 文本内容。
-
-        Returns:
-            dict | None: 返回字典或者空。
-        """
-        text = text.strip()
-        match = re.match(r'(.*?)\s*\/(\w+)\s*', text)
-        if match:
-            content_part = match.group(1)
-            command = '/' + match.group(2)
-            parts = re.findall(r'\d+|(?:\[.*?\])', content_part)
-            return {'cmd': command, 'who': parts}
-        else:
-            return None
-
-
-class Recall(Function, Run):
-    """派生子类：召回特权功能。
-
-    Args:
-        Function (_type_): 继承 `"Function"` 功能父类。
-        Run (_type_): 继承 `"Run"` 抽象父类。
-
-    .. Usage::
-    >>> f.add(Recall)
-    """
-    invoke = '/recall'  # 唤起方式
-    permission = 3      # 仅限所有者可用（不建议授权特权者）
-    description = '/recall @小明 /xxx\n\te.g. /recall 2141904 /yyy'
-
-    def __init__(self, params: dict, *args, **kwargs) -> None:
-        """构造函数：原封不动复制粘贴过来。
-
-        Args:
-            params (dict): 默认参数不要动！
-        """
-        super().__init__(*args, **kwargs)
-        super().__auto__(self, **locals())
-        self.run()
-
-    @Run.authorize()
-    def run(self) -> None:
-        """抽象类 `"Run"` 的派生子类 `"Recall"` 必须重写 `"run(self)"` 函数具体实现方法。
-
-        装饰器 `"@Run.authorize()"` 限制权限。
-        """
-        data: dict = self.params['data']
-        raw_message: str = data.get('raw_message')
-        text = raw_message.replace(f'{Recall.invoke} ', '', 1)
-        if text != Recall.invoke:
-            ans = Recall.__parse(text)
-            if ans:
-                if len(ans['who']) != 0:
-                    invoke: set = set(self.params['functions']['invoke'].keys())
-                    # -------------------------------------------------------
-                    # 启用、停用、授权三个功能除了所有者，不建议授予其他用户特权。
-                    invoke.discard(Start.invoke)
-                    invoke.discard(Stop.invoke)
-                    invoke.discard(Power.invoke)
-                    # -------------------------------------------------------
-                    cmd = ans['cmd']
-                    if cmd in invoke:
-                        s = set()
-                        for i in ans['who']:
-                            if i.isdigit():
-                                if config['privilege'].get(i):
-                                    try:
-                                        config['privilege'][i].remove(cmd)
-                                        s.add(i)
-                                    except:
-                                        pass
-                            else:
-                                tmp = i[i.find('qq='):]
-                                tmp = tmp[:tmp.find(',')].replace('qq=', '')
-                                if tmp == 'all':
-                                    pass
-                                else:
-                                    if config['privilege'].get(tmp):
-                                        try:
-                                            config['privilege'][tmp].remove(cmd)
-                                            s.add(tmp)
-                                        except:
-                                            pass
-                        write_json(config['privilege'], os.path.join(os.getcwd(), 'configs', 'privilege.json'))
-                        Config.reload = True
-                        docs = '\n'.join(s)
-                        send_message(f'[-] 取缔以下用户 "{cmd}" 指令\n{docs}', self.params['config']['socket'], data)
-                        self.params['config']['log'].info(f"[+] {data.get('user_id')} {text}")
-                    else:
-                        send_message(f'"{cmd}" 无效 ╭∩╮( ͡⚆ ͜ʖ ͡⚆)╭∩╮', self.params['config']['socket'], data)
-                        self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
-                else:
-                    send_message('格式不对，取缔谁呢 (ﾟω´)', self.params['config']['socket'], data)
-                    self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
-            else:
-                send_message('格式不对哟 ( ×ω× )', self.params['config']['socket'], data)
-                self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
-        else:
-            send_message('想取消谁的什么指令？', self.params['config']['socket'], data)
-            self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
-
-    @staticmethod
-    def __parse(text: str) -> dict | None:
-        """静态私有函数：正则化解析授权指令。
-
-        Args:
-            text (str): 文本内容。
-
-        Returns:
-            dict | None: 返回字典或者空。
-        """
-        text = text.strip()
-        match = re.match(r'(.*?)\s*\/(\w+)\s*', text)
-        if match:
-            content_part = match.group(1)
-            command = '/' + match.group(2)
-            parts = re.findall(r'\d+|(?:\[.*?\])', content_part)
-            return {'cmd': command, 'who': parts}
-        else:
-            return None
\ No newline at end of file
+'''
+# System --> Windows & Python3.10.0
+# File ----> inherit.py
+# Author --> Illusionna
+# Create --> 2024/11/28 14:51:30
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from abc import ABCMeta, abstractmethod
+from .trie import Trie
+from .message import parse, from_array, strip_prefix, unescape
+from .schema import Schema, Users, Command
+from .state import shared_state
+from .send import send_message
+from .read import read_json, write_json
+
+
+class Config:
+    """普通类：读取 config 配置。"""
+    # 是否重载配置。
+    reload = False
+
+    @staticmethod
+    def load() -> dict:
+        """静态函数：加载配置文件，特权以共享状态为准（见 `"shared_state()"`）。
+
+        Returns:
+            dict: 返回配置字典。
+        """
+        if not os.path.exists(os.path.join(os.getcwd(), 'configs', 'privilege.json')):
+            write_json({}, os.path.join(os.getcwd(), 'configs', 'privilege.json'))
+        ans = dict()
+        ans['init'] = read_json(os.path.join(os.getcwd(), 'configs', 'init.json'))
+        ans['privilege'] = shared_state().privilege()
+        return ans
+
+
+class Permission:
+    """普通类：编译后的只读权限快照，仅在 `"Config.load()"` 重新加载配置后重建。
+
+    .. Contents::
+        - `"Permission.owner"` 所有者账号。
+        - `"Permission.managers"` 管理人员账号的不可变集合。
+        - `"Permission.privilege"` 特权者账号到不可变指令集合的只读映射。
+        - `"Permission.LEVELS"` 各身份可直接使用的权限等级表。
+
+    .. Usage::
+    >>> permission = Permission(config)
+    >>> permission.allow(user_id, '/xxxx', 2)
+    """
+    # 各身份可直接使用的权限等级。
+    LEVELS = MappingProxyType({
+        'owner': frozenset({1, 2, 3}),
+        'manager': frozenset({1, 2}),
+        'user': frozenset({1})
+    })
+    __slots__ = ('owner', 'managers', 'privilege')
+
+    def __init__(self, config: dict) -> None:
+        """构造函数：编译权限快照。
+
+        Args:
+            config (dict): `"Config.load()"` 返回的配置字典。
+        """
+        self.owner: int = int(config['init']['owner_qq_account_uid'])
+        self.managers: frozenset = frozenset(int(i) for i in config['init']['managers_qq_account_uid'])
+        self.privilege: MappingProxyType = MappingProxyType({int(key): frozenset(value) for key, value in config['privilege'].items()})
+
+    def role(self, user_id: int) -> str:
+        """公有成员函数：查询用户身份。
+
+        Args:
+            user_id (int): 用户账号。
+
+        Returns:
+            str: 返回 `'owner'`、`'manager'` 或 `'user'`。
+        """
+        if user_id == self.owner:
+            return 'owner'
+        elif user_id in self.managers:
+            return 'manager'
+        return 'user'
+
+    def levels(self, user_id: int) -> frozenset:
+        """公有成员函数：查询用户可直接使用的权限等级。
+
+        Args:
+            user_id (int): 用户账号。
+
+        Returns:
+            frozenset: 返回权限等级集合。
+        """
+        return Permission.LEVELS[self.role(user_id)]
+
+    def commands(self, user_id: int) -> frozenset:
+        """公有成员函数：查询用户被授予特权的指令。
+
+        Args:
+            user_id (int): 用户账号。
+
+        Returns:
+            frozenset: 返回指令集合。
+        """
+        return self.privilege.get(user_id, frozenset())
+
+    def allow(self, user_id: int, invoke: str, level: int) -> bool:
+        """公有成员函数：判断用户能否调用指令。
+
+        Args:
+            user_id (int): 用户账号。
+            invoke (str): 指令唤起方式。
+            level (int): 指令权限等级。
+
+        Returns:
+            bool: 可以调用则返回真。
+        """
+        return (level in self.levels(user_id)) or (invoke in self.commands(user_id))
+
+
+config = Config.load()
+permission = Permission(config)
+
+
+@dataclass(frozen=True)
+class Context:
+    """普通类：单次事件的只读调度上下文，由 `"Function.load()"` 生成。
+
+    .. Contents::
+        - `"Context.prefix"` 用户调用的指令（或别名）。
+        - `"Context.message"` 解码后的消息。
+        - `"Context.command"` 指令对应的派生子类。
+        - `"Context.argument"` 指令之后的参数文本，已去掉开头的空白。
+        - `"Context.params"` 本次事件独有的参数，派生子类可通过 `params['context']` 取回上下文。
+        - `"Context.segments"` 指令之后参数部分的消息段（文本、@、回复、图片、表情等），每个事件只解码一次。
+        - `"Context.args"` 按派生子类声明的 `arguments` 解析出的参数，没有声明、没有参数或者参数不符合时为空。
+        - `"Context.error"` 参数不符合声明时的提示，`"@Run.authorize()"` 放行后直接回复该提示，不再运行功能。
+    """
+    prefix: str
+    message: str
+    command: type
+    argument: str
+    params: dict = field(repr=False)
+    segments: tuple = field(default=(), repr=False)
+    args: dict | None = field(default=None, repr=False)
+    error: str | None = field(default=None, repr=False)
+
+
+class Run(metaclass=ABCMeta):
+    """抽象类：管理功能是否运行，限制派生子类权限。
+
+    Args:
+        metaclass (_type_, optional): `"Run"` 由 "`ABCMeta`" 抽象基元类派生。
+
+    .. Contents::
+        - `"Run.lock"` 静态变量, 所有派生子类拥有此属性, 用于 `"@Run.authorize()"` 装饰器授权功能开启或禁用。
+        - `"Run.run()"` 纯虚函数, 所有派生子类必须重写 `"run(self)"` 以实现具体功能业务。
+
+    .. Usage::
+    >>> class Admin_QQ_Bot_Function(Run):
+            invoke = '/xxxx'    # 调用方式
+            permission = 2      # 二级权限（管理人员及特权者可用）
+            # 构造函数无需变动，复制粘贴即可
+            def __init__(self, params: dict, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                super().__auto__(self, **locals())
+                self.run()
+            @Run.authorize()
+            def run(self) -> None:
+                ... # 具体实现的功能
+    """
+    lock = False
+
+    @abstractmethod
+    def run() -> None:
+        """纯虚函数：运行功能。"""
+        pass
+
+    @staticmethod
+    def authorize() -> 'function':
+        """静态函数：授权管理。
+
+        Returns:
+            function: 返回闭包函数。
+        """
+        def decorator(func: 'function') -> 'function':
+            def wrapper(self, *args, **kwargs) -> 'function':
+                if Config.reload == True:
+                    # 重新加载配置文件。
+                    global config, permission
+                    config = Config.load()
+                    permission = Permission(config)
+                    Config.reload = False
+
+                context: Context = self.params['context']
+                level = context.command.__dict__.get('permission')
+                user_id = self.params['data'].get('user_id')
+                invoke = context.command.__dict__.get('invoke')
+                owner_qq_account_uid = permission.owner
+
+                # 如果 run(self) 函数上锁了，则停用。
+                if self.lock:
+                    send_message(f'[!] "{invoke}" 已停用', self.params['config']['socket'], self.params['data'])
+                    self.params['config']['log'].warning(f'[!] {user_id} 功能停用 {invoke}')
+                    return lambda *args, **kwargs: ...
+
+                # 一级权限，大家都能用。
+                if level == 1:
+                    return Run.__call(func, self, *args, **kwargs)
+
+                # 二级权限，管理人员及特权者可用。
+                elif level == 2:
+                    # 管理人员、所有者或者有特权的用户，指令可调用。
+                    if permission.allow(user_id, invoke, level):
+                        return Run.__call(func, self, *args, **kwargs)
+                    # 否则指令不可调用。
+                    send_message(f'"{invoke}" 指令仅管理人员使用, 可联系 ({owner_qq_account_uid}) 所有者授予特权.', self.params['config']['socket'], self.params['data'])
+                    self.params['config']['log'].error(f'[x] {user_id} 普通用户无特权 {invoke}')
+                    return lambda *args, **kwargs: ...
+
+                # 三级权限，所有者及特权者可用。
+                elif level == 3:
+                    # 所有者或者特权者，指令可调用。
+                    if permission.allow(user_id, invoke, level):
+                        return Run.__call(func, self, *args, **kwargs)
+                    # 否则指令不可调用。
+                    send_message(f'"{invoke}" 指令仅限所有者使用, 可联系 ({owner_qq_account_uid}) 所有者授予特权.', self.params['config']['socket'], self.params['data'])
+                    self.params['config']['log'].error(f'[x] {user_id} 普通用户及管理人员无特权 {invoke}')
+                    return lambda *args, **kwargs: ...
+
+                # 权限不是 1、2、3 个等级，则为异常等级。
+                else:
+                    self.params['config']['log'].critical(f'[x!] {self.__class__.__name__}.permission 权限异常, 系统自动安排为 3 所有者可用')
+                    send_message(f'"{self.__class__.__name__}.permission" 权限异常, 已分配给所有者', self.params['config']['socket'], self.params['data'])
+                    if user_id != owner_qq_account_uid:
+                        return lambda *args, **kwargs: ...
+                    # 所有者可使用异常等级权限的指令。
+                    return Run.__call(func, self, *args, **kwargs)
+
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def __call(func: 'function', obj: 'Run', *args, **kwargs) -> 'function':
+        """静态私有函数：参数符合声明才运行功能，否则回复用法说明。
+
+        Args:
+            func (function): 被装饰的 `"run(self)"` 函数。
+            obj (Run): 派生子类的实例。
+
+        Returns:
+            function: 返回 `"run(self)"` 的结果。
+        """
+        context: Context = obj.params['context']
+        if context.error is not None:
+            send_message(context.error, obj.params['config']['socket'], obj.params['data'])
+            return lambda *args, **kwargs: ...
+        return func(obj, *args, **kwargs)
+
+
+class Function:
+    """普通父类：实现派生子类功能配置的初始化和自动化。
+    
+    .. Contents::
+        - `"Function.__auto__()"` 类函数，用于自动初始化实参。
+        - `"Function.add()"` 公有成员函数，用于增加新功能。
+        - `"Function.replace()"` 公有成员函数，用于重新加载插件时把一组功能换成新的派生子类。
+        - `"Function.functions()"` 公有成员函数，用于取出 `/help`、`/docs` 等指令读取的功能表快照。
+        - `"Function.load()"` 公有成员函数，用于加载 QQ 聊天的数据，返回本次事件的调度上下文。
+        - `"Function.execute()"` 公有成员函数，用于执行一次具体的派生子类功能。
+    
+    .. Usage::
+    >>> class Admin_QQ_Bot_Function(Function):
+            invoke = '/yyyy'    # 调用方式
+            permission = 1      # 一级权限（大家都可用）
+            description = '(づ｡◕‿‿◕｡)づ'    # 功能描述，可写可不写
+            alias = ('/zzzz',)  # 其它唤起方式，可写可不写
+            arguments = {'target': User, 'count': int}  # 参数声明，可写可不写，解析结果在 params['context'].args
+            # 构造函数无需变动，复制粘贴即可
+            def __init__(self, params: dict, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                super().__auto__(self, **locals())
+                self.run()
+            @Run.authorize()
+            def run(self) -> None:
+                ... # 具体实现的功能
+    """
+
+    # 所有功能表放在同一个字典中，整个进程只有一份，派生子类每次实例化时不必重新创建；
+    # 重新加载时整体换成新的一份，正在遍历旧表的指令不受影响。
+    __tables: dict = {
+        'invoke': dict(),
+        'permission': dict(),
+        'description': dict(),
+        'usage': dict(),
+        'schema': dict(),
+        'trie': Trie()
+    }
+
+    @property
+    def invoke(self) -> dict:
+        """属性：唤起方式到派生子类的字典。"""
+        return self.__tables['invoke']
+
+    @property
+    def permission(self) -> dict:
+        """属性：派生子类名称到权限等级的字典。"""
+        return self.__tables['permission']
+
+    @property
+    def description(self) -> dict:
+        """属性：派生子类名称到简介描述的字典。"""
+        return self.__tables['description']
+
+    @property
+    def usage(self) -> dict:
+        """属性：派生子类名称到用法说明的字典。"""
+        return self.__tables['usage']
+
+    @property
+    def schema(self) -> dict:
+        """属性：派生子类名称到参数模式的字典。"""
+        return self.__tables['schema']
+
+    @property
+    def trie(self) -> Trie:
+        """属性：唤起方式及其别名的前缀树。"""
+        return self.__tables['trie']
+
+    def functions(self) -> dict:
+        """公有成员函数：取出功能表的快照，各表属于同一次登记，之后重新加载插件也不会修改。
+
+        Returns:
+            dict: 返回 `{'invoke': ..., 'permission': ..., 'description': ..., 'usage': ...}`，放入 `params['functions']`。
+        """
+        tables = self.__tables
+        return {key: tables[key] for key in ('invoke', 'permission', 'description', 'usage')}
+
+    @classmethod
+    def __auto__(cls, obj: object, **kwargs) -> None:
+        """类函数：用于自动收集派生子类初始化的实参变量。"""
+        for key, value in kwargs.items():
+            if key not in {'self', 'args', 'kwargs'}:
+                setattr(obj, key, value)
+
+    def add(self, cls: object) -> None:
+        """公有成员函数：增加新功能，只在启动时登记；开始调度之后使用 `"Function.replace()"`。
+
+        Args:
+            cls (object): 派生子类。
+
+        .. Usage::
+        >>> f = Function()
+        >>> f.add(Admin_QQ_Bot_Function)
+        """
+        Function.__register(self.__tables, cls)
+
+    @staticmethod
+    def __register(tables: dict, cls: object) -> None:
+        """静态私有函数：把派生子类登记到功能表中。
+
+        Args:
+            tables (dict): 功能表。
+            cls (object): 派生子类。
+        """
+        # 获取所有派生子类的调用方式。
+        invoke: str | None = cls.__dict__.get('invoke')
+        if invoke:
+            tables['invoke'][invoke] = cls
+            # 唤起方式及其别名都编入前缀树。
+            for prefix in (invoke, *cls.__dict__.get('alias', ())):
+                tables['trie'].insert(prefix, cls)
+        else:
+            print(f'\033[31m[x] "{cls.__name__}" 类缺少静态变量 "invoke" 唤起, 须完善该类的代码\033[0m')
+            print(f'\033[32m[+] e.g.\t{cls.__name__}.invoke = "/{cls.__name__.lower()}"\033[0m')
+            exit(0)
+
+        # 获取所有派生子类的权限等级。
+        permission = cls.__dict__.get('permission')
+        if permission:
+            tables['permission'][cls.__name__] = permission
+        else:
+            print(f'\033[31m[x] "{cls.__name__}" 类缺少静态变量 "permission" 权限, 须完善该类的代码\033[0m')
+            print(f'\033[32m[+] e.g.\t{cls.__name__}.permission = 1\033[0m')
+            exit(0)
+
+        # 获取所有派生子类的简介描述。
+        description = cls.__dict__.get('description')
+        if description:
+            tables['description'][cls.__name__] = description
+        else:
+            tables['description'][cls.__name__] = '开发者很懒 ：）'
+
+        # 编译派生子类声明的参数模式，调度时一次匹配，用法说明也由此生成。
+        arguments: dict | None = cls.__dict__.get('arguments')
+        if arguments:
+            try:
+                tables['schema'][cls.__name__] = Schema(invoke, arguments)
+            except TypeError as e:
+                print(f'\033[31m[x] "{cls.__name__}.arguments" {e}, 须完善该类的代码\033[0m')
+                print(f'\033[32m[+] e.g.\t{cls.__name__}.arguments = {{"target": User, "count": int}}\033[0m')
+                exit(0)
+            tables['usage'][cls.__name__] = tables['schema'][cls.__name__].usage
+
+    def replace(self, old: list, new: list) -> None:
+        """公有成员函数：把一组功能换成新的派生子类，用于重新加载插件。
+
+        先检查新的派生子类，不合法时抛出异常，原来的功能保持不变；之后在功能表的副本上删去新的派生子类不再使用的唤起方式、
+        登记新的派生子类，最后一次换上新的功能表。调度过程中每个指令始终指向旧的或者新的派生子类，不会短暂消失，
+        正在遍历旧表的 `/help`、`/stop` 等指令也不会遇到遍历中途被修改的字典。
+
+        Args:
+            old (list): 原来登记的派生子类（或占位类）。
+            new (list): 新的派生子类。
+
+        Raises:
+            ValueError: 新的派生子类缺少 `invoke` 或者 `permission`。
+            TypeError: 新的派生子类的 `arguments` 无法识别。
+        """
+        for cls in new:
+            if (not cls.__dict__.get('invoke')) or (not cls.__dict__.get('permission')):
+                raise ValueError(f'"{cls.__name__}" 类缺少静态变量 "invoke" 或 "permission"')
+            if cls.__dict__.get('arguments'):
+                Schema(cls.__dict__['invoke'], cls.__dict__['arguments'])
+        tables = {key: dict(value) for key, value in self.__tables.items() if key != 'trie'}
+        tables['trie'] = Trie()
+        prefixes = {prefix for cls in new for prefix in (cls.__dict__['invoke'], *cls.__dict__.get('alias', ()))}
+        names = {cls.__name__ for cls in new}
+        for cls in old:
+            invoke = cls.__dict__.get('invoke')
+            if invoke not in prefixes:
+                tables['invoke'].pop(invoke, None)
+            if cls.__name__ not in names:
+                for key in ('permission', 'description', 'schema', 'usage'):
+                    tables[key].pop(cls.__name__, None)
+        # 前缀树按保留下来的功能重新编入，旧功能不再使用的别名随之消失。
+        replaced = set(old)
+        for cls in tables['invoke'].values():
+            if cls not in replaced:
+                for prefix in (cls.__dict__['invoke'], *cls.__dict__.get('alias', ())):
+                    tables['trie'].insert(prefix, cls)
+        for cls in new:
+            # 参数声明删去时，旧的参数模式随之作废。
+            if not cls.__dict__.get('arguments'):
+                tables['schema'].pop(cls.__name__, None)
+                tables['usage'].pop(cls.__name__, None)
+            Function.__register(tables, cls)
+        Function.__tables = tables
+
+    def load(self, params: dict) -> 'Context | None':
+        """公有成员函数：加载 QQ 聊天的数据，生成本次事件的调度上下文。
+
+        不会修改 `"Function"` 自身以及传入的 `params`，多个事件可以同时加载、执行。
+
+        Args:
+            params (dict): HTTP 路由捕获的数据以及配置参数。
+
+        Returns:
+            Context | None: 返回调度上下文，消息不是在调用指令集则返回空。
+
+        .. Usage::
+        >>> f = Function()
+        >>> f.add(Admin_QQ_Bot_Function)
+        >>> context = f.load(params)
+        """
+        raw_message: str = params['data'].get('raw_message')
+        # 如果有消息。
+        if raw_message:
+            if raw_message[0] == '/':
+                message = unescape(raw_message)
+                match = self.trie.match(message, Function.__boundary)
+                # 如果用户的消息是在调用指令集，则生成本次功能的上下文。
+                if match is not None:
+                    self.__sync()
+                    command, prefix, rest = match
+                    params = dict(params)
+                    params['data'] = dict(params['data'])
+                    params['data']['raw_message'] = message
+                    argument = rest.lstrip()
+                    segments = strip_prefix(Function.__segments(params['data'], raw_message), prefix)
+                    args = error = None
+                    schema: Schema | None = self.schema.get(command.__name__)
+                    if (schema is not None) and argument:
+                        args = schema.parse(segments)
+                        if args is None:
+                            error = f'格式应为 {schema.usage}'
+                    context = Context(
+                        prefix = prefix,
+                        message = message,
+                        command = command,
+                        argument = argument,
+                        params = params,
+                        segments = segments,
+                        args = args,
+                        error = error
+                    )
+                    params['context'] = context
+                    return context
+            elif raw_message.startswith('[CQ:at,') and Function.__mentioned(Function.__segments(params['data'], raw_message)):
+                send_message(
+                    text = f"哈喽，{params['data'].get('sender').get('nickname')}，你好呀！(..＞◡＜..)\n\n我叫 {config['init']['bot_name']}，很高兴为你效劳！\n\n你可以使用 /info 指令查看我的介绍。",
+                    socket = params['config']['socket'],
+                    data = params['data']
+                )
+        # 否则此处加载的数据无效，本次不调用功能。
+        return None
+
+    def __sync(self) -> None:
+        """私有成员函数：其它工作进程修改了共享状态（`"/stop"`、`"/power"` 等）时，刷新本进程的启停状态和权限快照。"""
+        state = shared_state()
+        if state.changed():
+            locks = state.locks()
+            for invoke, cls in list(self.invoke.items()):
+                if invoke in locks:
+                    cls.lock = locks[invoke]
+            Config.reload = True
+
+    @staticmethod
+    def __segments(data: dict, raw_message: str) -> tuple:
+        """静态私有函数：解码消息段，上报的是数组格式的消息时直接使用，否则解析原始消息。
+
+        Args:
+            data (dict): 上报的事件。
+            raw_message (str): 原始消息，未还原实体转义。
+
+        Returns:
+            tuple: 返回 `(Segment, ...)`。
+        """
+        message = data.get('message')
+        if isinstance(message, list):
+            return from_array(message)
+        return parse(raw_message)
+
+    @staticmethod
+    def __mentioned(segments: tuple) -> bool:
+        """静态私有函数：消息是否以 @ 机器人开头。
+
+        Args:
+            segments (tuple): 消息段。
+
+        Returns:
+            bool: 是则返回真。
+        """
+        return bool(segments) and (segments[0].type == 'at') and (segments[0].data.get('qq') == str(config['init']['bot_qq_account_uid']))
+
+    @staticmethod
+    def __boundary(prefix: str, rest: str) -> bool:
+        """静态私有函数：判断最长前缀是否在合法的位置结束。
+
+        中文指令后面可以紧跟参数（例如 `/丢123`），英文指令后面紧跟字母数字则不算调用（例如 `/helpme`）。
+
+        Args:
+            prefix (str): 匹配到的前缀。
+            rest (str): 前缀之后剩余的文本。
+
+        Returns:
+            bool: 合法则返回真。
+        """
+        return not (rest[:1].isascii() and rest[:1].isalnum() and prefix[-1].isascii() and prefix[-1].isalnum())
+
+    def execute(self, context: 'Context | None', executor: 'Executor | None' = None, limiter: 'Limiter | None' = None) -> 'Future | None':
+        """公有成员函数：执行一次具体的派生子类功能。
+
+        Args:
+            context (Context | None): `"Function.load()"` 返回的调度上下文。
+            executor (Executor | None, optional): 功能执行器，默认为空时在当前线程同步执行。
+            limiter (Limiter | None, optional): 准入控制，在 `"@Run.authorize()"` 之前限流，默认为空时不限制。
+
+        Returns:
+            Future | None: 交给执行器时返回任务句柄，否则返回空。
+
+        .. Usage::
+        >>> f = Function()
+        >>> f.add(Admin_QQ_Bot_Function)
+        >>> f.execute(f.load(params), executor, limiter)
+        """
+        # 如果有上下文，则调用指令。
+        if context is not None:
+            if (limiter is not None) and (not Function.__admit(context, limiter)):
+                return None
+            # 各工作进程共享的调用次数，只累加到本进程的字典中，由后台线程写入共享状态。
+            shared_state().count(context.command.__dict__.get('invoke'))
+            if executor is None:
+                context.command(context.params)
+            else:
+                return executor.submit(context.command, context.params)
+        return None
+
+    @staticmethod
+    def __admit(context: 'Context', limiter: 'Limiter') -> bool:
+        """静态私有函数：准入控制，所有者不受限制。
+
+        Args:
+            context (Context): 调度上下文。
+            limiter (Limiter): 准入控制。
+
+        Returns:
+            bool: 放行则返回真。
+        """
+        data: dict = context.params['data']
+        user_id: int = data.get('user_id')
+        if user_id == permission.owner:
+            return True
+        invoke = context.command.__dict__.get('invoke')
+        cost = context.command.__dict__.get('cost', 1)
+        wait = limiter.admit(user_id, data.get('group_id'), invoke, cost)
+        if wait > 0:
+            context.params['config']['log'].warning(f'[!] {user_id} 调用过快 {invoke} 还需等待 {wait:.1f} 秒')
+            # 每个令牌桶的等待窗口内只提示一次，以免刷屏。
+            if limiter.notice(user_id, data.get('group_id'), invoke, cost):
+                send_message(f'[!] "{invoke}" 调用过快, 请 {wait:.1f} 秒后再试.', context.params['config']['socket'], data)
+            return False
+        return True
+
+
+class Help(Function, Run):
+    """派生子类：查看帮助。
+
+    Args:
+        Function (_type_): 继承 `"Function"` 功能父类。
+        Run (_type_): 继承 `"Run"` 抽象父类。
+
+    .. Usage::
+    >>> f.add(Help)
+    """
+    invoke = '/help'    # 使用 /help 唤起。
+    permission = 1      # 大家都可用。
+    description = '(づ｡◕‿‿◕｡)づ'
+
+    def __init__(self, params: dict, *args, **kwargs) -> None:
+        """构造函数：原封不动复制粘贴过来。
+
+        Args:
+            params (dict): 默认参数不要动！
+        """
+        super().__init__(*args, **kwargs)
+        super().__auto__(self, **locals())
+        self.run()
+
+    @Run.authorize()
+    def run(self) -> None:
+        """抽象类 `"Run"` 的派生子类 `"Help"` 必须重写 `"run(self)"` 函数具体实现方法。
+    
+        装饰器 `"@Run.authorize()"` 限制权限。
+        """
+        data: dict = self.params['data']
+        user_id: int = data.get('user_id')
+        text: str = self.params['context'].argument
+
+        if not text:
+            s = set()
+
+            invoke: dict = self.params['functions']['invoke']
+            permission_level: dict = self.params['functions']['permission']
+
+            # 所有者可查看全部指令。
+            if permission.role(user_id) == 'owner':
+                for key, value in invoke.items():
+                    s.add(('[x' if value.lock else '[+') + f' {key}]')
+            # 管理人员和普通用户按权限等级查看，另加被授予特权的指令。
+            else:
+                levels = permission.levels(user_id)
+                for key, value in invoke.items():
+                    if permission_level[value.__name__] in levels:
+                        s.add(('[x' if value.lock else '[+') + f' {key}]')
+                for i in permission.commands(user_id):
+                    if i in invoke:
+                        s.add(('[x' if invoke[i].lock else '[+') + f' {i}]')
+
+            docs = ', '.join(s)
+            docs = docs + '\n\n+ 表示启用  x 表示停用'
+
+            send_message(docs, self.params['config']['socket'], data)
+
+
+class Docs(Function, Run):
+    """派生子类：查看文档。
+
+    Args:
+        Function (_type_): 继承 `"Function"` 功能父类。
+        Run (_type_): 继承 `"Run"` 抽象父类。
+
+    .. Usage::
+    >>> f.add(Docs)
+    """
+    invoke = '/docs'    # 使用 /docs 唤起。
+    permission = 1      # 大家都可用。
+    description = '(づ｡◕‿‿◕｡)づ'
+
+    def __init__(self, params: dict, *args, **kwargs) -> None:
+        """构造函数：原封不动复制粘贴过来。
+
+        Args:
+            params (dict): 默认参数不要动！
+        """
+        super().__init__(*args, **kwargs)
+        super().__auto__(self, **locals())
+        self.run()
+
+    @Run.authorize()
+    def run(self) -> None:
+        """抽象类 `"Run"` 的派生子类 `"Docs"` 必须重写 `"run(self)"` 函数具体实现方法。
+    
+        装饰器 `"@Run.authorize()"` 限制权限。
+        """
+        data: dict = self.params['data']
+        user_id: int = data.get('user_id')
+        text: str = self.params['context'].argument
+
+        if not text:
+            s = set()
+
+            invoke: dict = self.params['functions']['invoke']
+            permission_level: dict = self.params['functions']['permission']
+            description: dict = self.params['functions']['description']
+            usage: dict = self.params['functions'].get('usage', {})
+
+            # 所有者可查看全部指令。
+            if permission.role(user_id) == 'owner':
+                for key, value in invoke.items():
+                    s.add(Docs.__entry(key, value, description, usage))
+            # 管理人员和普通用户按权限等级查看，另加被授予特权的指令。
+            else:
+                levels = permission.levels(user_id)
+                for key, value in invoke.items():
+                    if permission_level[value.__name__] in levels:
+                        s.add(Docs.__entry(key, value, description, usage))
+                for i in permission.commands(user_id):
+                    if i in invoke:
+                        s.add(Docs.__entry(i, invoke[i], description, usage))
+
+            docs = '\n'.join(s)
+
+            send_message(docs, self.params['config']['socket'], data)
+
+    @staticmethod
+    def __entry(key: str, value: type, description: dict, usage: dict) -> str:
+        """静态私有函数：生成一条指令的文档，声明了参数的指令附上由参数模式生成的用法。
+
+        Args:
+            key (str): 指令唤起方式。
+            value (type): 指令对应的派生子类。
+            description (dict): 简介描述。
+            usage (dict): 用法说明。
+
+        Returns:
+            str: 返回文档。
+        """
+        docs = (' [x] 停用 ' if value.lock else ' [+] 启用 ') + key + f'\n\te.g. {description[value.__name__]}'
+        if value.__name__ in usage:
+            docs = docs + f'\n\t格式 {usage[value.__name__]}'
+        return docs
+
+
+class Start(Function, Run):
+    """派生子类：启用功能。
+
+    Args:
+        Function (_type_): 继承 `"Function"` 功能父类。
+        Run (_type_): 继承 `"Run"` 抽象父类。
+
+    .. Usage::
+    >>> f.add(Start)
+    """
+    invoke = '/start'   # 唤起方式
+    permission = 3      # 仅限所有者可用（不建议授权特权者）
+    lane = 'control'    # 控制通道，不会排在重任务之后
+    description = '"/start /x /y" 启用功能'
+
+    def __init__(self, params: dict, *args, **kwargs) -> None:
+        """构造函数：原封不动复制粘贴过来。
+
+        Args:
+            params (dict): 默认参数不要动！
+        """
+        super().__init__(*args, **kwargs)
+        super().__auto__(self, **locals())
+        Start.lock = False      # 该功能类始终保持开启，不可被停用。
+        self.run()
+
+    @Run.authorize()
+    def run(self) -> None:
+        """抽象类 `"Run"` 的派生子类 `"Start"` 必须重写 `"run(self)"` 函数具体实现方法。
+
+        装饰器 `"@Run.authorize()"` 限制权限。
+        """
+        data: dict = self.params['data']
+        text: str = self.params['context'].argument
+
+        instructions = set(text.split())
+        instructions.discard(Start.invoke)
+        instructions.discard(Stop.invoke)
+        invoke: dict = self.params['functions']['invoke']
+        docs = set()
+
+        if instructions:
+            for item in instructions:
+                if item in invoke.keys():
+                    invoke[item].lock = False
+                    shared_state().lock(item, False)
+                    docs.add(f' [+] "{item}" 已启用')
+                else:
+                    docs.add(f' [!] "{item}" 无效指令')
+        else:
+            docs.add('想启用什么指令呀 ( ´◔︎ ‸◔︎`)')
+
+        send_message('\n'.join(docs), self.params['config']['socket'], data)
+        self.params['config']['log'].info(f"[+] {data.get('user_id')} /start {text}")
+
+
+class Stop(Function, Run):
+    """派生子类：停用功能。
+
+    Args:
+        Function (_type_): 继承 `"Function"` 功能父类。
+        Run (_type_): 继承 `"Run"` 抽象父类。
+
+    .. Usage::
+    >>> f.add(Stop)
+    """
+    invoke = '/stop'    # 唤起方式
+    permission = 3      # 仅限所有者可用（不建议授权特权者）
+    lane = 'control'    # 控制通道，不会排在重任务之后
+    description = '"/stop /xx /yy" 停用功能'
+
+    def __init__(self, params: dict, *args, **kwargs) -> None:
+        """构造函数：原封不动复制粘贴过来。
+
+        Args:
+            params (dict): 默认参数不要动！
+        """
+        super().__init__(*args, **kwargs)
+        super().__auto__(self, **locals())
+        Stop.lock = False      # 该功能类始终保持开启，不可被自己本身停用。
+        self.run()
+
+    @Run.authorize()
+    def run(self) -> None:
+        """抽象类 `"Run"` 的派生子类 `"Stop"` 必须重写 `"run(self)"` 函数具体实现方法。
+
+        装饰器 `"@Run.authorize()"` 限制权限。
+        """
+        data: dict = self.params['data']
+        text: str = self.params['context'].argument
+
+        instructions = set(text.split())
+        instructions.discard(Stop.invoke)
+        instructions.discard(Start.invoke)
+        invoke: dict = self.params['functions']['invoke']
+        docs = set()
+
+        if instructions:
+            for item in instructions:
+                if item in invoke.keys():
+                    invoke[item].lock = True
+                    shared_state().lock(item, True)
+                    docs.add(f' [-] "{item}" 已停用')
+                else:
+                    docs.add(f' [!] "{item}" 无效指令')
+        else:
+            docs.add('你想停用哪些指令 ૮₍ ˃ ⤙ ˂ ₎ა')
+
+        send_message('\n'.join(docs), self.params['config']['socket'], data)
+        self.params['config']['log'].info(f"[+] {data.get('user_id')} /stop {text}")
+
+
+class Power(Function, Run):
+    """派生子类：授予特权功能。
+
+    Args:
+        Function (_type_): 继承 `"Function"` 功能父类。
+        Run (_type_): 继承 `"Run"` 抽象父类。
+
+    .. Usage::
+    >>> f.add(Power)
+    """
+    invoke = '/power'   # 唤起方式
+    permission = 3      # 仅限所有者可用（不建议授权特权者）
+    lane = 'control'    # 控制通道，不会排在重任务之后
+    description = '/power @小明 /xxx\n\te.g. /power 2141904 /yyy'
+    arguments = {'who': Users, 'cmd': Command}
+
+    def __init__(self, params: dict, *args, **kwargs) -> None:
+        """构造函数：原封不动复制粘贴过来。
+
+        Args:
+            params (dict): 默认参数不要动！
+        """
+        super().__init__(*args, **kwargs)
+        super().__auto__(self, **locals())
+        self.run()
+
+    @Run.authorize()
+    def run(self) -> None:
+        """抽象类 `"Run"` 的派生子类 `"Power"` 必须重写 `"run(self)"` 函数具体实现方法。
+
+        装饰器 `"@Run.authorize()"` 限制权限。
+        """
+        data: dict = self.params['data']
+        text: str = self.params['context'].argument
+
+        if text:
+            ans: dict = self.params['context'].args
+            invoke: set = set(self.params['functions']['invoke'].keys())
+            # -------------------------------------------------------
+            # 启用、停用、授权三个功能除了所有者，不建议授予其他用户特权。
+            invoke.discard(Start.invoke)
+            invoke.discard(Stop.invoke)
+            invoke.discard(Power.invoke)
+            # -------------------------------------------------------
+            cmd = ans['cmd']
+            if cmd in invoke:
+                s = set()
+                for i in ans['who']:
+                    shared_state().grant(i, cmd)
+                    s.add(i)
+                # 特权以共享状态为准，同时写回文件备查。
+                write_json(shared_state().privilege(), os.path.join(os.getcwd(), 'configs', 'privilege.json'))
+                Config.reload = True
+                docs = '\n'.join(s)
+                send_message(f'[+] "{cmd}" 已为以下用户授权\n{docs}', self.params['config']['socket'], data)
+                self.params['config']['log'].info(f"[+] {data.get('user_id')} {text}")
+            else:
+                send_message(f'"{cmd}" 无效 ╭∩╮( ͡⚆ ͜ʖ ͡⚆)╭∩╮', self.params['config']['socket'], data)
+                self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
+        else:
+            send_message('想给谁授权什么指令？', self.params['config']['socket'], data)
+            self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
+
+
+class Recall(Function, Run):
+    """派生子类：召回特权功能。
+
+    Args:
+        Function (_type_): 继承 `"Function"` 功能父类。
+        Run (_type_): 继承 `"Run"` 抽象父类。
+
+    .. Usage::
+    >>> f.add(Recall)
+    """
+    invoke = '/recall'  # 唤起方式
+    permission = 3      # 仅限所有者可用（不建议授权特权者）
+    lane = 'control'    # 控制通道，不会排在重任务之后
+    description = '/recall @小明 /xxx\n\te.g. /recall 2141904 /yyy'
+    arguments = {'who': Users, 'cmd': Command}
+
+    def __init__(self, params: dict, *args, **kwargs) -> None:
+        """构造函数：原封不动复制粘贴过来。
+
+        Args:
+            params (dict): 默认参数不要动！
+        """
+        super().__init__(*args, **kwargs)
+        super().__auto__(self, **locals())
+        self.run()
+
+    @Run.authorize()
+    def run(self) -> None:
+        """抽象类 `"Run"` 的派生子类 `"Recall"` 必须重写 `"run(self)"` 函数具体实现方法。
+
+        装饰器 `"@Run.authorize()"` 限制权限。
+        """
+        data: dict = self.params['data']
+        text: str = self.params['context'].argument
+        if text:
+            ans: dict = self.params['context'].args
+            invoke: set = set(self.params['functions']['invoke'].keys())
+            # -------------------------------------------------------
+            # 启用、停用、授权三个功能除了所有者，不建议授予其他用户特权。
+            invoke.discard(Start.invoke)
+            invoke.discard(Stop.invoke)
+            invoke.discard(Power.invoke)
+            # -------------------------------------------------------
+            cmd = ans['cmd']
+            if cmd in invoke:
+                s = set()
+                for i in ans['who']:
+                    if shared_state().revoke(i, cmd):
+                        s.add(i)
+                # 特权以共享状态为准，同时写回文件备查。
+                write_json(shared_state().privilege(), os.path.join(os.getcwd(), 'configs', 'privilege.json'))
+                Config.reload = True
+                docs = '\n'.join(s)
+                send_message(f'[-] 取缔以下用户 "{cmd}" 指令\n{docs}', self.params['config']['socket'], data)
+                self.params['config']['log'].info(f"[+] {data.get('user_id')} {text}")
+            else:
+                send_message(f'"{cmd}" 无效 ╭∩╮( ͡⚆ ͜ʖ ͡⚆)╭∩╮', self.params['config']['socket'], data)
+                self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
+        else:
+            send_message('想取消谁的什么指令？', self.params['config']['socket'], data)
+            self.params['config']['log'].warning(f"[+] {data.get('user_id')} {text}")
+
+
+class Reload(Function, Run):
+    """派生子类：不重启地重新加载插件。
+
+    Args:
+        Function (_type_): 继承 `"Function"` 功能父类。
+        Run (_type_): 继承 `"Run"` 抽象父类。
+
+    .. Usage::
+    >>> f.add(Reload)
+    """
+    invoke = '/reload'  # 唤起方式
+    permission = 3      # 仅限所有者可用（不建议授权特权者）
+    lane = 'control'    # 控制通道，不会排在重任务之后
+    description = '"/reload /丢" 重新加载指令所在的插件\n\te.g. /reload utils.functions.default.echo'
+    arguments = {'target': str}
+
+    def __init__(self, params: dict, *args, **kwargs) -> None:
+        """构造函数：原封不动复制粘贴过来。
+
+        Args:
+            params (dict): 默认参数不要动！
+        """
+        super().__init__(*args, **kwargs)
+        super().__auto__(self, **locals())
+        Reload.lock = False     # 该功能类始终保持开启。
+        self.run()
+
+    @Run.authorize()
+    def run(self) -> None:
+        """抽象类 `"Run"` 的派生子类 `"Reload"` 必须重写 `"run(self)"` 函数具体实现方法。
+
+        装饰器 `"@Run.authorize()"` 限制权限。
+        """
+        data: dict = self.params['data']
+        text: str = self.params['context'].argument
+        plugins: 'Registry | None' = self.params['functions'].get('plugins')
+
+        if plugins is None:
+            send_message('没有启用插件注册表 ：）', self.params['config']['socket'], data)
+        elif text:
+            name: str = self.params['context'].args['target']
+            module = plugins.find(name)
+            if module is None:
+                send_message(f' [!] "{name}" 无效插件', self.params['config']['socket'], data)
+            else:
+                try:
+                    invoke = plugins.reload(module)
+                    send_message(f' [+] 已重新加载 {module}\n' + ', '.join(invoke), self.params['config']['socket'], data)
+                    self.params['config']['log'].info(f"[+] {data.get('user_id')} /reload {module}")
+                except Exception as e:
+                    send_message(f' [x] 重新加载 {module} 失败, 原来的功能保持不变\n{e!r}', self.params['config']['socket'], data)
+                    self.params['config']['log'].error(f"[x] {data.get('user_id')} /reload {module} {e!r}")
+        else:
+            send_message('想重新加载哪个插件？', self.params['config']['socket'], data)
\ No newline at end of file
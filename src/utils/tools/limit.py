@@ -0,0 +1,215 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> limit.py
+# Author --> Illusionna
+# Create --> 2024/12/12 20:36:58
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import time
+import threading
+
+
+class TokenBucket:
+    """普通类：令牌桶，按固定速率补充令牌，最多攒满 `capacity` 个。
+
+    本身不加锁，多线程使用时由调用者负责加锁。
+
+    .. Usage::
+    >>> bucket = TokenBucket(rate=1.0, capacity=5)
+    >>> if bucket.consume(1):
+            ...  # 放行
+    """
+    __slots__ = ('rate', 'capacity', 'tokens', 'stamp')
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """构造函数：创建一个装满令牌的桶。
+
+        Args:
+            rate (float): 每秒补充的令牌数。
+            capacity (float): 桶的容量，即允许的突发量。
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.stamp = time.monotonic()
+
+    def refill(self, now: float | None = None) -> float:
+        """公有成员函数：按流逝的时间补充令牌。
+
+        Args:
+            now (float | None, optional): 当前的单调时钟，默认读取 `time.monotonic()`。
+
+        Returns:
+            float: 返回当前令牌数。
+        """
+        now = time.monotonic() if now is None else now
+        if now > self.stamp:
+            self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+        return self.tokens
+
+    def delay(self, cost: float = 1, now: float | None = None) -> float:
+        """公有成员函数：查询还要等多少秒才够 `cost` 个令牌。
+
+        Args:
+            cost (float, optional): 需要的令牌数，默认 1。
+            now (float | None, optional): 当前的单调时钟。
+
+        Returns:
+            float: 返回等待秒数，令牌足够则返回 0。
+        """
+        lack = cost - self.refill(now)
+        if lack <= 0:
+            return 0.0
+        return lack / self.rate if self.rate > 0 else float('inf')
+
+    def consume(self, cost: float = 1, now: float | None = None) -> bool:
+        """公有成员函数：尝试取走 `cost` 个令牌。
+
+        Args:
+            cost (float, optional): 需要的令牌数，默认 1。
+            now (float | None, optional): 当前的单调时钟。
+
+        Returns:
+            bool: 令牌足够并已取走则返回真。
+        """
+        if self.refill(now) >= cost:
+            self.tokens = self.tokens - cost
+            return True
+        return False
+
+
+class Limiter:
+    """普通类：指令的准入控制，按（用户，指令）和（群，指令）两级令牌桶限流。
+
+    .. Contents::
+        - 派生子类可声明静态变量 `cost` 作为单次调用消耗的令牌数（默认 1），例如多帧 GIF 比 `/echo` 更贵。
+        - 令牌桶只在被调用时按需创建，定期清理已经攒满令牌的空闲桶，数万用户也只占用少量内存。
+        - 被拒绝时 `"Limiter.notice()"` 在每个令牌桶的等待窗口内只返回一次真，用于提示调用者，又不至于刷屏。
+
+    .. Usage::
+    >>> limiter = Limiter(user={'rate': 0.2, 'burst': 3}, group={'rate': 1.0, 'burst': 10})
+    >>> wait = limiter.admit(user_id, group_id, '/丢', cost=2)
+    >>> if wait == 0:
+            ...  # 放行
+    >>> elif limiter.notice(user_id, group_id, '/丢', cost=2):
+            ...  # 提示调用者
+    """
+
+    def __init__(self, user: dict | None = None, group: dict | None = None, sweep: float = 60) -> None:
+        """构造函数：设置两级令牌桶的参数。
+
+        Args:
+            user (dict | None, optional): 每个用户每个指令的 `{'rate': 每秒令牌数, 'burst': 容量}`，为空则不限制。
+            group (dict | None, optional): 每个群每个指令的 `{'rate': 每秒令牌数, 'burst': 容量}`，为空则不限制。
+            sweep (float, optional): 清理空闲令牌桶的间隔秒数，默认 60。
+        """
+        self.user = user
+        self.group = group
+        self.sweep = sweep
+        self.__buckets: dict = dict()
+        # 令牌桶键 -> 本次提示的窗口结束时刻
+        self.__notices: dict = dict()
+        self.__lock = threading.Lock()
+        self.__stamp = time.monotonic()
+
+    def admit(self, user_id: int, group_id: int | None, invoke: str, cost: float = 1) -> float:
+        """公有成员函数：判断一次调用能否放行，放行则扣除令牌。
+
+        两级令牌都足够才会同时扣除，被拒绝的调用不消耗任何令牌。
+
+        Args:
+            user_id (int): 用户账号。
+            group_id (int | None): 群号，私聊为空。
+            invoke (str): 指令唤起方式。
+            cost (float, optional): 消耗的令牌数，默认 1。
+
+        Returns:
+            float: 放行则返回 0，否则返回还需等待的秒数。
+        """
+        now = time.monotonic()
+        with self.__lock:
+            if now - self.__stamp > self.sweep:
+                self.__evict(now)
+            buckets = [self.__bucket(key, option) for key, option in self.__keys(user_id, group_id, invoke)]
+            # 单次消耗超过容量的指令按容量计算，否则永远无法放行。
+            wait = max([bucket.delay(min(cost, bucket.capacity), now) for bucket in buckets], default=0.0)
+            if wait == 0:
+                for bucket in buckets:
+                    bucket.consume(min(cost, bucket.capacity), now)
+            return wait
+
+    def notice(self, user_id: int, group_id: int | None, invoke: str, cost: float = 1) -> bool:
+        """公有成员函数：一次调用被拒绝后，判断是否需要提示调用者。
+
+        拒绝这次调用的令牌桶在攒够令牌之前只提示一次，之后再被拒绝则重新提示。
+
+        Args:
+            user_id (int): 用户账号。
+            group_id (int | None): 群号，私聊为空。
+            invoke (str): 指令唤起方式。
+            cost (float, optional): 消耗的令牌数，默认 1。
+
+        Returns:
+            bool: 需要提示则返回真。
+        """
+        now = time.monotonic()
+        with self.__lock:
+            ans = False
+            for key, option in self.__keys(user_id, group_id, invoke):
+                bucket = self.__bucket(key, option)
+                wait = bucket.delay(min(cost, bucket.capacity), now)
+                if (wait > 0) and (self.__notices.get(key, 0) <= now):
+                    self.__notices[key] = now + wait
+                    ans = True
+            return ans
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
+
+    def __keys(self, user_id: int, group_id: int | None, invoke: str) -> list:
+        """私有成员函数：列出一次调用涉及的令牌桶。
+
+        Args:
+            user_id (int): 用户账号。
+            group_id (int | None): 群号，私聊为空。
+            invoke (str): 指令唤起方式。
+
+        Returns:
+            list: 返回 `[(令牌桶键, 令牌桶参数), ...]`。
+        """
+        keys = list()
+        if self.user is not None:
+            keys.append((('user', user_id, invoke), self.user))
+        if (self.group is not None) and (group_id is not None):
+            keys.append((('group', group_id, invoke), self.group))
+        return keys
+
+    def __bucket(self, key: tuple, option: dict) -> TokenBucket:
+        """私有成员函数：取出令牌桶，没有则创建一个装满令牌的桶。
+
+        Args:
+            key (tuple): `(级别, 账号或群号, 指令)`。
+            option (dict): 令牌桶参数。
+
+        Returns:
+            TokenBucket: 返回令牌桶。
+        """
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            bucket = self.__buckets[key] = TokenBucket(option.get('rate', 1.0), option.get('burst', 1))
+        return bucket
+
+    def __evict(self, now: float) -> None:
+        """私有成员函数：清理已经攒满令牌的空闲桶，删除后再次创建的桶与原来等价。
+
+        Args:
+            now (float): 当前的单调时钟。
+        """
+        for key in [key for key, bucket in self.__buckets.items() if bucket.refill(now) >= bucket.capacity]:
+            del self.__buckets[key]
+        for key in [key for key, deadline in self.__notices.items() if deadline <= now]:
+            del self.__notices[key]
+        self.__stamp = now
\ No newline at end of file
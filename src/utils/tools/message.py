@@ -0,0 +1,147 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> message.py
+# Author --> Illusionna
+# Create --> 2024/12/20 20:17:45
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import re
+from dataclasses import dataclass, field
+
+
+# CQ 码：[CQ:类型,键=值,...]
+CQ_PATTERN = re.compile(r'\[CQ:([A-Za-z_]+)((?:,[^,\]]*)*)\]')
+# HTML 实体转义，文本与 CQ 码参数共用。
+ENTITY_PATTERN = re.compile(r'&(?:amp|#91|#93|#44);')
+ENTITIES = {'&amp;': '&', '&#91;': '[', '&#93;': ']', '&#44;': ','}
+
+
+def unescape(text: str) -> str:
+    """普通函数：一次遍历还原 OneBot 的实体转义（`&amp;`、`&#91;`、`&#93;`、`&#44;`）。
+
+    Args:
+        text (str): 转义后的文本。
+
+    Returns:
+        str: 返回原文。
+    """
+    if '&' not in text:
+        return text
+    return ENTITY_PATTERN.sub(lambda match: ENTITIES[match.group()], text)
+
+
+@dataclass(frozen=True)
+class Segment:
+    """普通类：消息段，与 OneBot 数组格式的消息段相同。
+
+    .. Contents::
+        - `"Segment.type"` 类型，例如 `'text'`、`'at'`、`'reply'`、`'image'`、`'face'`，其它类型原样保留。
+        - `"Segment.data"` 参数，文本段为 `{'text': ...}`，at 段为 `{'qq': ...}`，值均为字符串。
+    """
+    type: str
+    data: dict = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        """属性：文本段的内容，其它类型返回空字符串。"""
+        return self.data.get('text', '') if self.type == 'text' else ''
+
+
+def parse(raw: str) -> tuple:
+    """普通函数：一次遍历把 CQ 码格式的消息解码为消息段。
+
+    Args:
+        raw (str): 原始消息（`raw_message`），未还原实体转义。
+
+    Returns:
+        tuple: 返回 `(Segment, ...)`，相邻的文本合并为一段。
+
+    .. Usage::
+    >>> parse('/丢 [CQ:at,qq=2141904,name=小明]')
+    (Segment(type='text', data={'text': '/丢 '}), Segment(type='at', data={'qq': '2141904', 'name': '小明'}))
+    """
+    segments = list()
+    start = 0
+    for match in CQ_PATTERN.finditer(raw):
+        if match.start() > start:
+            segments.append(Segment('text', {'text': unescape(raw[start:match.start()])}))
+        data = dict()
+        for item in match.group(2).split(',')[1:]:
+            key, _, value = item.partition('=')
+            data[key] = unescape(value)
+        segments.append(Segment(match.group(1), data))
+        start = match.end()
+    if start < len(raw):
+        segments.append(Segment('text', {'text': unescape(raw[start:])}))
+    return tuple(segments)
+
+
+def from_array(message: list) -> tuple:
+    """普通函数：直接使用 OneBot 数组格式的消息（`message` 字段），无需解析字符串。
+
+    Args:
+        message (list): `[{'type': ..., 'data': {...}}, ...]`。
+
+    Returns:
+        tuple: 返回 `(Segment, ...)`，参数值统一转为字符串。
+    """
+    return tuple(
+        Segment(item.get('type', ''), {key: str(value) for key, value in (item.get('data') or {}).items()})
+        for item in message if isinstance(item, dict)
+    )
+
+
+def strip_prefix(segments: tuple, prefix: str) -> tuple:
+    """普通函数：去掉消息开头的指令，得到参数部分的消息段，开头的空白一并去掉。
+
+    Args:
+        segments (tuple): 整条消息的消息段。
+        prefix (str): 指令（或别名）。
+
+    Returns:
+        tuple: 返回参数部分的消息段。
+    """
+    if (not segments) or (not segments[0].text.startswith(prefix)):
+        return segments
+    rest = segments[0].text[len(prefix):].lstrip()
+    if rest:
+        return (Segment('text', {'text': rest}),) + segments[1:]
+    return segments[1:]
+
+
+def mentions(segments: tuple) -> list:
+    """普通函数：按出现顺序取出消息段中提到的 QQ 号，包括 @ 和文本中单独的数字，`@全体成员` 除外。
+
+    Args:
+        segments (tuple): 消息段。
+
+    Returns:
+        list: 返回 QQ 号字符串列表。
+
+    .. Usage::
+    >>> mentions(parse('[CQ:at,qq=2141904] 3516515029 /丢'))
+    ['2141904', '3516515029']
+    """
+    ans = list()
+    for segment in segments:
+        if segment.type == 'at':
+            qq = segment.data.get('qq', '')
+            if qq.isdigit():
+                ans.append(qq)
+        elif segment.type == 'text':
+            ans.extend(word for word in segment.text.split() if word.isdigit())
+    return ans
+
+
+def plain(segments: tuple) -> str:
+    """普通函数：拼接文本段，忽略其它类型的消息段。
+
+    Args:
+        segments (tuple): 消息段。
+
+    Returns:
+        str: 返回纯文本。
+    """
+    return ''.join(segment.text for segment in segments)
\ No newline at end of file
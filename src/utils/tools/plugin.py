@@ -0,0 +1,353 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> plugin.py
+# Author --> Illusionna
+# Create --> 2024/12/22 10:36:14
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import ast
+import sys
+import threading
+import importlib
+from . import schema
+from .schema import Type
+
+# 从源码中读取的派生子类静态变量，其余静态变量（例如 GPT 的客户端）等到导入时才执行。
+MANIFEST = ('invoke', 'permission', 'description', 'alias', 'lane', 'cost', 'arguments')
+# `arguments` 中可以引用的类型名称。
+NAMES = {'int': int, 'float': float, 'str': str, **{name: value for name, value in vars(schema).items() if isinstance(value, Type)}}
+
+
+class Lazy:
+    """普通类：尚未导入的派生子类的占位类，由 `"Registry"` 按清单生成。
+
+    .. Contents::
+        - 占位类带有清单中的 `invoke`、`permission`、`description`、`lane`、`cost`、`arguments` 等静态变量，调度、限流、权限、`/help`、`/docs` 与真正的派生子类无异。
+        - 第一次调用时才导入功能所在的模块，之后前缀树中换成真正的派生子类；占位期间 `"/stop"` 设置的启停状态随之转移。
+    """
+    lock = False
+    registry: 'Registry' = None
+    source: tuple = ('', '')
+
+    def __new__(cls, params: dict, *args, **kwargs) -> object:
+        """构造函数：导入真正的派生子类并执行一次功能。
+
+        Args:
+            params (dict): 默认参数不要动！
+
+        Returns:
+            object: 返回真正的派生子类的实例。
+        """
+        return cls.registry.load(cls)(params, *args, **kwargs)
+
+
+class Registry:
+    """普通类：插件注册表，启动时只读取清单，功能模块推迟到第一次调用时再导入，并支持不重启地重新加载。
+
+    .. Contents::
+        - `"Registry.discover()"` 用 `ast` 扫描插件目录的源码，不执行任何模块，收集声明了 `invoke` 的类作为清单，并以占位类加入 `"Function"`。
+        - 无法从源码静态读取的静态变量（例如拼接出来的 `description`）的功能，在启动时直接导入。
+        - `"Registry.load()"` 第一次调用某个功能时导入其所在的模块，同一模块中的其它功能一并换成真正的派生子类。
+        - `"Registry.warm()"` 预先导入指定的功能（按唤起方式或模块名），例如常用的表情功能。
+        - `"Registry.reload()"` 重新导入一个模块，其中的功能一次换成新的派生子类，启停状态保留，其它模块及其缓存不受影响；模块可定义 `__reload__()`，重新导入后调用。
+        - `"Registry.watch()"` 后台线程按修改时间监视插件目录，源码改动后自动重新加载。
+        - 模块导入失败（例如缺少 `openai`）只影响该模块的功能，下一次调用时重试，不影响机器人启动。
+
+    .. Usage::
+    >>> plugins = Registry(f, os.path.join('utils', 'functions'))
+    >>> plugins.discover()
+    >>> plugins.warm(['/丢', 'utils.functions.default.echo'])
+    >>> plugins.reload('/丢')
+    """
+
+    def __init__(self, function: 'Function', directory: str) -> None:
+        """构造函数：创建注册表。
+
+        Args:
+            function (Function): 功能父类的实例，占位类和真正的派生子类都加入其中。
+            directory (str): 插件目录，相对于工作目录，模块名由路径推出。
+        """
+        self.function = function
+        self.directory = directory
+        self.package = os.path.normpath(directory).replace(os.sep, '.')
+        # 模块名 -> (类名, ...)
+        self.modules: dict = dict()
+        # (模块名, 类名) -> 当前登记的类（占位类或者真正的派生子类）
+        self.__classes: dict = dict()
+        self.__lock = threading.RLock()
+        self.__event = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def discover(self) -> int:
+        """公有成员函数：扫描插件目录，登记清单中的功能。
+
+        Returns:
+            int: 返回登记的功能数量。
+        """
+        count = 0
+        eager = list()
+        for path in self.__files():
+            module = self.__module(path)
+            entries = Registry.__manifest(path)
+            if not entries:
+                continue
+            count = count + len(entries)
+            self.modules[module] = tuple(name for name, _, _ in entries)
+            if all(static for _, _, static in entries):
+                for name, manifest, _ in entries:
+                    stub = type(name, (Lazy,), {**manifest, 'registry': self, 'source': (module, name), '__module__': module})
+                    self.__classes[(module, name)] = stub
+                    self.function.add(stub)
+            else:
+                eager.append(module)
+        for module in eager:
+            self.__import(module)
+        return count
+
+    def load(self, stub: type) -> type:
+        """公有成员函数：取出占位类对应的真正的派生子类，第一次时导入其所在的模块。
+
+        Args:
+            stub (type): 占位类。
+
+        Returns:
+            type: 返回真正的派生子类。
+        """
+        real = self.__classes.get(stub.source)
+        if (real is None) or issubclass(real, Lazy):
+            with self.__lock:
+                self.__import(stub.source[0])
+                real = self.__classes[stub.source]
+        return real
+
+    def warm(self, names: list) -> None:
+        """公有成员函数：预先导入功能，导入失败的功能留到第一次调用时重试。
+
+        Args:
+            names (list): 唤起方式或者模块名，`'*'` 表示全部。
+        """
+        for module, classes in list(self.modules.items()):
+            if ('*' in names) or (module in names) or any(self.__classes[(module, name)].__dict__.get('invoke') in names for name in classes):
+                try:
+                    with self.__lock:
+                        self.__import(module)
+                except Exception:
+                    pass
+
+    def loaded(self, module: str) -> bool:
+        """公有成员函数：查询模块是否已经导入。
+
+        Args:
+            module (str): 模块名。
+
+        Returns:
+            bool: 已导入则返回真。
+        """
+        return all(not issubclass(self.__classes[(module, name)], Lazy) for name in self.modules.get(module, ()))
+
+    def find(self, name: str) -> str | None:
+        """公有成员函数：查找功能所在的模块。
+
+        Args:
+            name (str): 唤起方式（或别名），或者插件目录下的模块名。
+
+        Returns:
+            str | None: 返回模块名，找不到则返回空。
+        """
+        if name.startswith('/'):
+            match = self.function.trie.match(name)
+            if (match is None) or (match[1] != name):
+                return None
+            cls = match[0]
+            return cls.source[0] if issubclass(cls, Lazy) else cls.__module__
+        if (name in self.modules) or (name.startswith(self.package + '.') and (name in sys.modules)):
+            return name
+        return None
+
+    def reload(self, module: str) -> list:
+        """公有成员函数：重新导入模块，把其中的功能一次换成新的派生子类。
+
+        新增的功能随之登记，删去的功能随之注销，启停状态按类名保留。没有功能的辅助模块（例如效果表）只重新导入，
+        引用它的插件模块需要再重新加载一次。新的派生子类不合法时保留原来的功能，抛出异常。
+
+        Args:
+            module (str): 模块名，可由 `"Registry.find()"` 取得。
+
+        Returns:
+            list: 返回重新登记的唤起方式。
+        """
+        with self.__lock:
+            path = os.path.join(*module.split('.')) + '.py'
+            entries = Registry.__manifest(path) if os.path.exists(path) else []
+            imported = sys.modules.get(module)
+            imported = importlib.import_module(module) if imported is None else importlib.reload(imported)
+            names = tuple(name for name, _, _ in entries)
+            new = [getattr(imported, name) for name in names]
+            old = [self.__classes[(module, name)] for name in self.modules.get(module, ())]
+            previous = {cls.__name__: cls for cls in old}
+            # 重新导入后类变量回到源码中的值，启停状态按类名从旧的类上转移过来。
+            for cls in new:
+                if cls.__name__ in previous:
+                    cls.lock = previous[cls.__name__].lock
+            self.function.replace(old, new)
+            for name in self.modules.get(module, ()):
+                self.__classes.pop((module, name), None)
+            for cls in new:
+                self.__classes[(module, cls.__name__)] = cls
+            if names:
+                self.modules[module] = names
+            else:
+                self.modules.pop(module, None)
+            hook = getattr(imported, '__reload__', None)
+            if callable(hook):
+                hook()
+            return [cls.__dict__.get('invoke') for cls in new]
+
+    def watch(self, interval: float = 2, log: 'logging.Logger | None' = None) -> None:
+        """公有成员函数：启动后台线程监视插件目录，重复调用无效。
+
+        插件模块改动后重新加载该模块；辅助模块改动后重新导入它，再重新加载同一目录下已经导入的插件模块；新增的插件模块随之登记。
+
+        Args:
+            interval (float, optional): 检查修改时间的间隔秒数，默认 2。
+            log (logging.Logger | None, optional): 日志对象。
+        """
+        if (self.__thread is not None) and self.__thread.is_alive():
+            return
+        self.__event.clear()
+        self.__thread = threading.Thread(target=self.__loop, args=(interval, log), name='iQQbot-plugin', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """公有成员函数：停止监视线程。"""
+        self.__event.set()
+
+    def __loop(self, interval: float, log: 'logging.Logger | None') -> None:
+        """私有成员函数：后台线程，按修改时间检查插件目录。
+
+        Args:
+            interval (float): 检查间隔秒数。
+            log (logging.Logger | None): 日志对象。
+        """
+        stamps = self.__stamps()
+        while not self.__event.wait(interval):
+            current = self.__stamps()
+            changed = [path for path, stamp in current.items() if stamps.get(path) != stamp]
+            stamps = current
+            for path in changed:
+                module = self.__module(path)
+                # 没有导入过、也不是插件的模块无需处理。
+                if (module not in self.modules) and (module not in sys.modules) and (not Registry.__manifest(path)):
+                    continue
+                targets = [module]
+                if (module in sys.modules) and (module not in self.modules):
+                    package = module.rpartition('.')[0]
+                    targets.extend(i for i in self.modules if (i.rpartition('.')[0] == package) and (i in sys.modules))
+                for target in targets:
+                    try:
+                        invoke = self.reload(target)
+                        if log is not None:
+                            log.info(f'[+] 重新加载 {target} {" ".join(invoke)}')
+                    except Exception as e:
+                        if log is not None:
+                            log.error(f'[x] 重新加载 {target} 失败 {e!r}')
+
+    def __files(self) -> list:
+        """私有成员函数：列出插件目录下的源码文件。"""
+        ans = list()
+        for root, dirs, files in os.walk(self.directory):
+            dirs[:] = sorted(i for i in dirs if i != '__pycache__')
+            ans.extend(os.path.join(root, file) for file in sorted(files) if file.endswith('.py') and (file != '__init__.py'))
+        return ans
+
+    def __stamps(self) -> dict:
+        """私有成员函数：源码文件的修改时间。"""
+        ans = dict()
+        for path in self.__files():
+            try:
+                ans[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+        return ans
+
+    def __module(self, path: str) -> str:
+        """私有成员函数：由源码路径推出模块名。"""
+        return os.path.splitext(os.path.relpath(path, os.getcwd()))[0].replace(os.sep, '.')
+
+    def __import(self, module: str) -> None:
+        """私有成员函数：导入模块，把其中的占位类全部换成真正的派生子类。
+
+        Args:
+            module (str): 模块名。
+        """
+        if self.loaded(module):
+            return
+        imported = importlib.import_module(module)
+        stubs = [self.__classes[(module, name)] for name in self.modules[module] if (module, name) in self.__classes]
+        reals = [getattr(imported, name) for name in self.modules[module]]
+        for stub, real in zip(stubs, reals):
+            # 占位期间被 "/stop" 停用的功能保持停用。
+            if stub.lock:
+                real.lock = True
+        if stubs:
+            # 调度已经开始，一次换上新的功能表。
+            self.function.replace(stubs, reals)
+        else:
+            # 启动时直接导入的模块还没有登记过。
+            for real in reals:
+                self.function.add(real)
+        for real in reals:
+            self.__classes[(module, real.__name__)] = real
+
+    @staticmethod
+    def __manifest(path: str) -> list:
+        """静态私有函数：从源码中读取顶层类的清单。
+
+        Args:
+            path (str): 源码路径。
+
+        Returns:
+            list: 返回 `[(类名, 静态变量字典, 是否全部静态可读), ...]`，只包括声明了 `invoke` 的类。
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        # 没有 invoke 的模块（绘制、缓存等辅助模块）不必解析。
+        if 'invoke' not in source:
+            return []
+        ans = list()
+        for node in ast.parse(source).body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            manifest = dict()
+            static = True
+            invoke = False
+            for item in node.body:
+                if (not isinstance(item, ast.Assign)) or (len(item.targets) != 1) or (not isinstance(item.targets[0], ast.Name)):
+                    continue
+                key = item.targets[0].id
+                if key not in MANIFEST:
+                    continue
+                invoke = invoke or (key == 'invoke')
+                try:
+                    manifest[key] = Registry.__literal(item.value)
+                except ValueError:
+                    static = False
+            if invoke:
+                ans.append((node.name, manifest, static))
+        return ans
+
+    @staticmethod
+    def __literal(node: ast.AST) -> object:
+        """静态私有函数：计算常量表达式，`arguments` 中的类型名称按 `"NAMES"` 取值。
+
+        Raises:
+            ValueError: 不是常量表达式。
+        """
+        if isinstance(node, ast.Name) and (node.id in NAMES):
+            return NAMES[node.id]
+        if isinstance(node, ast.Dict):
+            return {Registry.__literal(key): Registry.__literal(value) for key, value in zip(node.keys, node.values)}
+        return ast.literal_eval(node)
\ No newline at end of file
@@ -0,0 +1,143 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> schema.py
+# Author --> Illusionna
+# Create --> 2024/12/21 16:08:52
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import re
+
+
+class Type:
+    """普通类：参数类型，把一个单词（文本中以空白分隔的部分）或者一个 @ 转换为参数值。
+
+    .. Contents::
+        - `"Type.label"` 用法说明中显示的类型名称。
+        - `"Type.pattern"` 预先编译的正则，单词须完整匹配，为空则接受任意单词。
+        - `"Type.mention"` 是否接受 @（`@全体成员` 除外）。
+        - `"Type.many"` 是否连续接受一个或多个值，结果为列表。
+    """
+    __slots__ = ('label', 'pattern', 'convert', 'mention', 'many')
+
+    def __init__(self, label: str, pattern: str | None = None, convert: 'function' = str, mention: bool = False, many: bool = False) -> None:
+        """构造函数：创建参数类型。
+
+        Args:
+            label (str): 类型名称。
+            pattern (str | None, optional): 单词须完整匹配的正则，默认为空时接受任意单词。
+            convert (function, optional): 把单词转换为参数值，默认 `str`。
+            mention (bool, optional): 是否接受 @，参数值为 QQ 号字符串，默认否。
+            many (bool, optional): 是否接受一个或多个值，默认否。
+        """
+        self.label = label
+        self.pattern = None if pattern is None else re.compile(pattern)
+        self.convert = convert
+        self.mention = mention
+        self.many = many
+
+    def accept(self, kind: str, value: str) -> object | None:
+        """公有成员函数：转换一个单词或者 @。
+
+        Args:
+            kind (str): `'word'` 或者 `'at'`。
+            value (str): 单词，或者 @ 到的 QQ 号。
+
+        Returns:
+            object | None: 返回参数值，不符合类型则返回空。
+        """
+        if kind == 'at':
+            return value if self.mention and value.isdigit() else None
+        if (self.pattern is not None) and (self.pattern.fullmatch(value) is None):
+            return None
+        return self.convert(value)
+
+
+Integer = Type('整数', r'-?\d+', int)
+Float = Type('小数', r'-?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?', float)
+Word = Type('文本')
+User = Type('用户', r'\d+', mention=True)
+Users = Type('用户...', r'\d+', mention=True, many=True)
+Command = Type('指令', r'/\w+')
+
+# 可以直接用内置类型声明参数。
+TYPES = {int: Integer, float: Float, str: Word}
+
+
+class Schema:
+    """普通类：编译后的参数模式，由 `"Function.add()"` 按派生子类的 `arguments` 生成，每个指令只编译一次。
+
+    .. Contents::
+        - 参数按声明的顺序依次匹配，文本按空白切分为单词，@ 单独作为一个值，回复、图片、表情等其它消息段忽略。
+        - 所有参数都须匹配，且不能有多余的单词或者 @，否则 `"Schema.parse()"` 返回空。
+        - `"Schema.usage"` 由同一份声明生成的用法说明，用于格式错误的提示和 `/docs`。
+
+    .. Usage::
+    >>> schema = Schema('/num', {'low': float, 'high': float})
+    >>> schema.usage
+    '/num <low:小数> <high:小数>'
+    >>> schema.parse(context.segments)
+    {'low': 2.71828, 'high': 3.1415}
+    """
+    __slots__ = ('fields', 'usage')
+
+    def __init__(self, invoke: str, arguments: dict) -> None:
+        """构造函数：编译参数模式。
+
+        Args:
+            invoke (str): 指令唤起方式，用于用法说明。
+            arguments (dict): 参数名称到类型的有序映射，类型为 `"Type"` 或者 `int`、`float`、`str`。
+
+        Raises:
+            TypeError: 有无法识别的类型。
+        """
+        fields = list()
+        for name, kind in arguments.items():
+            kind = TYPES.get(kind, kind)
+            if not isinstance(kind, Type):
+                raise TypeError(f'参数 "{name}" 的类型 {kind!r} 无法识别')
+            fields.append((name, kind))
+        self.fields: tuple = tuple(fields)
+        self.usage: str = ' '.join([invoke] + [f'<{name}:{kind.label}>' for name, kind in self.fields])
+
+    def parse(self, segments: tuple) -> dict | None:
+        """公有成员函数：按参数模式一次匹配消息段。
+
+        Args:
+            segments (tuple): 参数部分的消息段。
+
+        Returns:
+            dict | None: 返回参数名称到参数值的字典，不符合模式则返回空。
+        """
+        tokens = Schema.__tokens(segments)
+        ans = dict()
+        index = 0
+        for name, kind in self.fields:
+            if index >= len(tokens):
+                return None
+            value = kind.accept(*tokens[index])
+            if value is None:
+                return None
+            index = index + 1
+            if kind.many:
+                value = [value]
+                while index < len(tokens):
+                    more = kind.accept(*tokens[index])
+                    if more is None:
+                        break
+                    value.append(more)
+                    index = index + 1
+            ans[name] = value
+        return ans if index == len(tokens) else None
+
+    @staticmethod
+    def __tokens(segments: tuple) -> list:
+        """静态私有函数：把消息段切分为 `(类型, 值)` 列表，类型为 `'word'` 或者 `'at'`。"""
+        tokens = list()
+        for segment in segments:
+            if segment.type == 'text':
+                tokens.extend(('word', word) for word in segment.text.split())
+            elif segment.type == 'at':
+                tokens.append(('at', segment.data.get('qq', '')))
+        return tokens
\ No newline at end of file
@@ -1,33 +1,335 @@
-'''
-# System --> Windows & Python3.10.0
-# File ----> send.py
-# Author --> Illusionna
-# Create --> 2024/11/28 14:59:31
-'''
-# -*- Encoding: UTF-8 -*-
-
-
-import requests
-
-
-def send_message(text: str, socket: str, data: dict, timeout: int = 5) -> None:
-    """普通函数：机器人给调用者发送消息。
-
-    Args:
-        text (str): 发送的文本。
-        socket (str): QQ 机器人 HTTP 服务监听套接字。
-        data (dict): 默认数据包，不可变动！
-        timeout (int, optional): 超时处理，默认 5 秒。
-    """
-    user_id: int = data.get('user_id')
-    group_id: int | None = data.get('group_id')
-    message_id: int = data.get('message_id')
-    url = f'http://{socket}'
-    msg = {'message': f'[CQ:reply,id={message_id}]{text}'}
-    if group_id is not None:
-        url = url + '/send_group_msg'
-        msg.update({'group_id': group_id})
-    else:
-        url = url + '/send_private_msg'
-        msg.update({'user_id': user_id})
-    requests.post(url, json=msg, timeout=timeout)
\ No newline at end of file
+'''
+# System --> Windows & Python3.10.0
+# File ----> send.py
+# Author --> Illusionna
+# Create --> 2024/11/28 14:59:31
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from contextvars import ContextVar
+from . import log_colour
+from .limit import TokenBucket
+from .client import client
+from .read import read_json
+
+
+class Reply:
+    """普通类：本次事件的快速操作回复（OneBot v11 quick operation）。
+
+    在 `with` 语句内派生子类调用 `"send_message()"` 的第一条消息会暂存下来，
+    由 HTTP 上报接口直接在响应体中回复，省去一次调用 HTTP API 的往返；
+    第二条消息或者上报接口已经应答后才发出的消息，仍然通过 HTTP API 发送。
+
+    .. Usage::
+    >>> with Reply(data) as reply:
+            future = f.execute(f.load(params), executor)
+    >>> ...  # 等待 future 一小段时间
+    >>> text = reply.close()
+    >>> return reply.operation(text) if text else 'OK'
+    """
+    # 当前上下文中的快速回复，线程池通过 contextvars 继承。
+    current: ContextVar['Reply | None'] = ContextVar('reply', default=None)
+
+    def __init__(self, data: dict) -> None:
+        """构造函数：绑定本次事件。
+
+        Args:
+            data (dict): 默认数据包，不可变动！
+        """
+        self.data = data
+        self.__lock = threading.Lock()
+        self.__text: str | None = None
+        self.__open = True
+        self.__token = None
+
+    def __enter__(self) -> 'Reply':
+        self.__token = Reply.current.set(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        Reply.current.reset(self.__token)
+
+    def match(self, data: dict) -> bool:
+        """公有成员函数：判断数据包是否属于本次事件。
+
+        Args:
+            data (dict): 默认数据包。
+
+        Returns:
+            bool: 属于本次事件则返回真。
+        """
+        return (data is self.data) or (data.get('message_id') == self.data.get('message_id'))
+
+    def send(self, text: str, socket: str) -> None:
+        """公有成员函数：发送一条消息。
+
+        Args:
+            text (str): 发送的文本。
+            socket (str): QQ 机器人 HTTP 服务监听套接字。
+        """
+        with self.__lock:
+            if self.__open and (self.__text is None):
+                # 第一条消息暂存，等待上报接口直接回复。
+                self.__text = text
+                return
+            # 第二条消息到来时先补发暂存的消息，保证消息顺序。
+            pending, self.__text, self.__open = self.__text, None, False
+        if pending is not None:
+            post_message(pending, socket, self.data)
+        post_message(text, socket, self.data)
+
+    def close(self) -> str | None:
+        """公有成员函数：上报接口即将应答，之后的消息都通过 HTTP API 发送。
+
+        Returns:
+            str | None: 返回暂存的消息，没有则返回空。
+        """
+        with self.__lock:
+            self.__open = False
+            text, self.__text = self.__text, None
+        return text
+
+    def operation(self, text: str) -> dict:
+        """公有成员函数：生成快速操作的响应体。
+
+        Args:
+            text (str): 回复的文本。
+
+        Returns:
+            dict: 返回快速操作字典。
+        """
+        return {
+            'reply': f"[CQ:reply,id={self.data.get('message_id')}]{text}",
+            'auto_escape': False,
+            'at_sender': False
+        }
+
+
+class Outbox:
+    """普通类：异步的发送队列，按群或私聊对象整形流量并合并消息。
+
+    .. Contents::
+        - 每个群（或私聊用户）一个令牌桶，超出速率的消息留在队列中等待，而不是发出去被 QQ 限流丢弃。
+        - 同一对象在 `window` 秒内排队、回复同一条消息的多条消息合并为一条发送，回复不同消息的留到下一个令牌再发，
+          避免把其他人的回答挂在第一个人的消息下面；群聊排队达到 `forward` 条则全部打包为合并转发消息（不带回复）。
+        - 发送失败时记录对象和丢失的消息数量。
+        - `"Outbox.depth()"` 查询队列中待发送的消息数量。
+
+    .. Usage::
+    >>> box = outbox()
+    >>> box.put(text, socket, data)
+    >>> box.depth()
+    """
+
+    def __init__(self, rate: float = 1.0, burst: float = 5, window: float = 0.2, forward: int = 5, name: str = '', uin: int | str = 0, log: logging.Logger | None = None) -> None:
+        """构造函数：启动后台发送线程。
+
+        Args:
+            rate (float, optional): 每个对象每秒发送的消息数，默认 1。
+            burst (float, optional): 每个对象允许的突发消息数，默认 5。
+            window (float, optional): 合并消息的等待窗口秒数，默认 0.2。
+            forward (int, optional): 群聊合并条数达到该值时改用合并转发，默认 5，为 0 则不使用。
+            name (str, optional): 合并转发消息中显示的机器人昵称。
+            uin (int | str, optional): 合并转发消息中显示的机器人账号。
+            log (logging.Logger | None, optional): 记录发送失败的日志对象。
+        """
+        self.rate = rate
+        self.burst = burst
+        self.window = window
+        self.forward = forward
+        self.name = name
+        self.uin = uin
+        self.log = log
+        self.__queues: dict = dict()
+        self.__buckets: dict = dict()
+        self.__depth = 0
+        self.__condition = threading.Condition()
+        self.__thread = threading.Thread(target=self.__loop, name='iQQbot-outbox', daemon=True)
+        self.__thread.start()
+
+    def put(self, text: str, socket: str, data: dict) -> None:
+        """公有成员函数：消息入队。
+
+        Args:
+            text (str): 发送的文本。
+            socket (str): QQ 机器人 HTTP 服务监听套接字。
+            data (dict): 默认数据包，不可变动！
+        """
+        group_id: int | None = data.get('group_id')
+        key = ('group', group_id) if group_id is not None else ('private', data.get('user_id'))
+        with self.__condition:
+            self.__queues.setdefault(key, deque()).append((time.monotonic(), text, socket, data))
+            self.__depth = self.__depth + 1
+            self.__condition.notify()
+
+    def depth(self) -> int:
+        """公有成员函数：查询队列中待发送的消息数量。
+
+        Returns:
+            int: 返回消息数量。
+        """
+        return self.__depth
+
+    def __loop(self) -> None:
+        """私有成员函数：后台线程，取出到期且有令牌的消息批量发送。"""
+        while True:
+            ready = list()
+            with self.__condition:
+                while not self.__queues:
+                    # 顺便清理长期空闲（已攒满令牌）的令牌桶。
+                    for key in [key for key, bucket in self.__buckets.items() if bucket.refill() >= bucket.capacity]:
+                        del self.__buckets[key]
+                    self.__condition.wait()
+                now = time.monotonic()
+                wait = None
+                for key, queue in list(self.__queues.items()):
+                    # 第一条消息入队后等待一个窗口，以便合并后续消息。
+                    delay = queue[0][0] + self.window - now
+                    if delay <= 0:
+                        bucket = self.__buckets.get(key)
+                        if bucket is None:
+                            bucket = self.__buckets[key] = TokenBucket(self.rate, self.burst)
+                        delay = bucket.delay(1, now)
+                        if delay <= 0:
+                            bucket.consume(1, now)
+                            batch = self.__take(key, queue)
+                            ready.append((key, batch))
+                            self.__depth = self.__depth - len(batch)
+                            if queue:
+                                # 剩下的消息回复的是其它消息，等下一个令牌。
+                                delay = bucket.delay(1, now)
+                                wait = delay if wait is None else min(wait, delay)
+                            else:
+                                del self.__queues[key]
+                            continue
+                    wait = delay if wait is None else min(wait, delay)
+                if not ready:
+                    self.__condition.wait(wait)
+                    continue
+            for key, batch in ready:
+                try:
+                    self.__flush(key, batch)
+                except Exception as e:
+                    if self.log is not None:
+                        self.log.error(f'[x] 发送给 {key[0]} {key[1]} 失败，丢失 {len(batch)} 条消息 {e!r}')
+
+    def __take(self, key: tuple, queue: deque) -> list:
+        """私有成员函数：从队列头部取出一批可以一起发送的消息，调用者须持有条件变量。
+
+        Args:
+            key (tuple): `('group', group_id)` 或者 `('private', user_id)`。
+            queue (deque): 该对象的消息队列。
+
+        Returns:
+            list: 返回消息列表，群聊达到合并转发条数时为全部消息，否则为回复同一条消息的连续消息。
+        """
+        if (key[0] == 'group') and (self.forward > 0) and (len(queue) >= self.forward):
+            batch = list(queue)
+            queue.clear()
+            return batch
+        message_id = queue[0][3].get('message_id')
+        batch = list()
+        while queue and (queue[0][3].get('message_id') == message_id):
+            batch.append(queue.popleft())
+        return batch
+
+    def __flush(self, key: tuple, batch: list) -> None:
+        """私有成员函数：发送同一对象的一批消息。
+
+        Args:
+            key (tuple): `('group', group_id)` 或者 `('private', user_id)`。
+            batch (list): 消息列表。
+        """
+        _, text, socket, data = batch[0]
+        if len(batch) == 1:
+            deliver_message(text, socket, data)
+        elif (key[0] == 'group') and (self.forward > 0) and (len(batch) >= self.forward):
+            nodes = [{'type': 'node', 'data': {'name': self.name, 'uin': self.uin, 'content': item[1]}} for item in batch]
+            client(socket).call_api('send_group_forward_msg', group_id=key[1], messages=nodes)
+        else:
+            deliver_message('\n'.join(item[1] for item in batch), socket, data)
+
+
+# 每个进程一个发送队列。
+_outboxes: dict = dict()
+_lock = threading.Lock()
+
+
+def outbox() -> Outbox | None:
+    """普通函数：获取当前进程的发送队列，参数读取 `configs/init.json` 的 `send_queue` 配置。
+
+    Returns:
+        Outbox | None: 返回发送队列，未开启则返回空。
+    """
+    pid = os.getpid()
+    if pid not in _outboxes:
+        with _lock:
+            if pid not in _outboxes:
+                service = read_json(os.path.join(os.getcwd(), 'configs', 'init.json'))
+                option: dict | None = service.get('send_queue')
+                _outboxes[pid] = None if not option else Outbox(
+                    rate = option.get('rate', 1.0),
+                    burst = option.get('burst', 5),
+                    window = option.get('window', 0.2),
+                    forward = option.get('forward', 5),
+                    name = service.get('bot_name', ''),
+                    uin = service.get('bot_qq_account_uid', 0),
+                    log = logging.getLogger(log_colour.__name__)
+                )
+    return _outboxes[pid]
+
+
+def deliver_message(text: str, socket: str, data: dict) -> None:
+    """普通函数：立即调用 HTTP API 给调用者发送消息。
+
+    Args:
+        text (str): 发送的文本。
+        socket (str): QQ 机器人 HTTP 服务监听套接字。
+        data (dict): 默认数据包，不可变动！
+    """
+    user_id: int = data.get('user_id')
+    group_id: int | None = data.get('group_id')
+    message_id: int = data.get('message_id')
+    msg = {'message': f'[CQ:reply,id={message_id}]{text}'}
+    if group_id is not None:
+        client(socket).call_api('send_group_msg', group_id=group_id, **msg)
+    else:
+        client(socket).call_api('send_private_msg', user_id=user_id, **msg)
+
+
+def post_message(text: str, socket: str, data: dict) -> None:
+    """普通函数：通过 HTTP API 给调用者发送消息，开启发送队列时先入队；超时读取 `configs/init.json` 的 `http_timeouts` 配置。
+
+    Args:
+        text (str): 发送的文本。
+        socket (str): QQ 机器人 HTTP 服务监听套接字。
+        data (dict): 默认数据包，不可变动！
+    """
+    box = outbox()
+    if box is None:
+        deliver_message(text, socket, data)
+    else:
+        box.put(text, socket, data)
+
+
+def send_message(text: str, socket: str, data: dict) -> None:
+    """普通函数：机器人给调用者发送消息。
+
+    处于 `"Reply"` 上下文时优先作为快速操作回复，否则调用 HTTP API 发送。
+
+    Args:
+        text (str): 发送的文本。
+        socket (str): QQ 机器人 HTTP 服务监听套接字。
+        data (dict): 默认数据包，不可变动！
+    """
+    reply = Reply.current.get()
+    if (reply is not None) and reply.match(data):
+        reply.send(text, socket)
+    else:
+        post_message(text, socket, data)
\ No newline at end of file
@@ -0,0 +1,369 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> state.py
+# Author --> Illusionna
+# Create --> 2024/12/23 21:14:06
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+import os
+import sqlite3
+import threading
+import contextlib
+from abc import ABCMeta, abstractmethod
+from .read import read_json
+
+
+class State(metaclass=ABCMeta):
+    """抽象类：各工作进程共享的指令状态，包括启停状态、特权和计数器。
+
+    Args:
+        metaclass (_type_, optional): `"State"` 由 "`ABCMeta`" 抽象基元类派生。
+
+    .. Contents::
+        - `"State.locks()"`、`"State.lock()"` 指令的启停状态，`"/start"`、`"/stop"` 写入。
+        - `"State.privilege()"`、`"State.grant()"`、`"State.revoke()"` 特权者账号到指令的授权，`"/power"`、`"/recall"` 写入。
+        - `"State.count()"`、`"State.counters()"` 累加计数器，例如各指令的调用次数；`"State.count()"` 每次调度都会调用，只记在本进程内，由派生子类择机写入存储。
+        - `"State.changed()"` 其它工作进程修改了启停状态或特权时返回真，每次调度前调用，开销须足够小。
+        - 派生子类实现具体的存储方式，由配置 `shared_state.backend` 选择，见 `"shared_state()"`。
+    """
+
+    @abstractmethod
+    def locks(self) -> dict:
+        """纯虚函数：查询所有指令的启停状态。
+
+        Returns:
+            dict: 返回唤起方式到是否停用的字典。
+        """
+        pass
+
+    @abstractmethod
+    def lock(self, invoke: str, value: bool) -> None:
+        """纯虚函数：设置指令的启停状态。
+
+        Args:
+            invoke (str): 唤起方式。
+            value (bool): 为真则停用。
+        """
+        pass
+
+    @abstractmethod
+    def privilege(self) -> dict:
+        """纯虚函数：查询特权。
+
+        Returns:
+            dict: 返回 `{账号字符串: [唤起方式, ...]}`，与 `configs/privilege.json` 格式相同，没有特权的账号不列出。
+        """
+        pass
+
+    @abstractmethod
+    def grant(self, user: str, invoke: str) -> None:
+        """纯虚函数：授予特权。
+
+        Args:
+            user (str): 账号。
+            invoke (str): 唤起方式。
+        """
+        pass
+
+    @abstractmethod
+    def revoke(self, user: str, invoke: str) -> bool:
+        """纯虚函数：召回特权。
+
+        Args:
+            user (str): 账号。
+            invoke (str): 唤起方式。
+
+        Returns:
+            bool: 原本有该特权则返回真。
+        """
+        pass
+
+    @abstractmethod
+    def count(self, name: str, n: int = 1) -> None:
+        """纯虚函数：累加计数器，在事件循环中调用，不能访问磁盘。
+
+        Args:
+            name (str): 计数器名称。
+            n (int, optional): 增量，默认 1。
+        """
+        pass
+
+    @abstractmethod
+    def counters(self) -> dict:
+        """纯虚函数：查询所有计数器。
+
+        Returns:
+            dict: 返回计数器名称到值的字典。
+        """
+        pass
+
+    @abstractmethod
+    def changed(self) -> bool:
+        """纯虚函数：自上次调用以来，其它工作进程是否修改了启停状态或特权。
+
+        Returns:
+            bool: 修改了则返回真。
+        """
+        pass
+
+    def close(self) -> None:
+        """公有成员函数：释放资源。"""
+        pass
+
+
+class MemoryState(State):
+    """派生子类：只在当前进程内的状态，单进程部署时使用（默认）。
+
+    Args:
+        State (_type_): 继承 `"State"` 抽象父类。
+    """
+
+    def __init__(self, privilege: dict | None = None) -> None:
+        """构造函数：创建状态。
+
+        Args:
+            privilege (dict | None, optional): 初始特权，通常读取自 `configs/privilege.json`。
+        """
+        self.__locks: dict = dict()
+        self.__privilege: dict = {str(key): list(dict.fromkeys(value)) for key, value in (privilege or {}).items()}
+        self.__counters: dict = dict()
+        self.__lock = threading.Lock()
+
+    def locks(self) -> dict:
+        return dict(self.__locks)
+
+    def lock(self, invoke: str, value: bool) -> None:
+        self.__locks[invoke] = bool(value)
+
+    def privilege(self) -> dict:
+        with self.__lock:
+            return {key: list(value) for key, value in self.__privilege.items() if value}
+
+    def grant(self, user: str, invoke: str) -> None:
+        with self.__lock:
+            commands: list = self.__privilege.setdefault(str(user), list())
+            if invoke not in commands:
+                commands.append(invoke)
+
+    def revoke(self, user: str, invoke: str) -> bool:
+        with self.__lock:
+            commands: list = self.__privilege.get(str(user), [])
+            if invoke not in commands:
+                return False
+            commands.remove(invoke)
+            return True
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + n
+
+    def counters(self) -> dict:
+        with self.__lock:
+            return dict(self.__counters)
+
+    def changed(self) -> bool:
+        # 只有一个进程，启停状态和特权在本进程中直接生效。
+        return False
+
+
+class SqliteState(State):
+    """派生子类：保存在 SQLite（WAL 模式）中的状态，`uvicorn` 多工作进程部署时所有进程共享。
+
+    Args:
+        State (_type_): 继承 `"State"` 抽象父类。
+
+    .. Contents::
+        - 每个进程一个读连接和一个写连接，WAL 模式下读不等待写，提交不等待刷盘（`synchronous=NORMAL`）；
+          等待其它进程的写锁只占用写连接，事件循环中的读取不受影响。
+        - 启停状态或特权每次修改都递增 `meta.version`；`"SqliteState.changed()"` 只读，先读 `PRAGMA data_version`（不访问磁盘，只有其它连接提交过才会变化），
+          变化了再比较版本号，因此每次调度前调用的开销只有微秒级，其它进程的 `"/stop"`、`"/power"` 在下一次调度时即生效。
+        - `"SqliteState.count()"` 只累加到本进程的字典中，后台线程每 `flush` 秒合并写入一次，调度路径上没有写事务；计数器的写入不递增版本号，不会让其它进程反复刷新。
+        - 数据库第一次创建时导入 `configs/privilege.json` 中已有的特权；之后以数据库为准，`"/power"`、`"/recall"` 同时写回该文件备查。
+
+    .. Usage::
+    >>> state = SqliteState(os.path.join(os.getcwd(), 'cache', 'state.db'), privilege=read_json(...))
+    >>> state.lock('/丢', True)
+    >>> if state.changed():
+            locks = state.locks()
+    """
+
+    def __init__(self, path: str = os.path.join('cache', 'state.db'), privilege: dict | None = None, timeout: float = 5, flush: float = 5) -> None:
+        """构造函数：打开（第一次时创建）数据库，启动计数器的后台写入线程。
+
+        Args:
+            path (str, optional): 数据库文件路径，相对路径相对于工作目录，默认 `cache/state.db`。
+            privilege (dict | None, optional): 数据库第一次创建时导入的特权。
+            timeout (float, optional): 其它进程正在写入时的等待秒数，默认 5。
+            flush (float, optional): 计数器写入数据库的间隔秒数，默认 5。
+        """
+        self.path = path
+        self.flush_interval = flush
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.__writer = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.__write_lock = threading.Lock()
+        self.__data_version = None
+        self.__version = None
+        self.__pending: dict = dict()
+        self.__pending_lock = threading.Lock()
+        self.__event = threading.Event()
+        with self.__write_lock:
+            self.__writer.execute('PRAGMA journal_mode=WAL')
+            self.__writer.execute('PRAGMA synchronous=NORMAL')
+            self.__writer.executescript('''
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+                CREATE TABLE IF NOT EXISTS locks (invoke TEXT PRIMARY KEY, locked INTEGER NOT NULL);
+                CREATE TABLE IF NOT EXISTS privilege (user TEXT NOT NULL, invoke TEXT NOT NULL, PRIMARY KEY (user, invoke));
+                CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            ''')
+            # 多个工作进程同时启动时，只有第一个导入特权。
+            with self.__write(bump=False) as cursor:
+                if cursor.execute("INSERT OR IGNORE INTO meta VALUES ('seeded', 1)").rowcount:
+                    cursor.executemany(
+                        'INSERT OR IGNORE INTO privilege VALUES (?, ?)',
+                        [(str(user), invoke) for user, commands in (privilege or {}).items() for invoke in commands]
+                    )
+        # 表建好之后再打开读连接。
+        self.__connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.__lock = threading.Lock()
+        self.__thread = threading.Thread(target=self.__loop, name='iQQbot-state', daemon=True)
+        self.__thread.start()
+
+    def locks(self) -> dict:
+        with self.__lock:
+            return {invoke: bool(locked) for invoke, locked in self.__connection.execute('SELECT invoke, locked FROM locks')}
+
+    def lock(self, invoke: str, value: bool) -> None:
+        with self.__write_lock, self.__write() as cursor:
+            cursor.execute('INSERT OR REPLACE INTO locks VALUES (?, ?)', (invoke, int(bool(value))))
+
+    def privilege(self) -> dict:
+        ans = dict()
+        with self.__lock:
+            for user, invoke in self.__connection.execute('SELECT user, invoke FROM privilege ORDER BY rowid'):
+                ans.setdefault(user, list()).append(invoke)
+        return ans
+
+    def grant(self, user: str, invoke: str) -> None:
+        with self.__write_lock, self.__write() as cursor:
+            cursor.execute('INSERT OR IGNORE INTO privilege VALUES (?, ?)', (str(user), invoke))
+
+    def revoke(self, user: str, invoke: str) -> bool:
+        with self.__write_lock, self.__write() as cursor:
+            return cursor.execute('DELETE FROM privilege WHERE user = ? AND invoke = ?', (str(user), invoke)).rowcount > 0
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self.__pending_lock:
+            self.__pending[name] = self.__pending.get(name, 0) + n
+
+    def counters(self) -> dict:
+        with self.__lock:
+            ans = dict(self.__connection.execute('SELECT name, value FROM counters'))
+        # 加上本进程还没写入的部分。
+        with self.__pending_lock:
+            for name, n in self.__pending.items():
+                ans[name] = ans.get(name, 0) + n
+        return ans
+
+    def flush(self) -> None:
+        """公有成员函数：把本进程累加的计数器合并写入数据库，写入失败则留到下一次。"""
+        with self.__pending_lock:
+            pending, self.__pending = self.__pending, dict()
+        if not pending:
+            return
+        try:
+            with self.__write_lock, self.__write(bump=False) as cursor:
+                cursor.executemany(
+                    'INSERT INTO counters VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = value + excluded.value',
+                    list(pending.items())
+                )
+        except sqlite3.Error:
+            with self.__pending_lock:
+                for name, n in pending.items():
+                    self.__pending[name] = self.__pending.get(name, 0) + n
+            raise
+
+    def changed(self) -> bool:
+        with self.__lock:
+            data_version = self.__connection.execute('PRAGMA data_version').fetchone()[0]
+            if data_version == self.__data_version:
+                return False
+            self.__data_version = data_version
+            version = self.__connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            version = 0 if version is None else version[0]
+            if version == self.__version:
+                return False
+            self.__version = version
+            return True
+
+    def close(self) -> None:
+        self.__event.set()
+        self.__thread.join()
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+        with self.__write_lock:
+            self.__writer.close()
+        with self.__lock:
+            self.__connection.close()
+
+    def __loop(self) -> None:
+        """私有成员函数：后台线程，定期写入计数器。"""
+        while not self.__event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass
+
+    @contextlib.contextmanager
+    def __write(self, bump: bool = True) -> sqlite3.Cursor:
+        """私有成员函数：写事务，`BEGIN IMMEDIATE` 一开始就取得写锁，多个进程同时写入时按顺序等待；调用者须持有写连接锁。
+
+        Args:
+            bump (bool, optional): 是否递增版本号通知其它进程，默认是。
+
+        Returns:
+            sqlite3.Cursor: 返回游标。
+        """
+        cursor = self.__writer.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            yield cursor
+            if bump:
+                cursor.execute("INSERT INTO meta VALUES ('version', 1) ON CONFLICT (key) DO UPDATE SET value = value + 1")
+                version = cursor.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]
+            cursor.execute('COMMIT')
+        except BaseException:
+            cursor.execute('ROLLBACK')
+            raise
+        # 本进程的修改已经生效，记下新的版本号，不必再刷新自己。
+        if bump:
+            self.__version = version
+
+
+# 可选的状态存储方式。
+BACKENDS = {'memory': MemoryState, 'sqlite': SqliteState}
+_states: dict = dict()
+_lock = threading.Lock()
+
+
+def shared_state() -> State:
+    """普通函数：获取当前进程的共享状态，存储方式读取 `configs/init.json` 的 `shared_state` 配置。
+
+    `{"backend": "memory"}`（默认）只在当前进程内有效；多工作进程部署时使用 `{"backend": "sqlite", "path": "cache/state.db", "flush": 5}`，
+    其余参数原样传给 `"BACKENDS"` 中对应的派生子类。
+
+    Returns:
+        State: 返回共享状态。
+    """
+    pid = os.getpid()
+    if pid not in _states:
+        with _lock:
+            if pid not in _states:
+                option: dict = dict(read_json(os.path.join(os.getcwd(), 'configs', 'init.json')).get('shared_state', {}))
+                backend = BACKENDS[option.pop('backend', 'memory')]
+                path = os.path.join(os.getcwd(), 'configs', 'privilege.json')
+                _states[pid] = backend(privilege=read_json(path) if os.path.exists(path) else {}, **option)
+    return _states[pid]
\ No newline at end of file
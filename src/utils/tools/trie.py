@@ -0,0 +1,102 @@
+'''
+# System --> Windows & Python3.10.0
+# File ----> trie.py
+# Author --> Illusionna
+# Create --> 2024/12/09 21:03:17
+'''
+# -*- Encoding: UTF-8 -*-
+
+
+class Trie:
+    """普通类：前缀树，一次遍历消息即可找到最长匹配的前缀。
+
+    .. Usage::
+    >>> trie = Trie()
+    >>> trie.insert('/打', '打')
+    >>> trie.insert('/打拳', '打拳')
+    >>> trie.match('/打拳123')
+    ('打拳', '/打拳', '123')
+    """
+    __slots__ = ('root', 'size')
+
+    def __init__(self) -> None:
+        self.root: dict = dict()
+        self.size = 0
+
+    def insert(self, key: str, value: object) -> None:
+        """公有成员函数：插入前缀，重复插入会覆盖旧值。
+
+        Args:
+            key (str): 前缀。
+            value (object): 前缀对应的值。
+        """
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, dict())
+        if None not in node:
+            self.size = self.size + 1
+        # 以 None 为键保存终结节点的值，不会与任何字符冲突。
+        node[None] = (key, value)
+
+    def remove(self, key: str) -> bool:
+        """公有成员函数：删除前缀，顺带删去不再通向任何前缀的节点。
+
+        Args:
+            key (str): 前缀。
+
+        Returns:
+            bool: 前缀存在则返回真。
+        """
+        node = self.root
+        path = list()
+        for char in key:
+            path.append((node, char))
+            node = node.get(char)
+            if node is None:
+                return False
+        if node.pop(None, None) is None:
+            return False
+        self.size = self.size - 1
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+        return True
+
+    def match(self, text: str, accept: 'function | None' = None) -> tuple | None:
+        """公有成员函数：最长前缀匹配。
+
+        Args:
+            text (str): 待匹配的文本。
+            accept (function | None, optional): 形如 `accept(key, rest) -> bool` 的过滤函数，返回假则退回更短的前缀。
+
+        Returns:
+            tuple | None: 返回 `(value, key, rest)` 三元组，`rest` 是前缀之后剩余的文本；无匹配则返回空。
+        """
+        node = self.root
+        found = list()
+        for index, char in enumerate(text):
+            node = node.get(char)
+            if node is None:
+                break
+            # 一次取值，其它线程同时删除前缀时不会读到一半。
+            entry = node.get(None)
+            if entry is not None:
+                found.append((index + 1, entry))
+        # 从最长的前缀开始尝试。
+        for end, (key, value) in reversed(found):
+            rest = text[end:]
+            if (accept is None) or accept(key, rest):
+                return value, key, rest
+        return None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: str) -> bool:
+        node = self.root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return False
+        return None in node
\ No newline at end of file